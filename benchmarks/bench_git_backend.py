@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Cold-start cost of resolving the revision with each git backend.
+
+Each sample runs in a fresh interpreter: configure settings, import
+django_revision and read `Revision().revision`.
+
+    python benchmarks/bench_git_backend.py [GIT_DIR] [--runs 10]
+"""
+import argparse
+import statistics
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+from django.conf import settings
+settings.configure(
+    BASE_DIR={git_dir!r},
+    GIT_DIR={git_dir!r},
+    DJANGO_REVISION_GIT_BACKEND={backend!r},
+)
+from django_revision import Revision
+revision = Revision().revision
+print(time.perf_counter() - start)
+print(revision)
+"""
+
+
+def cold_start(git_dir: str, backend: str) -> tuple[float, str]:
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", SNIPPET.format(git_dir=git_dir, backend=backend)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    return float(output[0]), output[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("git_dir", nargs="?", default=str(Path(__file__).parent.parent))
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    revisions = {}
+    for backend in ["gitpython", "native"]:
+        timings = []
+        for _ in range(args.runs):
+            seconds, revisions[backend] = cold_start(args.git_dir, backend)
+            timings.append(seconds)
+        print(
+            f"{backend:>10}: median {statistics.median(timings) * 1000:.1f}ms "
+            f"min {min(timings) * 1000:.1f}ms  {revisions[backend]}"
+        )
+    if len(set(revisions.values())) != 1:
+        sys.exit("Backends returned different revisions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Startup cost added by django_revision.
+
+Each sample runs in a fresh interpreter and times `import django_revision`
+and `django.setup()` with and without the app installed. Also reports
+whether GitPython was imported during startup.
+
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+import argparse
+import statistics
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+SNIPPET = """
+import sys
+import time
+from django.conf import settings
+settings.configure(
+    BASE_DIR={base_dir!r},
+    INSTALLED_APPS={installed_apps!r},
+)
+start = time.perf_counter()
+import django_revision
+imported = time.perf_counter()
+import django
+django.setup()
+done = time.perf_counter()
+print(imported - start, done - imported, "git" in sys.modules)
+"""
+
+
+def startup(installed_apps: list[str]) -> tuple[float, float, bool]:
+    code = SNIPPET.format(
+        base_dir=str(Path(__file__).parent.parent), installed_apps=installed_apps
+    )
+    output = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), float(output[1]), output[2] == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    base_apps = ["django.contrib.contenttypes", "django.contrib.auth"]
+    for label, installed_apps in [
+        ("without app", base_apps),
+        ("with app", base_apps + ["django_revision.apps.AppConfig"]),
+    ]:
+        samples = [startup(installed_apps) for _ in range(args.runs)]
+        imports = [sample[0] for sample in samples]
+        setups = [sample[1] for sample in samples]
+        print(
+            f"{label:>12}: import django_revision "
+            f"{statistics.median(imports) * 1000:.1f}ms, "
+            f"django.setup() {statistics.median(setups) * 1000:.1f}ms, "
+            f"GitPython imported: {any(sample[2] for sample in samples)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
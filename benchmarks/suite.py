@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+"""Benchmark suite for django_revision.
+
+Measures:
+  * cold `import django_revision` and `django.setup()` time
+  * first-access latency of `Revision.revision` for each source
+  * `git describe` on synthetic repos with many tags and deep history
+  * `RevisionField.pre_save` overhead against a plain CharField
+  * `bulk_create` throughput with and without the field (SQLite)
+
+Results are written as JSON so releases can be compared:
+
+    python benchmarks/suite.py --output bench_results.json
+    python benchmarks/suite.py --quick
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bench_startup import startup
+
+ROOT = Path(__file__).parent.parent
+
+FIRST_ACCESS_SNIPPET = """
+import json
+import os
+import time
+from django.conf import settings
+settings.configure(**json.loads(os.environ["BENCH_SETTINGS"]))
+from django_revision import Revision
+start = time.perf_counter()
+revision = Revision()
+value = revision.revision
+print(time.perf_counter() - start, revision.source)
+"""
+
+
+def run_snippet(snippet: str, settings: dict) -> list[str]:
+    env = {k: v for k, v in os.environ.items() if k != "DJANGO_REVISION_SHARED"}
+    return subprocess.run(  # nosec B603
+        [sys.executable, "-c", snippet],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**env, "BENCH_SETTINGS": json.dumps(settings)},
+    ).stdout.split()
+
+
+def create_synthetic_repo(path: Path, commits: int, tag_every: int) -> Path:
+    """Creates a linear repo with `commits` commits and a lightweight
+    tag every `tag_every` commits, using `git fast-import`.
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)  # nosec
+    stream = []
+    for i in range(1, commits + 1):
+        message = f"commit {i}"
+        content = f"{i}\n"
+        stream.append(
+            f"commit refs/heads/main\nmark :{i}\n"
+            f"committer Bench <bench@example.com> {1600000000 + i * 60} +0000\n"
+            f"data {len(message)}\n{message}\n"
+            + (f"from :{i - 1}\n" if i > 1 else "")
+            + f"M 644 inline file.txt\ndata {len(content)}\n{content}\n"
+        )
+        if i % tag_every == 0 and i < commits:
+            stream.append(f"reset refs/tags/v{i}\nfrom :{i}\n\n")
+    subprocess.run(  # nosec B603 B607
+        ["git", "fast-import", "--quiet"],
+        cwd=path,
+        input="".join(stream),
+        text=True,
+        check=True,
+    )
+    return path
+
+
+def bench_startup(runs: int) -> dict:
+    base_apps = ["django.contrib.contenttypes", "django.contrib.auth"]
+    samples = [
+        startup(base_apps + ["django_revision.apps.AppConfig"]) for _ in range(runs)
+    ]
+    return {
+        "import_ms": statistics.median(s[0] for s in samples) * 1000,
+        "django_setup_ms": statistics.median(s[1] for s in samples) * 1000,
+        "gitpython_imported": any(s[2] for s in samples),
+    }
+
+
+def bench_first_access(runs: int, git_dir: Path) -> dict:
+    tmp = Path(tempfile.mkdtemp())
+    (tmp / "pyproject.toml").write_text('[project]\nversion = "1.0.0"\n')
+    (tmp / "VERSION").write_text("1.0.0")
+    frozen = tmp / "revision.json"
+    frozen.write_text(json.dumps({"revision": "1.0.0", "source": "git"}))
+    ignore_all = dict(
+        DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+        DJANGO_REVISION_IGNORE_METADATA=True,
+        DJANGO_REVISION_IGNORE_TOML_FILE=True,
+        DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    )
+    base = dict(BASE_DIR=str(tmp), GIT_DIR=str(git_dir))
+    sources = {
+        "git_gitpython": dict(DJANGO_REVISION_GIT_BACKEND="gitpython"),
+        "git_native": dict(DJANGO_REVISION_GIT_BACKEND="native"),
+        "metadata": dict(DJANGO_REVISION_IGNORE_WORKING_DIR=True, APP_NAME="django"),
+        "toml": {**ignore_all, "DJANGO_REVISION_IGNORE_TOML_FILE": False},
+        "version_file": {**ignore_all, "DJANGO_REVISION_IGNORE_VERSION_FILE": False},
+        "settings": {**ignore_all, "REVISION": "1.0.0"},
+        "frozen_file": {"DJANGO_REVISION_FROZEN_FILE": str(frozen)},
+    }
+    results = {}
+    for name, settings in sources.items():
+        settings = {"DJANGO_REVISION_IGNORE_FROZEN_FILE": True, **base, **settings}
+        if name == "frozen_file":
+            settings["DJANGO_REVISION_IGNORE_FROZEN_FILE"] = False
+        timings = [
+            float(run_snippet(FIRST_ACCESS_SNIPPET, settings)[0]) for _ in range(runs)
+        ]
+        results[name] = {"median_ms": statistics.median(timings) * 1000}
+    return results
+
+
+def bench_describe(runs: int, sizes: list[tuple[int, int]]) -> dict:
+    import git
+
+    from django_revision.git_reader import GitReader
+
+    results = {}
+    for commits, tag_every in sizes:
+        path = create_synthetic_repo(Path(tempfile.mkdtemp()), commits, tag_every)
+        native, gitpython = [], []
+        for _ in range(runs):
+            start = time.perf_counter()
+            with GitReader(path) as reader:
+                described = reader.describe()
+            native.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            repo = git.Repo(path)
+            expected = repo.git.describe(tags=True)
+            repo.close()
+            gitpython.append(time.perf_counter() - start)
+        if described != expected:
+            raise RuntimeError(f"describe differs: {described} != {expected}")
+        results[f"{commits}_commits_{commits // tag_every}_tags"] = {
+            "describe": described,
+            "native_ms": statistics.median(native) * 1000,
+            "gitpython_ms": statistics.median(gitpython) * 1000,
+        }
+    return results
+
+
+def setup_django():
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        BASE_DIR=tempfile.mkdtemp(),
+        INSTALLED_APPS=["django.contrib.contenttypes", "django_revision"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        DEFAULT_AUTO_FIELD="django.db.models.BigAutoField",
+        REVISION="1.0.0-10-gabcdef0:main:" + "a" * 40,
+        DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+        DJANGO_REVISION_IGNORE_METADATA=True,
+        DJANGO_REVISION_IGNORE_TOML_FILE=True,
+        DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+        DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+    )
+    django.setup()
+    from django.db import connection, models
+
+    from django_revision import RevisionField
+
+    class PlainModel(models.Model):
+        revision = models.CharField(max_length=75, null=True)
+
+        class Meta:
+            app_label = "django_revision"
+
+    class StampedModel(models.Model):
+        revision = RevisionField()
+
+        class Meta:
+            app_label = "django_revision"
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(PlainModel)
+        schema_editor.create_model(StampedModel)
+    return PlainModel, StampedModel
+
+
+def bench_models(number: int, rows: int) -> dict:
+    import warnings
+
+    warnings.simplefilter("ignore")
+    plain_model, stamped_model = setup_django()
+    plain_field = plain_model._meta.get_field("revision")
+    stamped_field = stamped_model._meta.get_field("revision")
+    plain_obj, stamped_obj = plain_model(), stamped_model()
+    stamped_field.pre_save(stamped_obj, True)
+    plain_s = timeit.timeit(
+        lambda: plain_field.pre_save(plain_obj, True), number=number
+    )
+    stamped_s = timeit.timeit(
+        lambda: stamped_field.pre_save(stamped_obj, True), number=number
+    )
+    results = {
+        "pre_save": {
+            "charfield_ns": plain_s / number * 1e9,
+            "revisionfield_ns": stamped_s / number * 1e9,
+            "overhead_ns": (stamped_s - plain_s) / number * 1e9,
+        },
+        "bulk_create": {},
+    }
+    for model in [plain_model, stamped_model]:
+        start = time.perf_counter()
+        model.objects.bulk_create([model() for _ in range(rows)], batch_size=1000)
+        seconds = time.perf_counter() - start
+        results["bulk_create"][model.__name__] = {
+            "rows": rows,
+            "rows_per_second": rows / seconds,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default=None, help="Write results to this file")
+    parser.add_argument("--quick", action="store_true", help="Fewer runs and sizes")
+    args = parser.parse_args()
+    runs = 3 if args.quick else 10
+    sizes = [(500, 50)] if args.quick else [(1000, 100), (10000, 10), (50000, 1000)]
+    git_dir = create_synthetic_repo(Path(tempfile.mkdtemp()), 1000, 100)
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "django_revision": subprocess.run(  # nosec B603
+                [
+                    sys.executable,
+                    "-c",
+                    "import django_revision as d; print(d.__version__)",
+                ],
+                capture_output=True,
+                text=True,
+            ).stdout.strip(),
+        },
+        "startup": bench_startup(runs),
+        "first_access": bench_first_access(runs, git_dir),
+        "describe": bench_describe(runs, sizes),
+        **bench_models(
+            number=10000 if args.quick else 100000, rows=5000 if args.quick else 50000
+        ),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ROOT / "src"))
+    main()
@@ -1,9 +1,14 @@
-from importlib.metadata import PackageNotFoundError, version
-
-try:
-    __version__ = version("django-revision")
-except PackageNotFoundError:
-    __version__ = "develop"
-
 from .revision import Revision, site_revision
 from .revision_field import RevisionField
+
+
+def __getattr__(name):
+    # package metadata is only read if __version__ is asked for
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("django-revision")
+        except PackageNotFoundError:
+            return "develop"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,18 @@
 from django.apps import AppConfig as DjangoAppConfig
+from django.db.models.signals import post_migrate
 
 
 class AppConfig(DjangoAppConfig):
     name = "django_revision"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from . import lookups  # noqa: F401
+        from .db_default import set_db_defaults_on_migrate
+        from .stats import revision_stats
+        from .utils import stats_enabled
+        from .watermarks import configure_watermarks
+
+        revision_stats.enabled = stats_enabled()
+        configure_watermarks()
+        post_migrate.connect(set_db_defaults_on_migrate, sender=self)
@@ -0,0 +1,65 @@
+"""Rewrites revision values in batches, see `manage.py revision_backfill`."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+
+from django.db import transaction
+from django.db.models import Field, Model, Q
+
+from .revision_field import RevisionOrdinalField
+from .utils import get_revision_ordinal
+
+__all__ = ["backfill_field"]
+
+
+def backfill_field(
+    model: type[Model],
+    field: Field,
+    using: str,
+    mapping: dict[str, str],
+    null_value: str | None = None,
+    batch_size: int = 1000,
+    start_after=None,
+    dry_run: bool = False,
+) -> Iterator[tuple[object, int]]:
+    """Yields (last pk, rows updated) for each batch.
+
+    Selects rows with a NULL revision, if `null_value` is set, or with
+    a revision in `mapping`, `batch_size` at a time in primary key
+    order starting after `start_after`. Each batch is updated in its
+    own transaction with one UPDATE per new value. The model's
+    RevisionOrdinalField for the field, if any, is updated too.
+    """
+    condition = Q(**{f"{field.attname}__in": list(mapping)})
+    if null_value is not None:
+        condition |= Q(**{f"{field.attname}__isnull": True})
+    ordinal_fields = [
+        f
+        for f in model._meta.concrete_fields
+        if isinstance(f, RevisionOrdinalField) and f.revision_field == field.name
+    ]
+    # not the default manager, it would stamp the current revision
+    queryset = model._base_manager.using(using)
+    last_pk = start_after
+    while True:
+        batch = queryset.filter(condition).order_by("pk")
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        rows = list(batch.values_list("pk", field.attname)[:batch_size])
+        if not rows:
+            return
+        pks_by_value = defaultdict(list)
+        for pk, value in rows:
+            pks_by_value[null_value if value is None else mapping[value]].append(pk)
+        if not dry_run:
+            with transaction.atomic(using=using):
+                for value, pks in pks_by_value.items():
+                    values = {field.attname: value}
+                    values.update(
+                        {f.attname: get_revision_ordinal(value) for f in ordinal_fields}
+                    )
+                    queryset.filter(pk__in=pks).update(**values)
+        last_pk = rows[-1][0]
+        yield last_pk, len(rows)
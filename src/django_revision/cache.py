@@ -0,0 +1,51 @@
+"""Namespace cache keys by the revision so that each deploy starts with
+a fresh keyspace instead of flushing the cache. Entries written by the
+previous revision are no longer read and age out by their timeout.
+
+In settings:
+
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://127.0.0.1:6379",
+            "KEY_FUNCTION": "django_revision.cache.make_key",
+        }
+    }
+
+Do not set KEY_FUNCTION on a cache used for sessions unless users
+should be logged out on each deploy.
+"""
+
+from __future__ import annotations
+
+from django.core.cache.utils import make_template_fragment_key
+
+from .revision import site_revision
+
+__all__ = ["make_key", "revision_fragment_key"]
+
+
+def make_key(key: str, key_prefix: str, version: int) -> str:
+    """Cache KEY_FUNCTION, like Django's default but with the short
+    hash of the revision, see `Revision.revision_hash`.
+    """
+    return f"{key_prefix}:{version}:{site_revision.revision_hash}:{key}"
+
+
+def revision_fragment_key(fragment_name: str, vary_on: list | None = None) -> str:
+    """Returns the key of a template fragment cached with the revision
+    hash as the last `vary_on` argument, for example:
+
+        {% load cache revision_tags %}
+        {% revision_hash as rev %}
+        {% cache 500 sidebar request.user.username rev %}
+        ...
+        {% endcache %}
+
+    is deleted with:
+
+        cache.delete(revision_fragment_key("sidebar", [username]))
+    """
+    return make_template_fragment_key(
+        fragment_name, [*(vary_on or []), site_revision.revision_hash]
+    )
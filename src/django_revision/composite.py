@@ -0,0 +1,121 @@
+"""Revisions of several named components, for example, git submodules
+and separately versioned packages, resolved concurrently.
+
+In settings, each component is a dictionary of `Revision` arguments:
+
+    DJANGO_REVISION_COMPONENTS = {
+        "core": {"git_dir": BASE_DIR / "core"},
+        "plugin": {"app_name": "my-plugin"},
+        "legacy": {"toml_path": BASE_DIR / "legacy"},
+    }
+
+`git_dir` reads git, `app_name` the installed distribution's metadata
+and `toml_path` the pyproject.toml. Set `sources` to choose explicitly.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+
+from .constants import GIT, METADATA, TOML_FILE
+from .revision import Revision
+from .utils import get_components
+
+__all__ = ["CompositeRevision", "site_components"]
+
+# Revision argument -> the source it implies
+SOURCE_ARGS = {"git_dir": GIT, "app_name": METADATA, "toml_path": TOML_FILE}
+
+
+def make_component(spec: dict) -> Revision:
+    spec = dict(spec)
+    if "sources" not in spec:
+        spec["sources"] = [
+            source for arg, source in SOURCE_ARGS.items() if arg in spec
+        ] or None
+    return Revision(**spec)
+
+
+class CompositeRevision:
+    """Named component revisions, each cached by its `Revision`.
+
+    `resolve` discovers the components not yet resolved in a thread
+    pool, so the wait is that of the slowest component, not the sum.
+    """
+
+    def __init__(
+        self, components: dict[str, dict] | None = None, max_workers: int = None
+    ):
+        self._components = components
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._stamped = None
+
+    @cached_property
+    def components(self) -> dict[str, Revision]:
+        specs = self._components if self._components is not None else get_components()
+        return {name: make_component(spec) for name, spec in specs.items()}
+
+    def reconfigure(self) -> None:
+        """Reads settings again on next use and resets."""
+        with self._lock:
+            for component in self.__dict__.pop("components", {}).values():
+                component.reset()
+            self._stamped = None
+
+    def resolve(self) -> dict[str, str]:
+        """Returns {name: revision}, discovering concurrently."""
+        with self._lock:
+            components = self.components
+            if pending := [c for c in components.values() if not c._revision]:
+                with ThreadPoolExecutor(
+                    max_workers=self.max_workers or len(pending),
+                    thread_name_prefix="django_revision",
+                ) as executor:
+                    for future in [executor.submit(c.resolve) for c in pending]:
+                        future.result()
+        return {name: component.revision for name, component in components.items()}
+
+    def __getitem__(self, name: str) -> Revision:
+        return self.components[name]
+
+    @property
+    def stamp(self) -> str:
+        """Returns the combined stamp, e.g. `core=1.2.0-3-g1a2b3c4;plugin=0.4.1`.
+
+        Uses the git describe output of a git component, not the
+        full `tag:branch:commit`.
+        """
+        if (stamped := self._stamped) is None:
+            self.resolve()
+        revisions = tuple(c.revision for c in self.components.values())
+        if stamped is None or stamped[0] != revisions:
+            stamp = ";".join(
+                f"{name}={component.tag if component.source == GIT else revision}"
+                for (name, component), revision in zip(
+                    self.components.items(), revisions
+                )
+            )
+            # (revisions, stamp), replaced as one
+            stamped = self._stamped = (revisions, stamp)
+        return stamped[1]
+
+    def as_dict(self) -> dict[str, dict]:
+        """Returns {name: `Revision.as_dict()`} for each component."""
+        self.resolve()
+        return {name: c.as_dict() for name, c in self.components.items()}
+
+
+# reads settings on first use
+site_components = CompositeRevision()
+
+
+@receiver(setting_changed)
+def reset_site_components(*, setting: str, **kwargs) -> None:
+    if setting in ["BASE_DIR", "GIT_DIR"] or setting.startswith("DJANGO_REVISION_"):
+        site_components.reconfigure()
@@ -1 +1,29 @@
 NO_TAG = "NOTAG"
+GITPYTHON = "gitpython"
+NATIVE = "native"
+
+GIT = "git"
+METADATA = "metadata"
+TOML_FILE = "toml"
+VERSION_FILE = "version_file"
+SETTINGS = "settings"
+SHARED = "shared"
+FROZEN_FILE = "frozen_file"
+ENVIRON = "environ"
+TEST = "test"
+
+# RevisionField(component=COMPOSITE) stores the combined stamp
+COMPOSITE = "__all__"
+
+# settings.DJANGO_REVISION_DESCRIBE_FALLBACK, if git describe times out
+COMMIT_ONLY = "commit"
+NEXT_SOURCE = "next_source"
+
+SHARED_ENV_VAR = "DJANGO_REVISION_SHARED"
+
+# counters, see stats.py
+PRE_SAVE = "pre_save"
+BULK = "bulk"
+DISCOVERIES = "discoveries"
+REFRESH_CHECKS = "refresh_checks"
+REFRESHES = "refreshes"
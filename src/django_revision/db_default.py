@@ -0,0 +1,107 @@
+"""Sets the database column default of revision fields to the current
+revision, see `manage.py revision_db_default`.
+
+Rows inserted without the ORM, for example with COPY, INSERT ... SELECT
+or a bulk loader, are then stamped by the database.
+"""
+
+from __future__ import annotations
+
+from django.apps import apps as django_apps
+from django.db import connections
+from django.db.migrations.operations import AlterField
+from django.db.migrations.state import ProjectState
+from django.db.models import NOT_PROVIDED, Field, Model, Value
+
+from .revision_field import RevisionField, RevisionForeignKey, RevisionOrdinalField
+from .utils import allow_migrate, db_default_enabled
+
+__all__ = ["get_db_default_fields", "set_db_defaults"]
+
+
+def get_db_default_fields(
+    labels: list[str] | None = None,
+) -> list[tuple[type[Model], Field]]:
+    """Returns (model, field) for each RevisionField, RevisionForeignKey
+    and RevisionOrdinalField of concrete models.
+
+    `labels` limits to these "app_label" or "app_label.model_name".
+    """
+    labels = [label.lower() for label in labels or []]
+    fields = []
+    for model in django_apps.get_models():
+        if model._meta.proxy or (
+            labels
+            and model._meta.app_label not in labels
+            and model._meta.label_lower not in labels
+        ):
+            continue
+        fields.extend(
+            (model, field)
+            for field in model._meta.concrete_fields
+            if isinstance(
+                field, (RevisionField, RevisionForeignKey, RevisionOrdinalField)
+            )
+        )
+    return fields
+
+
+def set_db_defaults(
+    labels: list[str] | None = None, using: str = "default", clear: bool = False
+) -> list[tuple[type[Model], Field, str | int | None]]:
+    """Sets the column default of each revision field in `using` to
+    the value the field stores for the current revision, or drops the
+    default if `clear`.
+
+    Returns (model, field, default) for each column altered. Skips
+    models not migrated to `using` or whose table does not exist yet.
+
+    Each column is altered with the AlterField migration operation
+    from a state where the columns altered before have their default,
+    since on SQLite the table is rebuilt from the model state.
+    """
+    connection = connections[using]
+    tables = set(connection.introspection.table_names())
+    fields = [
+        (model, field)
+        for model, field in get_db_default_fields(labels)
+        if allow_migrate(model, using) and model._meta.db_table in tables
+    ]
+    from_state = ProjectState.from_apps(django_apps)
+    if clear:
+        # assume a default so that it is dropped
+        for model, field in fields:
+            alter_field(model, field, Value("")).state_forwards(
+                model._meta.app_label, from_state
+            )
+    altered = []
+    with connection.schema_editor() as schema_editor:
+        for model, field in fields:
+            value = None if clear else field.get_revision_value(using)
+            operation = alter_field(
+                model, field, NOT_PROVIDED if value is None else Value(value)
+            )
+            to_state = from_state.clone()
+            operation.state_forwards(model._meta.app_label, to_state)
+            operation.database_forwards(
+                model._meta.app_label, schema_editor, from_state, to_state
+            )
+            from_state = to_state
+            altered.append((model, field, value))
+    return altered
+
+
+def alter_field(model: type[Model], field: Field, db_default) -> AlterField:
+    new_field = field.clone()
+    new_field.db_default = db_default
+    return AlterField(model._meta.model_name, field.name, new_field)
+
+
+def set_db_defaults_on_migrate(sender, using: str = "default", **kwargs) -> None:
+    """Receiver of `post_migrate`, connected in AppConfig.ready.
+
+    Sets the column defaults after `migrate` if
+    settings.DJANGO_REVISION_DB_DEFAULT is True.
+    """
+    if db_default_enabled():
+        set_db_defaults(using=using)
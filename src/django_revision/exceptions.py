@@ -10,6 +10,10 @@ class RevisionGitError(Exception):
     pass
 
 
+class RevisionDescribeTimeout(RevisionGitError):
+    pass
+
+
 class RevisionGitDirDoesNotExist(Exception):
     pass
 
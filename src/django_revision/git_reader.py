@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import time
+import zlib
+from bisect import bisect_left
+from pathlib import Path
+
+from .exceptions import RevisionDescribeTimeout, RevisionGitError
+
+__all__ = ["GitReader"]
+
+OBJ_COMMIT = 1
+OBJ_TREE = 2
+OBJ_BLOB = 3
+OBJ_TAG = 4
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+OBJ_TYPES = {
+    b"commit": OBJ_COMMIT,
+    b"tree": OBJ_TREE,
+    b"blob": OBJ_BLOB,
+    b"tag": OBJ_TAG,
+}
+
+MAX_CANDIDATES = 10
+FALLBACK_DEFAULT_ABBREV = 7
+
+
+def apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Returns the object built by applying a pack delta to `base`."""
+
+    def read_size(pos: int) -> tuple[int, int]:
+        size = shift = 0
+        while True:
+            c = delta[pos]
+            pos += 1
+            size |= (c & 0x7F) << shift
+            shift += 7
+            if not c & 0x80:
+                return size, pos
+
+    _, pos = read_size(0)
+    _, pos = read_size(pos)
+    out = bytearray()
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for i in range(4):
+                if op & (1 << i):
+                    offset |= delta[pos] << (8 * i)
+                    pos += 1
+            for i in range(3):
+                if op & (0x10 << i):
+                    size |= delta[pos] << (8 * i)
+                    pos += 1
+            out += base[offset : offset + (size or 0x10000)]
+        elif op:
+            out += delta[pos : pos + op]
+            pos += op
+        else:
+            raise RevisionGitError("Invalid delta in pack file.")
+    return bytes(out)
+
+
+class _PackNames:
+    """Sorted object names of a pack index, sliced on demand."""
+
+    def __init__(self, data: bytes, start: int, count: int):
+        self.data = data
+        self.start = start
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        pos = self.start + i * 20
+        return self.data[pos : pos + 20]
+
+
+class PackIndex:
+    """A version 2 pack index (`*.idx`) and its pack file."""
+
+    def __init__(self, idx_path: Path):
+        self.pack_path = idx_path.with_suffix(".pack")
+        with idx_path.open("rb") as f:
+            data = f.read()
+        if data[:4] != b"\377tOc" or struct.unpack(">I", data[4:8])[0] != 2:
+            raise RevisionGitError(f"Unsupported pack index. Got {idx_path}.")
+        self.data = data
+        self.fanout = struct.unpack(">256I", data[8:1032])
+        self.count = self.fanout[-1]
+        self.names = _PackNames(data, 1032, self.count)
+        self.offsets_start = 1032 + self.count * 24
+        self.large_offsets_start = self.offsets_start + self.count * 4
+        self._map = None
+
+    def close(self) -> None:
+        if self._map:
+            self._map.close()
+            self._map = None
+
+    def _bounds(self, sha: bytes) -> tuple[int, int]:
+        return (self.fanout[sha[0] - 1] if sha[0] else 0), self.fanout[sha[0]]
+
+    def find(self, sha: bytes) -> int | None:
+        """Returns the pack offset of `sha` or None."""
+        lo, hi = self._bounds(sha)
+        i = bisect_left(self.names, sha, lo, hi)
+        if i < hi and self.names[i] == sha:
+            pos = self.offsets_start + i * 4
+            offset = struct.unpack(">I", self.data[pos : pos + 4])[0]
+            if offset & 0x80000000:
+                pos = self.large_offsets_start + (offset & 0x7FFFFFFF) * 8
+                offset = struct.unpack(">Q", self.data[pos : pos + 8])[0]
+            return offset
+        return None
+
+    def neighbours(self, sha: bytes) -> list[bytes]:
+        """Returns the names sorted immediately around `sha`."""
+        i = bisect_left(self.names, sha)
+        return [
+            self.names[j]
+            for j in (i - 1, i, i + 1)
+            if 0 <= j < self.count and self.names[j] != sha
+        ]
+
+    def read(self, offset: int, reader: GitReader) -> tuple[int, bytes]:
+        if not self._map:
+            with self.pack_path.open("rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._map[offset : offset + 32]
+        c = header[0]
+        obj_type = (c >> 4) & 7
+        pos = 1
+        while c & 0x80:
+            c = header[pos]
+            pos += 1
+        if obj_type == OBJ_OFS_DELTA:
+            c = header[pos]
+            pos += 1
+            base_offset = c & 0x7F
+            while c & 0x80:
+                c = header[pos]
+                pos += 1
+                base_offset = ((base_offset + 1) << 7) | (c & 0x7F)
+            delta = self._inflate(offset + pos)
+            base_type, base = self.read(offset - base_offset, reader)
+            return base_type, apply_delta(base, delta)
+        if obj_type == OBJ_REF_DELTA:
+            base_sha = header[pos : pos + 20].hex()
+            delta = self._inflate(offset + pos + 20)
+            base_type, base = reader.read_object(base_sha)
+            return base_type, apply_delta(base, delta)
+        return obj_type, self._inflate(offset + pos)
+
+    def _inflate(self, pos: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks = []
+        size = 1024
+        while not decompressor.eof:
+            chunk = self._map[pos : pos + size]
+            if not chunk:
+                raise RevisionGitError(f"Truncated pack file. Got {self.pack_path}.")
+            chunks.append(decompressor.decompress(chunk))
+            pos += size
+            size = 65536
+        return b"".join(chunks)
+
+
+class GitReader:
+    """Reads HEAD, refs, tags and commits straight from a `.git` directory.
+
+    No subprocess and no GitPython. Supports loose and packed refs,
+    loose and packed objects, worktrees and `gitdir:` files.
+
+    `describe` follows the candidate search of `git describe --tags`.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.git_dir = self._find_git_dir(self.path)
+        if (commondir := self.git_dir / "commondir").is_file():
+            self.common_dir = (self.git_dir / commondir.read_text().strip()).resolve()
+        else:
+            self.common_dir = self.git_dir
+        self._packed_refs = None
+        self._packs = None
+        self._object_dirs = None
+        self._commits: dict[str, tuple[list[str], int]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def _find_git_dir(path: Path) -> Path:
+        dot_git = path / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                return (path / content[7:].strip()).resolve()
+        if (path / "HEAD").is_file() and (
+            (path / "objects").is_dir() or (path / "commondir").is_file()
+        ):
+            return path
+        raise RevisionGitError(
+            "Unable to determine the revision number. settings.GIT_DIR is "
+            "not a git repository. Check the folder or set "
+            "`settings.DJANGO_REVISION_IGNORE_WORKING_DIR=True. "
+            f"Got `settings.GIT_DIR={path}`"
+        )
+
+    def close(self) -> None:
+        for pack in self._packs or []:
+            pack.close()
+        self._packs = None
+
+    # refs
+
+    @property
+    def packed_refs(self) -> tuple[dict[str, str], dict[str, str], bool]:
+        """Returns (refs, peeled refs, fully peeled) from `packed-refs`."""
+        if self._packed_refs is None:
+            refs, peeled, fully_peeled = {}, {}, False
+            path = self.common_dir / "packed-refs"
+            if path.is_file():
+                name = None
+                for line in path.read_text().splitlines():
+                    if line.startswith("#"):
+                        fully_peeled = "fully-peeled" in line
+                    elif line.startswith("^"):
+                        peeled[name] = line[1:].strip()
+                    elif line.strip():
+                        sha, name = line.split(" ", 1)
+                        refs[name] = sha
+            self._packed_refs = refs, peeled, fully_peeled
+        return self._packed_refs
+
+    def read_symbolic_ref(self, name: str = "HEAD") -> str | None:
+        """Returns the ref `name` points to or None if not symbolic."""
+        for base in (self.git_dir, self.common_dir):
+            if (path := base / name).is_file():
+                value = path.read_text().strip()
+                return value[5:] if value.startswith("ref: ") else None
+        return None
+
+    def read_ref(self, name: str) -> str | None:
+        """Returns the sha of ref `name`, following symbolic refs."""
+        for base in (self.git_dir, self.common_dir):
+            if (path := base / name).is_file():
+                value = path.read_text().strip()
+                if value.startswith("ref: "):
+                    return self.read_ref(value[5:])
+                return value
+        return self.packed_refs[0].get(name)
+
+    def tag_refs(self) -> dict[str, str]:
+        """Returns {refname: sha} for all tags, loose refs overriding packed."""
+        refs = {
+            k: v for k, v in self.packed_refs[0].items() if k.startswith("refs/tags/")
+        }
+        tags_dir = self.common_dir / "refs" / "tags"
+        for root, _, files in os.walk(tags_dir):
+            for filename in files:
+                path = Path(root) / filename
+                name = "/".join(("refs",) + path.relative_to(tags_dir.parent).parts)
+                refs[name] = path.read_text().strip()
+        return refs
+
+    # objects
+
+    @property
+    def object_dirs(self) -> list[Path]:
+        if self._object_dirs is None:
+            self._object_dirs = [self.common_dir / "objects"]
+            alternates = self.common_dir / "objects" / "info" / "alternates"
+            if alternates.is_file():
+                for line in alternates.read_text().splitlines():
+                    if line.strip() and not line.startswith("#"):
+                        path = Path(line.strip())
+                        if not path.is_absolute():
+                            path = (self.common_dir / "objects" / path).resolve()
+                        self._object_dirs.append(path)
+        return self._object_dirs
+
+    @property
+    def packs(self) -> list[PackIndex]:
+        if self._packs is None:
+            self._packs = [
+                PackIndex(idx)
+                for objects in self.object_dirs
+                for idx in sorted((objects / "pack").glob("*.idx"))
+            ]
+        return self._packs
+
+    def read_object(self, sha: str) -> tuple[int, bytes]:
+        """Returns (type, content) of the object `sha`.
+
+        Packs are searched first, they are indexed in memory.
+        """
+        binsha = bytes.fromhex(sha)
+        for pack in self.packs:
+            if (offset := pack.find(binsha)) is not None:
+                return pack.read(offset, self)
+        for objects in self.object_dirs:
+            try:
+                with open(os.path.join(objects, sha[:2], sha[2:]), "rb") as f:
+                    data = zlib.decompress(f.read())
+            except FileNotFoundError:
+                continue
+            header, _, content = data.partition(b"\0")
+            return OBJ_TYPES[header.split(b" ")[0]], content
+        raise RevisionGitError(f"Git object not found. Got {sha}.")
+
+    def read_commit(self, sha: str) -> tuple[list[str], int]:
+        """Returns (parents, committer date) of commit `sha`, memoized."""
+        if sha not in self._commits:
+            _, content = self.read_object(sha)
+            parents, date = [], 0
+            for line in content.split(b"\n"):
+                if not line:
+                    break
+                if line.startswith(b"parent "):
+                    parents.append(line[7:].decode())
+                elif line.startswith(b"committer "):
+                    date = int(line.rsplit(b" ", 2)[-2])
+            self._commits[sha] = parents, date
+        return self._commits[sha]
+
+    def peel(self, sha: str) -> tuple[str, bool, int]:
+        """Returns (target sha, is annotated, tagger date) for a tag ref."""
+        obj_type, content = self.read_object(sha)
+        if obj_type != OBJ_TAG:
+            return sha, False, 0
+        target, date = sha, 0
+        while obj_type == OBJ_TAG:
+            for line in content.split(b"\n"):
+                if not line:
+                    break
+                if line.startswith(b"object "):
+                    target = line[7:].decode()
+                elif line.startswith(b"tagger ") and not date:
+                    date = int(line.rsplit(b" ", 2)[-2])
+            obj_type, content = self.read_object(target)
+        return target, True, date
+
+    def tagger_date(self, sha: str) -> int:
+        return self.peel(sha)[2]
+
+    def abbrev(self, sha: str) -> str:
+        """Returns the shortest unique abbreviation like `git rev-parse --short`."""
+        count = sum(pack.count for pack in self.packs)
+        length = max(FALLBACK_DEFAULT_ABBREV, (count.bit_length() + 1) // 2)
+        others = [
+            name.hex()
+            for pack in self.packs
+            for name in pack.neighbours(bytes.fromhex(sha))
+        ]
+        for objects in self.object_dirs:
+            if (path := objects / sha[:2]).is_dir():
+                others.extend(
+                    sha[:2] + name for name in os.listdir(path) if len(name) == 38
+                )
+        for other in others:
+            if other != sha:
+                common = 0
+                while common < 40 and other[common] == sha[common]:
+                    common += 1
+                length = max(length, common + 1)
+        return sha[: min(length, 40)]
+
+    # revision
+
+    @property
+    def is_detached(self) -> bool:
+        return self.read_symbolic_ref("HEAD") is None
+
+    @property
+    def branch(self) -> str:
+        if ref := self.read_symbolic_ref("HEAD"):
+            return ref.removeprefix("refs/heads/")
+        return "detached"
+
+    @property
+    def commit(self) -> str:
+        if not (sha := self.read_ref("HEAD")):
+            raise RevisionGitError(
+                f"Reference `{self.read_symbolic_ref('HEAD')}` does not exist. "
+                f"Got {self.path}."
+            )
+        return sha
+
+    def known_names(self) -> dict[str, tuple[int, str, str]]:
+        """Returns {commit sha: (prio, tag name, tag sha)}.
+
+        Annotated tags (prio 2) win over lightweight tags (prio 1). If
+        two annotated tags point to one commit the newer one wins, as
+        in `git describe`.
+        """
+        names = {}
+        _, peeled, fully_peeled = self.packed_refs
+        packed = self.packed_refs[0]
+        for refname, sha in sorted(self.tag_refs().items()):
+            if packed.get(refname) == sha and (refname in peeled or fully_peeled):
+                target, prio = peeled.get(refname, sha), 2 if refname in peeled else 1
+            else:
+                target, annotated, _ = self.peel(sha)
+                prio = 2 if annotated else 1
+            current = names.get(target)
+            if (
+                not current
+                or current[0] < prio
+                or (
+                    current[0] == prio == 2
+                    and self.tagger_date(current[2]) < self.tagger_date(sha)
+                )
+            ):
+                names[target] = (prio, refname.removeprefix("refs/tags/"), sha)
+        return names
+
+    def describe(
+        self, candidates: int = MAX_CANDIDATES, deadline: float | None = None
+    ) -> str | None:
+        """Returns the output of `git describe --tags` or None if no
+        tag describes HEAD.
+
+        Raises RevisionDescribeTimeout if the walk is still running at
+        `deadline`, a `time.monotonic()` value.
+        """
+        head = self.commit
+        names = self.known_names()
+        if not names:
+            return None
+        if head in names:
+            return names[head][1]
+        walk = _DescribeWalk(self, head, deadline)
+        matches = walk.find_candidates(names, candidates)
+        if not matches:
+            return None
+        best = min(matches, key=lambda m: (m.depth, m.found_order))
+        walk.finish_depth(best)
+        return f"{best.name}-{best.depth}-g{self.abbrev(head)}"
+
+
+class _Candidate:
+    def __init__(self, name: str, depth: int, found_order: int):
+        self.name = name
+        self.depth = depth
+        self.flag_within = 1 << found_order
+        self.found_order = found_order
+
+
+class _DescribeWalk:
+    """Commit walk of `git describe`, newest committer date first.
+
+    Each candidate tag gets a flag bit that is propagated to its
+    ancestors; a commit without the bit adds to the candidate's depth.
+    """
+
+    seen = 1
+
+    def __init__(self, reader: GitReader, head: str, deadline: float | None = None):
+        self.reader = reader
+        self.deadline = deadline
+        self.flags = {}
+        self.queue = []
+        self.counter = 0
+        self.gave_up_on = None
+        self.push(head, self.seen)
+
+    def push(self, sha: str, flag: int) -> None:
+        if not self.flags.get(sha, 0) & self.seen:
+            self.insert(sha)
+        self.flags[sha] = self.flags.get(sha, 0) | flag
+
+    def insert(self, sha: str) -> None:
+        date = self.reader.read_commit(sha)[1]
+        heapq.heappush(self.queue, (-date, self.counter, sha))
+        self.counter += 1
+
+    def check_deadline(self) -> None:
+        if self.deadline and time.monotonic() > self.deadline:
+            raise RevisionDescribeTimeout(
+                f"git describe did not complete in time. Got {self.reader.path}."
+            )
+
+    def pop(self) -> str:
+        self.check_deadline()
+        sha = heapq.heappop(self.queue)[2]
+        for parent in self.reader.read_commit(sha)[0]:
+            self.push(parent, self.flags[sha])
+        return sha
+
+    def find_candidates(self, names: dict, candidates: int) -> list[_Candidate]:
+        matches = []
+        annotated = seen_commits = 0
+        while self.queue:
+            self.check_deadline()
+            sha = heapq.heappop(self.queue)[2]
+            seen_commits += 1
+            if sha in names:
+                if len(matches) >= candidates:
+                    self.gave_up_on = sha
+                    break
+                match = _Candidate(names[sha][1], seen_commits - 1, len(matches) + 1)
+                matches.append(match)
+                self.flags[sha] |= match.flag_within
+                annotated += names[sha][0] == 2
+            for match in matches:
+                if not self.flags[sha] & match.flag_within:
+                    match.depth += 1
+            if annotated and not self.queue:
+                break
+            for parent in self.reader.read_commit(sha)[0]:
+                self.push(parent, self.flags[sha])
+        return matches
+
+    def finish_depth(self, best: _Candidate) -> None:
+        if self.gave_up_on:
+            self.insert(self.gave_up_on)
+        while self.queue:
+            sha = self.queue[0][2]
+            if self.flags[sha] & best.flag_within:
+                if all(self.flags[item[2]] & best.flag_within for item in self.queue):
+                    break
+            else:
+                best.depth += 1
+            self.pop()
@@ -0,0 +1,105 @@
+"""Lookups on the revision ordinal, see RevisionOrdinalField.
+
+Registered on RevisionOrdinalField and on RevisionField. On a
+RevisionField, the lookup is made on the model's RevisionOrdinalField
+for that field.
+"""
+
+from django.core.exceptions import FieldError
+from django.db.models import Lookup
+from django.db.models.expressions import Col
+
+from .revision_field import RevisionField, RevisionOrdinalField
+from .utils import DISTANCE_MASK, get_revision_ordinal
+
+__all__ = ["After", "Before", "Between", "Tag"]
+
+
+def to_ordinal(value: str) -> int:
+    if (ordinal := get_revision_ordinal(value)) is None:
+        raise ValueError(f"Expected a revision starting with a version. Got {value!r}")
+    return ordinal
+
+
+class RevisionOrdinalLookup(Lookup):
+    """Compares the ordinal column with the ordinal of the value."""
+
+    def __init__(self, lhs, rhs):
+        if isinstance(lhs, Col) and isinstance(lhs.target, RevisionField):
+            lhs = self.get_ordinal_col(lhs)
+        super().__init__(lhs, rhs)
+
+    @staticmethod
+    def get_ordinal_col(lhs: Col) -> Col:
+        for field in lhs.target.model._meta.concrete_fields:
+            if (
+                isinstance(field, RevisionOrdinalField)
+                and field.revision_field == lhs.target.name
+            ):
+                return field.get_col(lhs.alias)
+        raise FieldError(
+            f"Add a RevisionOrdinalField to {lhs.target.model.__name__} "
+            f"to use revision lookups on `{lhs.target.name}`."
+        )
+
+    def get_prep_lookup(self):
+        return to_ordinal(self.rhs)
+
+
+class Before(RevisionOrdinalLookup):
+    """Saved under an earlier revision than the value."""
+
+    lookup_name = "before"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} < {rhs}", (*lhs_params, *rhs_params)
+
+
+class After(RevisionOrdinalLookup):
+    """Saved under a later revision than the value."""
+
+    lookup_name = "after"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} > {rhs}", (*lhs_params, *rhs_params)
+
+
+class Between(RevisionOrdinalLookup):
+    """Saved under a revision from the first to the second value,
+    inclusive.
+    """
+
+    lookup_name = "between"
+
+    def get_prep_lookup(self):
+        start, end = self.rhs
+        return to_ordinal(start), to_ordinal(end)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        return f"{lhs} BETWEEN %s AND %s", (*lhs_params, *self.rhs)
+
+
+class Tag(RevisionOrdinalLookup):
+    """Saved under the tag of the value or a commit after it, before
+    the next tag.
+    """
+
+    lookup_name = "tag"
+
+    def get_prep_lookup(self):
+        ordinal = to_ordinal(self.rhs) & ~DISTANCE_MASK
+        return ordinal, ordinal | DISTANCE_MASK
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        return f"{lhs} BETWEEN %s AND %s", (*lhs_params, *self.rhs)
+
+
+for field_class in [RevisionField, RevisionOrdinalField]:
+    for lookup in [Before, After, Between, Tag]:
+        field_class.register_lookup(lookup)
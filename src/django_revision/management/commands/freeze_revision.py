@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+from django.core.management import color_style
+from django.core.management.base import BaseCommand
+
+from django_revision.revision import Revision
+from django_revision.utils import get_frozen_file, write_atomic
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolve the revision now and write it to a frozen revision file. "
+        "At runtime the file is read instead of git, package metadata, etc. "
+        "Run at build time, for example, before copying the project into an "
+        "image without the `.git` folder."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            dest="output",
+            default=None,
+            help=(
+                "Path of the frozen revision file. Defaults to "
+                "settings.DJANGO_REVISION_FROZEN_FILE or BASE_DIR/.django_revision.json"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["output"]) if options["output"] else get_frozen_file()
+        data = Revision(ignore_frozen_file=True, ignore_shared=True).as_dict()
+        write_atomic(path, json.dumps(data, indent=2))
+        self.stdout.write(
+            style.SUCCESS(f"Froze revision {data['revision']} ({data['source']}).")
+        )
+        self.stdout.write(f"  Wrote {path}")
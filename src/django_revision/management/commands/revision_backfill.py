@@ -0,0 +1,143 @@
+import json
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import color_style
+from django.core.management.base import BaseCommand, CommandError
+
+from django_revision.backfill import backfill_field
+from django_revision.report import get_revision_fields
+from django_revision.revision_field import RevisionField
+from django_revision.utils import allow_migrate, write_atomic
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite revision values of RevisionField columns in primary key "
+        "batches, one transaction per batch. Sets NULL revisions to "
+        "--null-value and replaces values given with --map. "
+        "Progress is saved to a checkpoint file so that an interrupted "
+        "run resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Limit to these app labels or app_label.model_name",
+        )
+        parser.add_argument(
+            "--database",
+            dest="databases",
+            action="append",
+            default=None,
+            help="Database alias. Repeat for more than one. Defaults to all.",
+        )
+        parser.add_argument(
+            "--null-value", default=None, help="Set NULL revisions to this value"
+        )
+        parser.add_argument(
+            "--map",
+            dest="mappings",
+            action="append",
+            default=[],
+            metavar="OLD=NEW",
+            help="Replace revision OLD with NEW. Repeat for more than one.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to wait between batches, e.g. to limit replication lag",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=None,
+            help="Checkpoint file. Defaults to BASE_DIR/revision_backfill.json",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and start from the beginning",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Count the rows, do not update"
+        )
+
+    def handle(self, *args, **options):
+        mapping = self.get_mapping(options["mappings"])
+        if not (mapping or options["null_value"]):
+            raise CommandError("Nothing to do. Set --null-value or --map.")
+        databases = options["databases"] or list(settings.DATABASES)
+        tasks = [
+            (model, field, using)
+            for model, field in get_revision_fields(options["labels"])
+            if isinstance(field, RevisionField)
+            for using in databases
+            if allow_migrate(model, using)
+        ]
+        self.options = options
+        self.path = Path(
+            options["checkpoint"] or Path(settings.BASE_DIR) / "revision_backfill.json"
+        )
+        self.checkpoint = {} if options["restart"] else read_checkpoint(self.path)
+        for model, field, using in tasks:
+            key = f"{using}:{model._meta.label_lower}.{field.name}"
+            if not self.checkpoint.get(key, {}).get("done"):
+                self.backfill(model, field, using, key, mapping)
+        if not options["dry_run"] and self.path.exists():
+            self.path.unlink()
+        self.stdout.write(style.SUCCESS("Done."))
+
+    def backfill(self, model, field, using, key: str, mapping: dict) -> None:
+        options = self.options
+        updated = 0
+        for last_pk, rows in backfill_field(
+            model,
+            field,
+            using,
+            mapping,
+            null_value=options["null_value"],
+            batch_size=options["batch_size"],
+            start_after=self.checkpoint.get(key, {}).get("last_pk"),
+            dry_run=options["dry_run"],
+        ):
+            updated += rows
+            if not options["dry_run"]:
+                self.save_checkpoint(key, last_pk=to_json(last_pk), done=False)
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+        if not options["dry_run"]:
+            self.save_checkpoint(key, **dict(self.checkpoint.get(key, {}), done=True))
+        verb = "Would update" if options["dry_run"] else "Updated"
+        self.stdout.write(f"{verb} {updated} rows of {key}")
+
+    def save_checkpoint(self, key: str, **values) -> None:
+        self.checkpoint[key] = values
+        write_atomic(self.path, json.dumps(self.checkpoint, indent=2))
+
+    @staticmethod
+    def get_mapping(mappings: list[str]) -> dict[str, str]:
+        mapping = {}
+        for item in mappings:
+            old, sep, new = item.partition("=")
+            if not sep or not old or not new:
+                raise CommandError(f"Expected --map OLD=NEW. Got {item!r}")
+            mapping[old] = new
+        return mapping
+
+
+def read_checkpoint(path: Path) -> dict:
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def to_json(pk):
+    return pk if isinstance(pk, int) else str(pk)
@@ -0,0 +1,46 @@
+from django.core.management import color_style
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from django_revision.db_default import set_db_defaults
+
+style = color_style()
+
+
+class Command(BaseCommand):
+    help = (
+        "Set the database column default of every revision field to the "
+        "current revision so that rows inserted without the ORM, for "
+        "example with COPY or INSERT ... SELECT, are stamped. Run on "
+        "each deploy or set settings.DJANGO_REVISION_DB_DEFAULT=True to "
+        "run after `migrate`. On SQLite, each table is rebuilt."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Limit to these app labels or app_label.model_name",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Database alias. Defaults to "default".',
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Drop the column defaults instead",
+        )
+
+    def handle(self, *args, **options):
+        altered = set_db_defaults(
+            options["labels"], using=options["database"], clear=options["clear"]
+        )
+        for model, field, value in altered:
+            name = f"{model._meta.label_lower}.{field.name}"
+            if value is None:
+                self.stdout.write(f"  Dropped the default of {name}")
+            else:
+                self.stdout.write(f"  Set the default of {name} to {value!r}")
+        self.stdout.write(style.SUCCESS(f"Done. Altered {len(altered)} columns."))
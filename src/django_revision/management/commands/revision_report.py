@@ -0,0 +1,145 @@
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, OutputWrapper
+from django.db import connections
+
+from django_revision.report import get_revision_fields, revision_histogram
+from django_revision.utils import allow_migrate
+
+CSV = "csv"
+JSON = "json"
+COLUMNS = ["database", "model", "field", "revision", "count"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the number of rows per revision for every model with a "
+        "revision field, including historical models. Models are counted "
+        "concurrently and rows are written as each model completes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Limit to these app labels or app_label.model_name",
+        )
+        parser.add_argument(
+            "--database",
+            dest="databases",
+            action="append",
+            default=None,
+            help="Database alias. Repeat for more than one. Defaults to all.",
+        )
+        parser.add_argument(
+            "--format", choices=[CSV, JSON], default=CSV, help="Output format"
+        )
+        parser.add_argument(
+            "--output", default=None, help="Write to this file instead of stdout"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of models counted at the same time. 1 to not use threads",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help=(
+                "Count by scanning each table in primary key order, this many "
+                "rows per query, instead of GROUP BY"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        databases = options["databases"] or list(settings.DATABASES)
+        if unknown := [alias for alias in databases if alias not in connections]:
+            raise CommandError(f"Unknown database alias. Got {unknown}")
+        tasks = [
+            (model, field, using)
+            for model, field in get_revision_fields(options["labels"])
+            for using in databases
+            if allow_migrate(model, using)
+        ]
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                self.write_report(OutputWrapper(f), tasks, options)
+        else:
+            self.write_report(self.stdout, tasks, options)
+
+    def write_report(self, stream, tasks, options) -> None:
+        writer = ReportWriter(stream, options["format"])
+        if options["workers"] == 1:
+            for task in tasks:
+                writer.write(self.count(*task, options["chunk_size"]))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=options["workers"], thread_name_prefix="revision_report"
+            ) as executor:
+                futures = [
+                    executor.submit(self.count_in_thread, *task, options["chunk_size"])
+                    for task in tasks
+                ]
+                for future in as_completed(futures):
+                    writer.write(future.result())
+        writer.close()
+
+    @staticmethod
+    def count(model, field, using, chunk_size) -> list[list]:
+        return [
+            [using, model._meta.label_lower, field.name, revision, count]
+            for revision, count in revision_histogram(model, field, using, chunk_size)
+        ]
+
+    def count_in_thread(self, model, field, using, chunk_size) -> list[list]:
+        try:
+            return self.count(model, field, using, chunk_size)
+        finally:
+            # each thread opens its own connection
+            connections[using].close()
+
+
+class ReportWriter:
+    """Writes rows as CSV or as a JSON list to an OutputWrapper, one
+    write per batch of rows.
+    """
+
+    def __init__(self, stream: OutputWrapper, fmt: str):
+        self.stream = stream
+        self.format = fmt
+        self.rows = 0
+        self.buffer = StringIO()
+        if fmt == CSV:
+            self.csv_writer = csv.writer(self.buffer, lineterminator="\n")
+            self.csv_writer.writerow(COLUMNS)
+        else:
+            self.buffer.write("[")
+
+    def write(self, rows: list[list]) -> None:
+        for row in rows:
+            if self.format == CSV:
+                self.csv_writer.writerow(row)
+            else:
+                separator = "," if self.rows else ""
+                self.buffer.write(
+                    f"{separator}\n  {json.dumps(dict(zip(COLUMNS, row)))}"
+                )
+            self.rows += 1
+        self.flush()
+
+    def close(self) -> None:
+        if self.format == JSON:
+            self.buffer.write("\n]\n")
+        self.flush()
+
+    def flush(self) -> None:
+        self.stream.write(self.buffer.getvalue(), ending="")
+        self.stream.flush()
+        self.buffer.seek(0)
+        self.buffer.truncate()
@@ -0,0 +1,159 @@
+import threading
+
+from django.db import connections, models, transaction
+
+from .constants import BULK
+from .revision import site_revision
+from .revision_field import RevisionField, RevisionForeignKey, RevisionOrdinalField
+from .stats import revision_stats
+from .utils import get_revision_ordinal
+from .watermarks import revision_watermarks
+
+
+class RevisionLookupManager(models.Manager):
+    """Caches revision string <-> id per database for the life of the
+    process, like the ContentType manager.
+
+    A row created or read in a transaction is kept for the rest of the
+    transaction and cached for the process once it commits, so a row
+    rolled back with its transaction is not returned later.
+    """
+
+    # {db: {revision: id, id: revision}}
+    _cache: dict[str, dict[str | int, int | str]] = {}
+
+    # per thread, {db: (on_commit callbacks, {revision: id, id: revision})}
+    _pending = threading.local()
+
+    def get_by_natural_key(self, revision: str):
+        return self.get(revision=revision)
+
+    def get_id(self, revision: str) -> int:
+        """Returns the id for `revision`, creating the row on first use."""
+        try:
+            return self._cache[self.db][revision]
+        except KeyError:
+            if pk := self._get_pending(self.db).get(revision):
+                return pk
+            obj, _ = self.get_or_create(revision=revision)
+            self._add_to_cache(self.db, obj)
+            return obj.id
+
+    def get_revision(self, pk: int | None) -> str | None:
+        """Returns the revision string for `pk`."""
+        if pk is None:
+            return None
+        try:
+            return self._cache[self.db][pk]
+        except KeyError:
+            if revision := self._get_pending(self.db).get(pk):
+                return revision
+            obj = self.get(pk=pk)
+            self._add_to_cache(self.db, obj)
+            return obj.revision
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._pending.__dict__.clear()
+
+    def _get_pending(self, using: str) -> dict[str | int, int | str]:
+        """Returns the rows kept in the current transaction of `using`.
+
+        Django replaces the list of on_commit callbacks on commit and
+        rollback, so rows of a transaction that ended are not returned.
+        """
+        callbacks, rows = self._pending.__dict__.get(using, (None, {}))
+        if callbacks is connections[using].run_on_commit:
+            return rows
+        return {}
+
+    def _add_to_cache(self, using: str, obj) -> None:
+        row = {obj.revision: obj.id, obj.id: obj.revision}
+        connection = connections[using]
+        if not connection.in_atomic_block:
+            self._cache.setdefault(using, {}).update(row)
+            return
+        if not (rows := self._get_pending(using)):
+            self._pending.__dict__[using] = (connection.run_on_commit, rows)
+            transaction.on_commit(
+                lambda: self._cache.setdefault(using, {}).update(rows), using=using
+            )
+        rows.update(row)
+
+
+class RevisionQuerySet(models.QuerySet):
+    """Stamps the current revision on `update()` and `bulk_update()`.
+
+    `save()` and `bulk_create()` are stamped by the field's `pre_save`;
+    these two fast paths skip `pre_save`. An explicit value for the
+    revision field in `update()` is left as is.
+    """
+
+    def revision_fields(
+        self,
+    ) -> list[RevisionField | RevisionForeignKey | RevisionOrdinalField]:
+        return [
+            field
+            for field in self.model._meta.concrete_fields
+            if isinstance(
+                field, (RevisionField, RevisionForeignKey, RevisionOrdinalField)
+            )
+        ]
+
+    def update(self, **kwargs):
+        revision_fields = self.revision_fields()
+        stamped = set()
+        for field in revision_fields:
+            if field.name in kwargs or field.attname in kwargs:
+                continue
+            if isinstance(field, RevisionOrdinalField) and isinstance(
+                revision := kwargs.get(field.revision_field), str
+            ):
+                # follow an explicit revision
+                kwargs[field.attname] = get_revision_ordinal(revision)
+            else:
+                kwargs[field.attname] = field.get_revision_value(self.db)
+                stamped.add(self.get_stamped_revision(field, kwargs[field.attname]))
+        rows = super().update(**kwargs)
+        if revision_stats.enabled and revision_fields:
+            revision_stats.incr(BULK, rows)
+        self.record_watermarks(stamped, rows)
+        return rows
+
+    update.alters_data = True
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        objs = tuple(objs)
+        fields = list(fields)
+        stamped = set()
+        for field in self.revision_fields():
+            value = field.get_revision_value(self.db)
+            for obj in objs:
+                setattr(obj, field.attname, value)
+            if field.name not in fields and field.attname not in fields:
+                fields.append(field.name)
+            stamped.add(self.get_stamped_revision(field, value))
+        # stamped rows are counted by `update()`, called per batch
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        self.record_watermarks(stamped, rows)
+        return rows
+
+    bulk_update.alters_data = True
+
+    @staticmethod
+    def get_stamped_revision(field, value) -> str | None:
+        """Returns the revision string stamped by `field`."""
+        if isinstance(field, RevisionField):
+            return value
+        if isinstance(field, RevisionForeignKey):
+            return site_revision.revision
+        return None
+
+    def record_watermarks(self, revisions: set[str | None], rows: int) -> None:
+        if revision_watermarks.enabled and rows:
+            for revision in revisions - {None}:
+                revision_watermarks.record(self.model._meta.label_lower, revision, rows)
+
+
+class RevisionManager(models.Manager.from_queryset(RevisionQuerySet)):
+    pass
@@ -0,0 +1,59 @@
+from django.utils.cache import get_conditional_response
+from django.utils.deprecation import MiddlewareMixin
+
+from .revision import site_revision
+from .utils import get_etag_url_names, get_revision_header
+
+
+class RevisionMiddleware(MiddlewareMixin):
+    """Adds the revision to each response as a header and, for the
+    views named in settings.DJANGO_REVISION_ETAG_URL_NAMES, a weak
+    ETag derived from the revision.
+
+    A request to one of these views with a matching `If-None-Match`
+    gets a 304 without calling the view until the revision changes,
+    so only name views whose content depends on the deployed code
+    alone, not on the user or the data.
+
+    Works under WSGI and ASGI. Add to settings:
+
+        MIDDLEWARE = [
+            ...,
+            "django_revision.middleware.RevisionMiddleware",
+        ]
+
+    Set settings.DJANGO_REVISION_HEADER=None to not add the header.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.header = get_revision_header()
+        self.etag_url_names = frozenset(get_etag_url_names())
+
+    @staticmethod
+    def get_etag() -> str:
+        return f'W/"{site_revision.revision_hash}"'
+
+    def use_etag(self, request) -> bool:
+        return (
+            request.method in ("GET", "HEAD")
+            and request.resolver_match is not None
+            and request.resolver_match.url_name in self.etag_url_names
+        )
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.etag_url_names and self.use_etag(request):
+            return get_conditional_response(request, etag=self.get_etag())
+        return None
+
+    def process_response(self, request, response):
+        if self.header:
+            response.headers[self.header] = site_revision.revision
+        if (
+            self.etag_url_names
+            and response.status_code in (200, 304)
+            and not response.has_header("ETag")
+            and self.use_etag(request)
+        ):
+            response.headers["ETag"] = self.get_etag()
+        return response
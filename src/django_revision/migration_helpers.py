@@ -0,0 +1,82 @@
+from django.db import migrations
+
+__all__ = [
+    "copy_foreign_key_to_revision",
+    "copy_revision_to_foreign_key",
+    "revision_field_to_foreign_key",
+]
+
+
+def copy_revision_to_foreign_key(
+    model_cls, lookup_model_cls, from_field: str, to_field: str, using: str
+) -> None:
+    """Sets `to_field` from the string in `from_field`.
+
+    One UPDATE per distinct revision.
+    """
+    revisions = (
+        model_cls.objects.using(using)
+        .exclude(**{f"{from_field}__isnull": True})
+        .values_list(from_field, flat=True)
+        .distinct()
+    )
+    for revision in list(revisions):
+        obj, _ = lookup_model_cls.objects.using(using).get_or_create(revision=revision)
+        model_cls.objects.using(using).filter(**{from_field: revision}).update(
+            **{f"{to_field}_id": obj.id}
+        )
+
+
+def copy_foreign_key_to_revision(
+    model_cls, lookup_model_cls, from_field: str, to_field: str, using: str
+) -> None:
+    """Reverse of `copy_revision_to_foreign_key`."""
+    ids = (
+        model_cls.objects.using(using)
+        .exclude(**{f"{to_field}__isnull": True})
+        .values_list(f"{to_field}_id", flat=True)
+        .distinct()
+    )
+    for obj in lookup_model_cls.objects.using(using).filter(id__in=list(ids)):
+        model_cls.objects.using(using).filter(**{f"{to_field}_id": obj.id}).update(
+            **{from_field: obj.revision}
+        )
+
+
+def revision_field_to_foreign_key(
+    app_label: str,
+    model_name: str,
+    from_field: str = "revision",
+    to_field: str = "revision_lookup",
+) -> migrations.RunPython:
+    """Returns a RunPython operation that converts an existing
+    RevisionField column to a RevisionForeignKey.
+
+    Add the RevisionForeignKey first and remove the RevisionField
+    after, for example:
+
+        dependencies = [("django_revision", "0001_initial"), ...]
+        operations = [
+            migrations.AddField("mymodel", "revision_lookup", RevisionForeignKey()),
+            revision_field_to_foreign_key("myapp", "mymodel"),
+            migrations.RemoveField("mymodel", "revision"),
+        ]
+    """
+
+    def get_models(apps):
+        return (
+            apps.get_model(app_label, model_name),
+            apps.get_model("django_revision", "RevisionLookup"),
+        )
+
+    def forward(apps, schema_editor):
+        copy_revision_to_foreign_key(
+            *get_models(apps), from_field, to_field, schema_editor.connection.alias
+        )
+
+    def reverse(apps, schema_editor):
+        copy_foreign_key_to_revision(
+            *get_models(apps), from_field, to_field, schema_editor.connection.alias
+        )
+
+    return migrations.RunPython(forward, reverse)
@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevisionLookup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('revision', models.CharField(max_length=75, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Revision',
+                'verbose_name_plural': 'Revisions',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_revision', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevisionWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('revision', models.CharField(max_length=75)),
+                ('model', models.CharField(help_text='app_label.model_name', max_length=150)),
+                ('first_seen', models.DateTimeField()),
+                ('last_seen', models.DateTimeField()),
+                ('count', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Revision watermark',
+                'verbose_name_plural': 'Revision watermarks',
+                'indexes': [models.Index(fields=['first_seen'], name='django_revi_first_s_2ba06e_idx')],
+                'constraints': [models.UniqueConstraint(fields=('revision', 'model'), name='django_revision_watermark_unique')],
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 
-from .revision_field import RevisionField
+from .models import RevisionLookup
+from .revision_field import RevisionField, RevisionForeignKey
 
 
 class RevisionModelMixin(models.Model):
@@ -14,3 +15,28 @@ class RevisionModelMixin(models.Model):
 
     class Meta:
         abstract = True
+
+
+class RevisionForeignKeyModelMixin(models.Model):
+    """Like RevisionModelMixin but stores the revision as a foreign
+    key to RevisionLookup.
+
+    `revision` returns the revision string from the cached lookup. To
+    filter, use `revision_lookup__revision`.
+    """
+
+    revision_lookup = RevisionForeignKey(
+        help_text=(
+            "System field. From git repository (tag:branch:commit), "
+            "project metadata, project toml, project VERSION, or settings."
+        )
+    )
+
+    @property
+    def revision(self) -> str | None:
+        return RevisionLookup.objects.db_manager(self._state.db).get_revision(
+            self.revision_lookup_id
+        )
+
+    class Meta:
+        abstract = True
@@ -0,0 +1,57 @@
+from django.db import models
+
+from .managers import RevisionLookupManager
+
+
+class RevisionLookup(models.Model):
+    """One row per distinct revision string.
+
+    Referenced by `RevisionForeignKey` so that each model row stores a
+    small integer instead of the full `tag:branch:commit` string.
+    """
+
+    revision = models.CharField(max_length=75, unique=True)
+
+    objects = RevisionLookupManager()
+
+    def __str__(self):
+        return self.revision
+
+    def natural_key(self) -> tuple[str]:
+        return (self.revision,)
+
+    class Meta:
+        verbose_name = "Revision"
+        verbose_name_plural = "Revisions"
+
+
+class RevisionWatermark(models.Model):
+    """One row per revision and model, with the first and last time
+    a row of the model was written under the revision and an
+    approximate count of writes.
+
+    Updated from memory in batches, see watermarks.py.
+    """
+
+    revision = models.CharField(max_length=75)
+
+    model = models.CharField(max_length=150, help_text="app_label.model_name")
+
+    first_seen = models.DateTimeField()
+
+    last_seen = models.DateTimeField()
+
+    count = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.revision} {self.model}"
+
+    class Meta:
+        verbose_name = "Revision watermark"
+        verbose_name_plural = "Revision watermarks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["revision", "model"], name="django_revision_watermark_unique"
+            )
+        ]
+        indexes = [models.Index(fields=["first_seen"])]
@@ -0,0 +1,80 @@
+"""Counts rows per revision for every model with a revision field,
+see `manage.py revision_report`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+
+from django.apps import apps as django_apps
+from django.db.models import Count, Field, Model
+
+from .revision_field import RevisionField, RevisionForeignKey
+
+__all__ = ["get_revision_fields", "revision_histogram"]
+
+
+def get_revision_fields(
+    labels: list[str] | None = None,
+) -> list[tuple[type[Model], Field]]:
+    """Returns (model, field) for each RevisionField and
+    RevisionForeignKey of concrete models, including historical models.
+
+    `labels` limits to these "app_label" or "app_label.model_name".
+    """
+    labels = [label.lower() for label in labels or []]
+    fields = []
+    for model in django_apps.get_models():
+        if model._meta.proxy or (
+            labels
+            and model._meta.app_label not in labels
+            and model._meta.label_lower not in labels
+        ):
+            continue
+        fields.extend(
+            (model, field)
+            for field in model._meta.concrete_fields
+            if isinstance(field, (RevisionField, RevisionForeignKey))
+        )
+    return fields
+
+
+def revision_histogram(
+    model: type[Model], field: Field, using: str, chunk_size: int | None = None
+) -> Iterator[tuple[str | None, int]]:
+    """Yields (revision, count) for `field` of `model` in `using`.
+
+    Counts with GROUP BY or, if `chunk_size` is set, by scanning the
+    table in primary key order, `chunk_size` rows per query, for
+    backends where GROUP BY on a large table is too expensive.
+    """
+    queryset = model._base_manager.using(using)
+    if chunk_size:
+        items = chunked_counts(queryset, field.attname, chunk_size).items()
+    else:
+        items = (
+            queryset.order_by(field.attname)
+            .values_list(field.attname)
+            .annotate(count=Count("pk"))
+            .iterator()
+        )
+    for value, count in items:
+        if isinstance(field, RevisionForeignKey):
+            manager = field.remote_field.model._default_manager.db_manager(using)
+            value = manager.get_revision(value)
+        yield value, count
+
+
+def chunked_counts(queryset, attname: str, chunk_size: int) -> Counter:
+    counts = Counter()
+    last_pk = None
+    while True:
+        chunk = queryset.order_by("pk")
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        rows = list(chunk.values_list("pk", attname)[:chunk_size])
+        if not rows:
+            return counts
+        counts.update(value for _, value in rows)
+        last_pk = rows[-1][0]
@@ -1,44 +1,171 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
 import warnings
+import weakref
 from pathlib import Path
+from typing import Callable
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.management import color_style
-from git import GitCmdObjectDB, GitCommandError, InvalidGitRepositoryError, Repo
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import cached_property
 
-from .exceptions import RevisionError, RevisionGitDirDoesNotExist, RevisionGitError
+from .constants import (
+    COMMIT_ONLY,
+    GIT,
+    METADATA,
+    NATIVE,
+    REFRESH_CHECKS,
+    REFRESHES,
+    SETTINGS,
+    SHARED_ENV_VAR,
+    TOML_FILE,
+    VERSION_FILE,
+)
+from .exceptions import (
+    RevisionDescribeTimeout,
+    RevisionError,
+    RevisionGitDirDoesNotExist,
+    RevisionGitError,
+)
+from .git_reader import FALLBACK_DEFAULT_ABBREV, GitReader
+from .signals import revision_discovered
+from .sources import get_sources
+from .stats import revision_stats
 from .utils import (
+    DISTANCE_RE,
     get_app_name,
+    get_cache_file,
+    get_describe_cache_file,
+    get_describe_candidates,
+    get_describe_fallback,
+    get_describe_timeout,
+    get_fingerprint,
+    get_frozen_file,
+    get_git_backend,
     get_git_dir,
+    get_refresh_interval,
+    get_revision_from_environ,
+    get_revision_from_frozen_file,
     get_revision_from_metadata,
     get_revision_from_settings,
     get_revision_from_toml_file,
     get_revision_from_version_file,
+    get_settings_key,
+    get_source_names,
+    ignore_frozen,
     ignore_working_dir,
+    read_cache_file,
+    write_atomic,
 )
 
 style = color_style()
 
+# entries kept in settings.DJANGO_REVISION_DESCRIBE_CACHE_FILE
+DESCRIBE_MEMO_SIZE = 1000
+
 
 class Revision:
+    # resolved values shared by instances with the same configuration,
+    # {cache_key: {revision, tag, branch, commit, source}}
+    _cache: dict[tuple, dict] = {}
+    # instances holding a GitPython repo or GitReader, closed before fork
+    _open: weakref.WeakSet = weakref.WeakSet()
+    # values used instead of discovery, see testing.override_revision
+    _pinned: dict | None = None
+    _instances: weakref.WeakSet = weakref.WeakSet()
+
     def __init__(
         self,
         max_length: str | int = None,
         app_name: str | None = None,
         toml_path: Path | str | None = None,
         verbose: bool = None,
+        ignore_frozen_file: bool | None = None,
+        ignore_shared: bool | None = None,
+        git_dir: Path | str | None = None,
+        sources: list[str] | None = None,
     ):
         self._revision = None
+        self._revision_hash = None
         self._tag = None
         self._repo = None
+        self._git_reader = None
         self._branch = None
         self._commit = None
         self._settings_revision = None
         self.max_length = max_length or 75
-        self.app_name = app_name or get_app_name()
-        self.toml_path = Path(toml_path) if toml_path else Path(settings.BASE_DIR)
         self.verbose = verbose
+        self.source = None
+        self.ignore_shared = bool(ignore_shared)
+        self._app_name = app_name
+        self._toml_path = toml_path
+        self._ignore_frozen_file = ignore_frozen_file
+        self._git_dir = git_dir
+        # if set, only these sources are tried, whatever the
+        # DJANGO_REVISION_IGNORE_* settings
+        self.sources = sources
+        self._fingerprint = None
+        self._next_check = None
+        self._discovering = False
+        self._lock = threading.RLock()
+        self.discovery_timings = {}
+        self._instances.add(self)
+
+    # settings are read on first use, not in __init__, so that
+    # creating `site_revision` at import does not touch settings.
+
+    @cached_property
+    def app_name(self) -> str | None:
+        return self._app_name or get_app_name()
+
+    @cached_property
+    def toml_path(self) -> Path:
+        return Path(self._toml_path) if self._toml_path else Path(settings.BASE_DIR)
+
+    @cached_property
+    def git_dir(self) -> Path | None:
+        return Path(self._git_dir) if self._git_dir else get_git_dir()
+
+    @cached_property
+    def ignore_frozen_file(self) -> bool:
+        if self._ignore_frozen_file is not None:
+            return self._ignore_frozen_file
+        return ignore_frozen()
+
+    @cached_property
+    def git_backend(self) -> str:
+        return get_git_backend()
+
+    @cached_property
+    def refresh_interval(self) -> float:
+        return get_refresh_interval()
+
+    @cached_property
+    def cache_file(self) -> Path | None:
+        return get_cache_file()
+
+    def reconfigure(self) -> None:
+        """Reads settings again on next use and resets."""
+        for attr in [
+            "app_name",
+            "toml_path",
+            "git_dir",
+            "ignore_frozen_file",
+            "git_backend",
+            "refresh_interval",
+            "cache_file",
+        ]:
+            self.__dict__.pop(attr, None)
+        self.ignore_shared = False
+        self.reset()
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.revision})"
@@ -50,57 +177,406 @@ class Revision:
     def revision(self) -> str:
         """Returns a revision number.
 
-        Initially assumes the BASE_DIR is a git repo and looks for
+        If a frozen revision file exists (see `manage.py freeze_revision`),
+        loads tag, branch and commit from the file.
+
+        Otherwise, assumes the BASE_DIR is a git repo and looks for
         the most recent tag or raises.
 
         if DJANGO_REVISION_IGNORE_WORKING_DIR=True:
             1. looks for metadata version
-            2. checks settings.REVISION
-            3. checks pyproject.toml
-        """
+            2. checks pyproject.toml
+            3. checks VERSION
+            4. checks settings.REVISION
+
+        If settings.DJANGO_REVISION_REFRESH_INTERVAL is set, checks the
+        fingerprint of the files the revision depends on at most once
+        per interval and discovers again if the fingerprint changed.
 
+        Instances with the same configuration share the resolved values,
+        see `cache_key`.
+        """
+        if self._next_check and time.monotonic() >= self._next_check:
+            self.refresh()
         if not self._revision:
-            if not ignore_working_dir():
-                self._revision = self.get_revision_from_git_tag()
-                if self.verbose:
-                    warnings.warn(style.WARNING("Getting revision number from git"))
-            elif revision := get_revision_from_metadata():
-                self._revision = revision
-                if self.verbose:
-                    warnings.warn(
-                        style.WARNING("Getting revision number from package metata")
-                    )
-            elif revision := get_revision_from_toml_file(self.toml_path):
-                self._revision = revision
-                if self.verbose:
-                    warnings.warn(
-                        style.WARNING("Getting revision number from pyproject.toml")
-                    )
-            elif revision := get_revision_from_version_file(Path(settings.BASE_DIR)):
-                self._revision = revision
-                if self.verbose:
-                    warnings.warn(
-                        style.WARNING("Getting revision number from VERSION file")
-                    )
-            elif revision := get_revision_from_settings():
-                self._revision = revision
-                warnings.warn(
-                    style.ERROR(
-                        "Getting revision number from settings.REVISION "
-                        "(not recommended)."
-                    )
-                )
+            self.resolve()
+        return self._revision
+
+    @property
+    def revision_hash(self) -> str:
+        """Returns a short hash of the revision, computed once per
+        revision.
+        """
+        revision = self.revision
+        if not self._revision_hash:
+            self._revision_hash = hashlib.blake2b(
+                revision.encode(), digest_size=6
+            ).hexdigest()
+        return self._revision_hash
+
+    def resolve(self) -> None:
+        """Loads the revision from the shared cache, the on-disk cache
+        or discovers it.
+
+        Concurrent callers wait for the first, so the revision is
+        discovered once.
+        """
+        with self._lock:
+            if self._revision:
+                return
+            if self._pinned:
+                self.load(self._pinned)
+                return
+            fingerprint = None
+            if data := self._cache.get(self.cache_key):
+                self.load(data)
             else:
-                raise RevisionError(
-                    "Unable to determine the revision number. "
-                    f"1. `settings.DJANGO_REVISION_IGNORE_WORKING_DIR="
-                    f"{ignore_working_dir()}` so this is not a git repository. "
-                    f"2. Got None from metadata for APP_NAME={get_app_name()}. "
-                    "3. Looked for [project][version] in `pyproject.toml` file but "
-                    "file not found in {settings.BASE_DIR}. "
-                    "4. settings.REVISION has not been set. "
+                if self.use_cache_file:
+                    fingerprint = get_fingerprint(self.watched_paths())
+                if not (fingerprint and self.load_from_cache_file(fingerprint)):
+                    self._discovering = True
+                    try:
+                        revision, source = self.discover()
+                    finally:
+                        self._discovering = False
+                        # tag, branch and commit are resolved
+                        self.release()
+                    self.source = source
+                    self._revision = revision
+                    if fingerprint:
+                        self.write_to_cache_file(fingerprint)
+                self._cache[self.cache_key] = self.resolved_values()
+            if self.refresh_interval:
+                self._fingerprint = fingerprint or get_fingerprint(self.watched_paths())
+                self._next_check = time.monotonic() + self.refresh_interval
+
+    def resolved_values(self) -> dict[str, str | None]:
+        return dict(
+            revision=self._revision,
+            tag=self._tag,
+            branch=self._branch,
+            commit=self._commit,
+            source=self.source,
+        )
+
+    @property
+    def use_cache_file(self) -> bool:
+        """True if settings.DJANGO_REVISION_CACHE_FILE is set and no
+        revision is published by a parent process.
+        """
+        return bool(self.cache_file) and (
+            self.ignore_shared or SHARED_ENV_VAR not in os.environ
+        )
+
+    def get_cache_file_key(self, fingerprint: tuple) -> tuple[str, str]:
+        """Returns (entry key, fingerprint hash) in the on-disk cache."""
+        config = repr((self.cache_key, get_settings_key()))
+        return (
+            hashlib.blake2b(config.encode(), digest_size=8).hexdigest(),
+            hashlib.blake2b(repr(fingerprint).encode(), digest_size=8).hexdigest(),
+        )
+
+    def load_from_cache_file(self, fingerprint: tuple) -> bool:
+        """Loads the values from the on-disk cache if the fingerprint
+        of the watched files has not changed.
+        """
+        key, fingerprint_hash = self.get_cache_file_key(fingerprint)
+        entry = read_cache_file(self.cache_file).get(key) or {}
+        if entry.get("fingerprint") == fingerprint_hash and entry.get("data"):
+            self.warn(f"Getting revision number from cache file {self.cache_file}")
+            self.load(entry["data"])
+            return True
+        return False
+
+    def write_to_cache_file(self, fingerprint: tuple) -> None:
+        key, fingerprint_hash = self.get_cache_file_key(fingerprint)
+        data = read_cache_file(self.cache_file)
+        data[key] = dict(fingerprint=fingerprint_hash, data=self.resolved_values())
+        try:
+            write_atomic(self.cache_file, json.dumps(data, indent=2))
+        except OSError as e:
+            self.warn(f"Unable to write cache file {self.cache_file}. Got {e}")
+
+    async def aresolve(self) -> str:
+        """Returns the revision, discovering it in a worker thread so
+        that the event loop is not blocked.
+
+        Concurrent callers wait for the same discovery.
+        """
+        if self._revision and not (
+            self._next_check and time.monotonic() >= self._next_check
+        ):
+            return self._revision
+        return await sync_to_async(Revision.revision.fget, thread_sensitive=False)(self)
+
+    async def atag(self) -> str:
+        return await self._aget("tag")
+
+    async def abranch(self) -> str:
+        return await self._aget("branch")
+
+    async def acommit(self) -> str:
+        return await self._aget("commit")
+
+    async def aas_dict(self) -> dict[str, str | int | None]:
+        """Returns `as_dict`, read off the event loop. The values can
+        then be used in a template without further I/O.
+        """
+        await self.aresolve()
+        return await sync_to_async(self.as_dict, thread_sensitive=False)()
+
+    async def _aget(self, name: str) -> str:
+        await self.aresolve()
+        if value := getattr(self, f"_{name}"):
+            return value
+        return await sync_to_async(getattr, thread_sensitive=False)(self, name)
+
+    @property
+    def cache_key(self) -> tuple:
+        """Returns the key of this configuration in the shared cache.
+
+        The cache is cleared when a setting that affects discovery
+        changes, so settings other than GIT_DIR are not part of the key.
+        """
+        return (
+            str(self.git_dir),
+            str(self.toml_path),
+            self.app_name,
+            tuple(self.sources or []),
+            self.max_length,
+            self.ignore_frozen_file,
+            self.ignore_shared,
+            self.git_backend,
+        )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
+
+    @classmethod
+    def pin(cls, data: dict | None) -> None:
+        """Sets the values, see `load`, of every instance instead of
+        discovering them, or discovers again if None.
+
+        See testing.override_revision.
+        """
+        cls._pinned = data
+        cls.clear_cache()
+        for instance in list(cls._instances):
+            with instance._lock:
+                instance.reset()
+
+    def watched_paths(self) -> list[Path]:
+        """Returns the files whose change means the revision may have
+        changed.
+        """
+        paths = [
+            get_frozen_file(),
+            self.toml_path / "pyproject.toml",
+            Path(settings.BASE_DIR) / "VERSION",
+        ]
+        try:
+            reader = self._git_reader or GitReader(self.git_dir)
+        except RevisionGitError:
+            pass
+        else:
+            paths.extend([reader.git_dir / "HEAD", reader.common_dir / "packed-refs"])
+            # a new loose tag changes the mtime of its directory only,
+            # e.g. refs/tags/release for release/1.1
+            paths.extend(
+                Path(dirpath)
+                for dirpath, _, _ in os.walk(reader.common_dir / "refs" / "tags")
+            )
+            if ref := reader.read_symbolic_ref("HEAD"):
+                paths.append(reader.common_dir / ref)
+        return paths
+
+    def refresh(self) -> None:
+        """Resets if the fingerprint of the watched files changed."""
+        with self._lock:
+            if not self._revision:
+                # reset by another thread
+                return
+            self._next_check = time.monotonic() + self.refresh_interval
+            if revision_stats.enabled:
+                revision_stats.incr(REFRESH_CHECKS)
+            if get_fingerprint(self.watched_paths()) != self._fingerprint:
+                if revision_stats.enabled:
+                    revision_stats.incr(REFRESHES)
+                self._cache.pop(self.cache_key, None)
+                self.reset()
+                # a revision published by the parent process is now stale
+                self.ignore_shared = True
+
+    def release(self) -> None:
+        """Closes the GitPython repo, including its persistent
+        `git cat-file` processes, and the GitReader, if open.
+        """
+        if self._git_reader:
+            self._git_reader.close()
+        if self._repo:
+            self._repo.close()
+        self._repo = None
+        self._git_reader = None
+        self._open.discard(self)
+
+    def reset(self) -> None:
+        """Clears the resolved values, next read discovers again."""
+        self.release()
+        self._revision = None
+        self._revision_hash = None
+        self._tag = None
+        self._branch = None
+        self._commit = None
+        self._fingerprint = None
+        self._next_check = None
+        self.source = None
+
+    def discover(self) -> tuple[str, str]:
+        """Returns a tuple of (revision, source) from the first source
+        that returns a value.
+
+        Sends `revision_discovered` with the time taken by each step.
+        """
+        timings = {}
+        for name, step in self.discovery_steps():
+            start = time.perf_counter()
+            result = step()
+            timings[name] = time.perf_counter() - start
+            if result:
+                self.discovery_timings = timings
+                revision_discovered.send(
+                    sender=self.__class__,
+                    instance=self,
+                    revision=result[0],
+                    source=result[1],
+                    timings=timings,
                 )
-        return self._revision
+                return result
+        self.discovery_timings = timings
+        raise RevisionError(
+            "Unable to determine the revision number. "
+            f"1. `settings.DJANGO_REVISION_IGNORE_WORKING_DIR="
+            f"{ignore_working_dir()}` so this is not a git repository. "
+            f"2. Got None from metadata for APP_NAME={self.app_name}. "
+            "3. Looked for [project][version] in `pyproject.toml` file but "
+            "file not found in {settings.BASE_DIR}. "
+            "4. settings.REVISION has not been set. "
+        )
+
+    def discovery_steps(self) -> list[tuple[str, Callable]]:
+        """Returns (name, step) in the order tried by `discover`, see
+        sources.py.
+
+        Each step returns (revision, source) or None. If `sources` is
+        set, only these are tried in this order, whatever
+        settings.DJANGO_REVISION_SOURCES.
+        """
+        return [(source.name, source(self).get) for source in get_sources(self.sources)]
+
+    @property
+    def ignore_flag(self) -> bool | None:
+        """Returns False if `sources` or settings.DJANGO_REVISION_SOURCES
+        is set, i.e. the sources listed are not ignored, otherwise None
+        to follow the settings.
+        """
+        return False if self.sources or get_source_names() else None
+
+    def from_shared(self) -> tuple[str, str] | None:
+        if not self.ignore_shared and (data := get_revision_from_environ()):
+            self.load(data)
+            self.warn(f"Getting revision number from environ {SHARED_ENV_VAR}")
+            return data["revision"], data["source"]
+        return None
+
+    def from_frozen_file(self) -> tuple[str, str] | None:
+        if not self.ignore_frozen_file and (
+            data := get_revision_from_frozen_file(get_frozen_file())
+        ):
+            self.load(data)
+            self.warn(f"Getting revision number from frozen file {get_frozen_file()}")
+            return data["revision"], data["source"]
+        return None
+
+    def from_git(self) -> tuple[str, str] | None:
+        if self.ignore_flag is False or not ignore_working_dir():
+            self.warn("Getting revision number from git")
+            try:
+                return self.get_revision_from_git_tag(), GIT
+            except RevisionDescribeTimeout as e:
+                # settings.DJANGO_REVISION_DESCRIBE_FALLBACK=NEXT_SOURCE
+                self.warn(f"{e} Trying the next source.")
+                self._tag = self._branch = self._commit = None
+        return None
+
+    def from_metadata(self) -> tuple[str, str] | None:
+        if revision := get_revision_from_metadata(self.app_name, self.ignore_flag):
+            self.warn("Getting revision number from package metata")
+            return revision, METADATA
+        return None
+
+    def from_toml_file(self) -> tuple[str, str] | None:
+        if revision := get_revision_from_toml_file(self.toml_path, self.ignore_flag):
+            self.warn("Getting revision number from pyproject.toml")
+            return revision, TOML_FILE
+        return None
+
+    def from_version_file(self) -> tuple[str, str] | None:
+        if revision := get_revision_from_version_file(
+            Path(settings.BASE_DIR), self.ignore_flag
+        ):
+            self.warn("Getting revision number from VERSION file")
+            return revision, VERSION_FILE
+        return None
+
+    def from_settings(self) -> tuple[str, str] | None:
+        if revision := get_revision_from_settings():
+            warnings.warn(
+                style.ERROR(
+                    "Getting revision number from settings.REVISION "
+                    "(not recommended)."
+                )
+            )
+            return revision, SETTINGS
+        return None
+
+    def warn(self, message: str) -> None:
+        if self.verbose:
+            warnings.warn(style.WARNING(message))
+
+    @property
+    def distance(self) -> int:
+        """Returns the number of commits since the tag, if any."""
+        if self.source == GIT and (match := DISTANCE_RE.search(self.tag)):
+            return int(match.group(1))
+        return 0
+
+    def as_dict(self) -> dict[str, str | int | None]:
+        """Returns the resolved revision as a dictionary.
+
+        This is the format of the frozen revision file.
+        """
+        revision = self.revision
+        git_values = [self.tag, self.branch, self.commit] if self.source == GIT else []
+        tag, branch, commit = git_values or [self._tag, self._branch, self._commit]
+        return dict(
+            revision=revision,
+            tag=tag,
+            branch=branch,
+            commit=commit,
+            distance=self.distance,
+            source=self.source,
+        )
+
+    def load(self, data: dict) -> None:
+        """Sets the resolved revision from a dictionary, see `as_dict`."""
+        self._revision_hash = None
+        self._tag = data.get("tag")
+        self._branch = data.get("branch")
+        self._commit = data.get("commit")
+        self.source = data.get("source")
+        # last, a reader that sees the revision also sees the rest
+        self._revision = data["revision"]
 
     def get_revision(self) -> str:
         return self.revision
@@ -111,27 +587,59 @@ class Revision:
 
     @property
     def repo(self):
+        """GitPython repo, imported on first use."""
         if not self._repo:
-            if not get_git_dir().exists():
+            from git import GitCmdObjectDB, InvalidGitRepositoryError, Repo
+
+            if not self.git_dir.exists():
                 raise RevisionGitDirDoesNotExist(
                     "Unable to determine the revision number. "
-                    f"Invalid GIT_DIR or BASE_DIR. Got {get_git_dir()}."
+                    f"Invalid GIT_DIR or BASE_DIR. Got {self.git_dir}."
                 )
             else:
                 try:
-                    self._repo = Repo(str(get_git_dir()), odbt=GitCmdObjectDB)
+                    self._repo = Repo(str(self.git_dir), odbt=GitCmdObjectDB)
+                    self._open.add(self)
                 except InvalidGitRepositoryError:
                     raise RevisionGitError(
                         "Unable to determine the revision number. settings.GIT_DIR is "
                         "not a git repository. Check the folder or set "
                         "`settings.DJANGO_REVISION_IGNORE_WORKING_DIR=True. "
-                        f"Got `settings.GIT_DIR={get_git_dir()}`"
+                        f"Got `settings.GIT_DIR={self.git_dir}`"
                     )
         return self._repo
 
+    def discover_first(self) -> None:
+        """Discovers the revision first so that tag, branch and commit
+        come from the same source, e.g. a shared or frozen revision.
+        """
+        if not self._revision and not self._discovering:
+            self.revision  # noqa: B018
+
+    @property
+    def git_reader(self) -> GitReader:
+        """Pure-python reader of the `.git` directory.
+
+        Used instead of `repo` if settings.DJANGO_REVISION_GIT_BACKEND="native".
+        """
+        if not self._git_reader:
+            if not self.git_dir.exists():
+                raise RevisionGitDirDoesNotExist(
+                    "Unable to determine the revision number. "
+                    f"Invalid GIT_DIR or BASE_DIR. Got {self.git_dir}."
+                )
+            self._git_reader = GitReader(self.git_dir)
+            self._open.add(self)
+        return self._git_reader
+
     @property
     def branch(self):
-        if not self._branch:
+        self.discover_first()
+        if self._pinned:
+            return self._branch
+        if not self._branch and self.git_backend == NATIVE:
+            self._branch = self.git_reader.branch
+        elif not self._branch:
             try:
                 self._branch = str(self.repo.active_branch)
             except TypeError:
@@ -140,7 +648,12 @@ class Revision:
 
     @property
     def commit(self):
-        if not self._commit:
+        self.discover_first()
+        if self._pinned:
+            return self._commit
+        if not self._commit and self.git_backend == NATIVE:
+            self._commit = self.git_reader.commit
+        elif not self._commit:
             try:
                 self._commit = str(self.repo.active_branch.commit)
             except TypeError:
@@ -149,23 +662,125 @@ class Revision:
 
     @property
     def tag(self) -> str:
-        if not self._tag:
+        self.discover_first()
+        if not self._tag and not self._pinned:
             try:
-                self._tag = self.repo.git.describe(tags=True)
-            except GitCommandError:
-                try:
-                    self._tag = str(self.repo.head.reference.commit)
-                except TypeError as e:
-                    if "HEAD is a detached" not in str(e):
-                        raise RevisionError(e)
-                    self._tag = "detached"
-            except (AttributeError, GitCommandError):
-                try:
-                    self._tag = self.repo.tag
-                except AttributeError:
-                    self._tag = ""
+                self._tag = self.describe()
+            except RevisionDescribeTimeout as e:
+                if get_describe_fallback() != COMMIT_ONLY:
+                    raise
+                self.warn(f"{e} Using the commit instead.")
+                self._tag = self.commit[:FALLBACK_DEFAULT_ABBREV]
         return self._tag
 
+    def describe(self) -> str:
+        """Returns the most recent tag, as `git describe --tags`.
+
+        Limited to settings.DJANGO_REVISION_DESCRIBE_CANDIDATES and, if
+        set, settings.DJANGO_REVISION_DESCRIBE_TIMEOUT seconds, else
+        raises RevisionDescribeTimeout.
+
+        If settings.DJANGO_REVISION_DESCRIBE_CACHE_FILE is set, results
+        are kept by HEAD commit and tags so a commit is described once.
+        """
+        memo_key = self.get_describe_memo_key()
+        if memo_key and (
+            tag := read_cache_file(self.describe_cache_file).get(memo_key)
+        ):
+            return tag
+        if self.git_backend == NATIVE:
+            tag = self.describe_native()
+        else:
+            tag = self.describe_gitpython()
+        if memo_key:
+            self.write_describe_memo(memo_key, tag)
+        return tag
+
+    def describe_native(self) -> str:
+        timeout = get_describe_timeout()
+        return self.git_reader.describe(
+            get_describe_candidates(),
+            deadline=time.monotonic() + timeout if timeout else None,
+        ) or ("detached" if self.git_reader.is_detached else self.git_reader.commit)
+
+    def describe_gitpython(self) -> str:
+        from git import GitCommandError
 
-if getattr(settings, "DJANGO_REVISION_AUTODISCOVER", True):
-    site_revision = Revision()
+        timeout = get_describe_timeout()
+        start = time.monotonic()
+        try:
+            return self.repo.git.describe(
+                tags=True,
+                candidates=get_describe_candidates(),
+                **({"kill_after_timeout": timeout} if timeout else {}),
+            )
+        except GitCommandError:
+            if timeout and time.monotonic() - start >= timeout:
+                raise RevisionDescribeTimeout(
+                    f"git describe did not complete in {timeout}s. Got {self.git_dir}."
+                )
+            try:
+                return str(self.repo.head.reference.commit)
+            except TypeError as e:
+                if "HEAD is a detached" not in str(e):
+                    raise RevisionError(e)
+                return "detached"
+        except AttributeError:
+            try:
+                return self.repo.tag
+            except AttributeError:
+                return ""
+
+    @property
+    def describe_cache_file(self) -> Path | None:
+        return get_describe_cache_file()
+
+    def get_describe_memo_key(self) -> str | None:
+        """Returns "<HEAD sha>:<candidates>:<hash of tags>", None if
+        the memo is not enabled.
+        """
+        if not self.describe_cache_file:
+            return None
+        tags = hashlib.blake2b(
+            repr(sorted(self.git_reader.tag_refs().items())).encode(), digest_size=8
+        ).hexdigest()
+        return f"{self.git_reader.commit}:{get_describe_candidates()}:{tags}"
+
+    def write_describe_memo(self, memo_key: str, tag: str) -> None:
+        data = read_cache_file(self.describe_cache_file)
+        data.pop(memo_key, None)
+        data[memo_key] = tag
+        data = dict(list(data.items())[-DESCRIBE_MEMO_SIZE:])
+        try:
+            write_atomic(self.describe_cache_file, json.dumps(data, indent=2))
+        except OSError as e:
+            self.warn(f"Unable to write cache file {self.describe_cache_file}. Got {e}")
+
+
+# does no I/O and does not import GitPython until first read
+site_revision = Revision()
+
+
+def release_before_fork() -> None:
+    """Closes open repos so that a forked child, e.g. a gunicorn or
+    Celery prefork worker, does not inherit live git pipes.
+    """
+    for revision in list(Revision._open):
+        if not revision._discovering:
+            revision.release()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=release_before_fork)
+
+
+@receiver(setting_changed)
+def reset_site_revision(*, setting: str, **kwargs) -> None:
+    """Discover again after settings that affect discovery change,
+    for example, with `override_settings` in tests.
+    """
+    if setting in ["BASE_DIR", "GIT_DIR", "APP_NAME", "REVISION"] or setting.startswith(
+        "DJANGO_REVISION_"
+    ):
+        Revision.clear_cache()
+        site_revision.reconfigure()
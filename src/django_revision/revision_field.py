@@ -1,9 +1,60 @@
-from django.db.models import CharField
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router, transaction
+from django.db.models import PROTECT, BigIntegerField, CharField, ForeignKey
+from django.utils.functional import cached_property
 
+from .composite import site_components
+from .constants import COMPOSITE, PRE_SAVE
 from .revision import site_revision
+from .seen_revisions import add_seen_revision
+from .stats import revision_stats
+from .utils import get_revision_ordinal
+from .watermarks import revision_watermarks
 
 
-class RevisionField(CharField):
+class SeenRevisionsMixin:
+    """Adds a revision to the revisions seen for the model the first
+    time the field stamps it in this process, see seen_revisions.py.
+
+    The revision is added once the transaction commits, so a revision
+    whose rows were rolled back is not listed. Until then, the revision
+    is pending and further saves in the transaction do not register
+    another callback.
+    """
+
+    @cached_property
+    def seen(self) -> set[str]:
+        return set()
+
+    @cached_property
+    def pending_seen(self) -> dict[str, tuple[str, list]]:
+        """{revision: (alias, the on_commit callbacks of that alias)}.
+
+        Django replaces the list of callbacks on commit or rollback, so
+        a pending revision whose transaction ended is registered again.
+        """
+        return {}
+
+    def add_seen(self, model, revision: str, using: str | None = None) -> None:
+        if pending := self.pending_seen.get(revision):
+            alias, callbacks = pending
+            if callbacks is connections[alias].run_on_commit:
+                return
+        using = using or router.db_for_write(model.__class__, instance=model)
+
+        def add():
+            self.pending_seen.pop(revision, None)
+            if revision not in self.seen:
+                self.seen.add(revision)
+                add_seen_revision(self.model, self, using, revision)
+
+        transaction.on_commit(add, using=using)
+        if (connection := connections[using]).in_atomic_block:
+            self.pending_seen[revision] = (using, connection.run_on_commit)
+
+
+class RevisionField(SeenRevisionsMixin, CharField):
     """Updates the revision number.
 
     Value is discovered from the current git branch and commit,
@@ -11,11 +62,17 @@ class RevisionField(CharField):
     VERSION file, or from settings.REVISION.
 
     See also the settings attributes that control discovery.
+
+    To store the revision of a component of the composite revision
+    instead, set `component` to its name in
+    settings.DJANGO_REVISION_COMPONENTS, or to COMPOSITE for the
+    combined stamp.
     """
 
     description = "RevisionField"
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, component: str | None = None, **kwargs):
+        self.component = component
         kwargs.setdefault("editable", False)
         kwargs.setdefault("blank", True)
         kwargs.setdefault("null", True)
@@ -24,9 +81,135 @@ class RevisionField(CharField):
         super().__init__(*args, **kwargs)
 
     def pre_save(self, model, add):
-        value = site_revision.revision
+        if revision_stats.enabled:
+            revision_stats.incr(PRE_SAVE)
+        if self.component is None:
+            value = site_revision.revision
+        else:
+            value = self.get_revision_value(None)
         setattr(model, self.attname, value)
+        if value not in self.seen:
+            self.add_seen(model, value)
+        if revision_watermarks.enabled:
+            revision_watermarks.record_instance(model, value)
         return value
 
+    def get_revision_value(self, using: str | None) -> str:
+        """Returns the value to store for the current revision."""
+        if self.component is None:
+            return site_revision.revision
+        if self.component == COMPOSITE:
+            return site_components.stamp[: self.max_length]
+        return site_components[self.component].revision
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.component is not None:
+            kwargs["component"] = self.component
+        return name, path, args, kwargs
+
     def get_internal_type(self):
         return "CharField"
+
+
+class RevisionForeignKey(SeenRevisionsMixin, ForeignKey):
+    """Updates the revision as a foreign key to RevisionLookup.
+
+    Stores a small integer per row instead of the full revision
+    string. The RevisionLookup row is created once per process and
+    revision and cached.
+
+    See also RevisionForeignKeyModelMixin.
+    """
+
+    description = "RevisionForeignKey"
+
+    def __init__(
+        self, to="django_revision.RevisionLookup", on_delete=PROTECT, **kwargs
+    ):
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("null", True)
+        kwargs.setdefault("related_name", "+")
+        kwargs.setdefault("verbose_name", "Revision")
+        super().__init__(to, on_delete, **kwargs)
+
+    def pre_save(self, model, add):
+        if revision_stats.enabled:
+            revision_stats.incr(PRE_SAVE)
+        using = router.db_for_write(model.__class__, instance=model)
+        value = self.get_revision_value(using)
+        setattr(model, self.attname, value)
+        if (revision := site_revision.revision) not in self.seen:
+            self.add_seen(model, revision, using)
+        if revision_watermarks.enabled:
+            revision_watermarks.record_instance(model, revision)
+        return value
+
+    def get_revision_value(self, using: str) -> int:
+        """Returns the RevisionLookup id of the current revision."""
+        manager = self.remote_field.model._default_manager
+        return manager.db_manager(using).get_id(site_revision.revision)
+
+
+class RevisionOrdinalField(BigIntegerField):
+    """A sortable, indexed companion of a RevisionField.
+
+    Stores the version number and the distance from the tag of the
+    revision as an integer, see `get_revision_ordinal`, so that these
+    lookups on either field are range scans on this index:
+
+        TestModel.objects.filter(revision__before="1.4.0")
+        TestModel.objects.filter(revision__after="1.4.0")
+        TestModel.objects.filter(revision__between=("1.3.0", "1.4.0"))
+        TestModel.objects.filter(revision__tag="1.4.0")
+
+    Null if the revision does not start with a version number.
+    """
+
+    description = "RevisionOrdinalField"
+
+    def __init__(self, *args, revision_field: str = "revision", **kwargs):
+        self.revision_field = revision_field
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("null", True)
+        kwargs.setdefault("db_index", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.revision_field != "revision":
+            kwargs["revision_field"] = self.revision_field
+        return name, path, args, kwargs
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_revision_field()]
+
+    def _check_revision_field(self) -> list[checks.Error]:
+        try:
+            field = self.model._meta.get_field(self.revision_field)
+        except FieldDoesNotExist:
+            field = None
+        if not isinstance(field, RevisionField):
+            return [
+                checks.Error(
+                    f"'revision_field' must name a RevisionField of "
+                    f"{self.model.__name__}. Got {self.revision_field!r}.",
+                    obj=self,
+                    id="django_revision.E004",
+                )
+            ]
+        return []
+
+    def pre_save(self, model, add):
+        value = self.get_revision_value(None)
+        setattr(model, self.attname, value)
+        return value
+
+    def get_revision_value(self, using: str | None) -> int | None:
+        """Returns the ordinal of the revision stored by the
+        RevisionField.
+        """
+        field = self.model._meta.get_field(self.revision_field)
+        return get_revision_ordinal(field.get_revision_value(using))
@@ -0,0 +1,84 @@
+"""The distinct revisions stored per model and field, for the choices
+of RevisionListFilter, without a `SELECT DISTINCT` per request.
+
+The set is read once with an aggregate query and kept in the cache
+settings.DJANGO_REVISION_SEEN_CACHE for
+settings.DJANGO_REVISION_SEEN_TIMEOUT seconds. In between, the field's
+`pre_save` adds a revision the first time it is stamped in the process,
+once the transaction commits. Rows written without the ORM show once the
+entry expires.
+
+The set is approximate: adding a revision reads and writes the cache
+entry without a lock, so a revision added by another process at the
+same time may be missing until the entry expires.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.cache import caches
+from django.db import router
+from django.db.models import Exists, Field, Model, OuterRef
+
+from .utils import get_seen_revisions_cache, get_seen_revisions_timeout
+
+__all__ = ["add_seen_revision", "get_seen_revisions"]
+
+
+def get_seen_key(model: type[Model], field: Field, using: str) -> str:
+    return f"django_revision:seen:{using}:{model._meta.label_lower}.{field.name}"
+
+
+def get_seen_revisions(model: type[Model], field: Field, using: str) -> list[str]:
+    """Returns the distinct revisions of `field`, from the cache or
+    counted on `using` once per timeout.
+
+    The entry is keyed by the alias `pre_save` writes to, so that a
+    revision added on the primary shows when reading from a replica.
+    """
+    cache = caches[get_seen_revisions_cache()]
+    key = get_seen_key(model, field, router.db_for_write(model))
+    if entry := cache.get(key):
+        return entry["revisions"]
+    revisions = query_revisions(model, field, using)
+    timeout = get_seen_revisions_timeout()
+    cache.set(
+        key, dict(expires=time.time() + timeout, revisions=revisions), timeout=timeout
+    )
+    return revisions
+
+
+def add_seen_revision(
+    model: type[Model], field: Field, using: str, revision: str
+) -> None:
+    """Adds `revision` to the cached revisions of `field`, if cached,
+    keeping the expiry.
+    """
+    cache = caches[get_seen_revisions_cache()]
+    key = get_seen_key(model, field, using)
+    entry = cache.get(key)
+    if entry and revision not in entry["revisions"]:
+        timeout = entry["expires"] - time.time()
+        if timeout > 0:
+            entry["revisions"] = [*entry["revisions"], revision]
+            cache.set(key, entry, timeout=timeout)
+
+
+def query_revisions(model: type[Model], field: Field, using: str) -> list[str]:
+    if field.is_relation:
+        # one index probe per row of the small RevisionLookup table
+        rows = model._base_manager.using(using).filter(
+            **{field.attname: OuterRef("pk")}
+        )
+        queryset = field.remote_field.model._default_manager.using(using).filter(
+            Exists(rows)
+        )
+        return list(queryset.values_list("revision", flat=True))
+    return list(
+        model._base_manager.using(using)
+        .exclude(**{f"{field.attname}__isnull": True})
+        .order_by()
+        .values_list(field.attname, flat=True)
+        .distinct()
+    )
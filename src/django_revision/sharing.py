@@ -0,0 +1,89 @@
+"""Resolve the revision once in a parent process and share it with
+pre-forked children through an inherited environment variable.
+
+For gunicorn, in `gunicorn.conf.py`:
+
+    from django_revision.sharing import on_reload, on_starting, post_fork
+
+For Celery prefork, in the module that creates the Celery app:
+
+    from django_revision.sharing import connect_celery_signals
+
+    connect_celery_signals()
+
+Any child process, including subprocesses, reads the published
+revision before any other source without file or subprocess I/O.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+from .constants import SHARED_ENV_VAR
+from .revision import Revision, site_revision
+from .utils import get_revision_from_environ
+
+__all__ = [
+    "adopt",
+    "connect_celery_signals",
+    "on_reload",
+    "on_starting",
+    "post_fork",
+    "publish",
+]
+
+
+def publish(revision: Revision | None = None) -> dict:
+    """Resolves the revision and publishes it in `os.environ`."""
+    data = (revision or site_revision).as_dict()
+    os.environ[SHARED_ENV_VAR] = json.dumps(data)
+    return data
+
+
+def adopt(revision: Revision | None = None) -> bool:
+    """Loads the published revision, if any, into `revision`."""
+    if data := get_revision_from_environ():
+        (revision or site_revision).load(data)
+        return True
+    return False
+
+
+def on_starting(server) -> None:
+    """gunicorn `on_starting` hook, runs in the master process."""
+    publish()
+
+
+def on_reload(server) -> None:
+    """gunicorn `on_reload` hook, runs in the master process on HUP.
+
+    Discovers the revision again, for example, after a deploy, and
+    publishes it for the new workers.
+    """
+    os.environ.pop(SHARED_ENV_VAR, None)
+    Revision.clear_cache()
+    site_revision.reset()
+    publish()
+
+
+def post_fork(server, worker) -> None:
+    """gunicorn `post_fork` hook, runs in each worker."""
+    adopt()
+
+
+def celery_worker_init(**kwargs) -> None:
+    publish()
+
+
+def celery_worker_process_init(**kwargs) -> None:
+    adopt()
+
+
+def connect_celery_signals() -> None:
+    """Publishes on `worker_init` (parent) and adopts on
+    `worker_process_init` (each prefork child).
+    """
+    from celery.signals import worker_init, worker_process_init
+
+    worker_init.connect(celery_worker_init, weak=False)
+    worker_process_init.connect(celery_worker_process_init, weak=False)
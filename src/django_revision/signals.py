@@ -0,0 +1,8 @@
+from django.dispatch import Signal
+
+# sent after a Revision discovers its value, with arguments:
+#   instance: the Revision
+#   revision: the revision string
+#   source: the source the revision came from, e.g. "git"
+#   timings: {step: seconds} for each discovery step tried, in order
+revision_discovered = Signal()
@@ -0,0 +1,189 @@
+"""Sources of the revision number, tried in order by `Revision.discover`.
+
+The order is settings.DJANGO_REVISION_SOURCES, a list of source names
+(see SOURCES) or dotted paths to RevisionSource subclasses:
+
+    DJANGO_REVISION_SOURCES = [
+        "environ",
+        "frozen_file",
+        "version_file",
+        "myapp.sources.ConsulSource",
+    ]
+
+Each source declares its relative `cost` so that `check_for_sources`
+can warn if an expensive source is tried before a cheap one.
+"""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from django.utils.module_loading import import_string
+
+from .constants import (
+    ENVIRON,
+    FROZEN_FILE,
+    GIT,
+    METADATA,
+    SETTINGS,
+    SHARED,
+    TOML_FILE,
+    VERSION_FILE,
+)
+from .utils import get_revision_env_var, get_source_names
+
+if TYPE_CHECKING:
+    from .revision import Revision
+
+__all__ = [
+    "DEFAULT_SOURCES",
+    "SOURCES",
+    "RevisionSource",
+    "get_sources",
+]
+
+# relative costs
+NO_IO = 0
+READS_FILE = 10
+PARSES_FILE = 20
+SCANS_PACKAGES = 50
+RUNS_GIT = 100
+
+
+class RevisionSource(ABC):
+    """A source of the revision number.
+
+    Subclasses set `name` and `cost` and implement `get` to return
+    (revision, name), or None to try the next source. Values other than the
+    revision may be set on the Revision with `revision.load()`.
+    """
+
+    name: str = None
+    cost: int = NO_IO
+
+    def __init__(self, revision: Revision):
+        self.revision = revision
+
+    @abstractmethod
+    def get(self) -> tuple[str, str] | None:
+        pass
+
+
+class SharedSource(RevisionSource):
+    """The revision published by a parent process, see sharing.py."""
+
+    name = SHARED
+    cost = NO_IO
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_shared()
+
+
+class EnvironSource(RevisionSource):
+    """A revision string set in the environment, for example, by an
+    orchestrator. The variable is settings.DJANGO_REVISION_ENV_VAR or
+    APP_REVISION.
+    """
+
+    name = ENVIRON
+    cost = NO_IO
+
+    def get(self) -> tuple[str, str] | None:
+        if value := os.environ.get(get_revision_env_var(), "").strip():
+            self.revision.warn(
+                f"Getting revision number from environ {get_revision_env_var()}"
+            )
+            return value[: self.revision.max_length], ENVIRON
+        return None
+
+
+class FrozenFileSource(RevisionSource):
+    name = FROZEN_FILE
+    cost = READS_FILE
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_frozen_file()
+
+
+class GitSource(RevisionSource):
+    name = GIT
+    cost = RUNS_GIT
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_git()
+
+
+class MetadataSource(RevisionSource):
+    name = METADATA
+    cost = SCANS_PACKAGES
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_metadata()
+
+
+class TomlFileSource(RevisionSource):
+    name = TOML_FILE
+    cost = PARSES_FILE
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_toml_file()
+
+
+class VersionFileSource(RevisionSource):
+    name = VERSION_FILE
+    cost = READS_FILE
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_version_file()
+
+
+class SettingsSource(RevisionSource):
+    name = SETTINGS
+    cost = NO_IO
+
+    def get(self) -> tuple[str, str] | None:
+        return self.revision.from_settings()
+
+
+SOURCES: dict[str, type[RevisionSource]] = {
+    source.name: source
+    for source in [
+        SharedSource,
+        EnvironSource,
+        FrozenFileSource,
+        GitSource,
+        MetadataSource,
+        TomlFileSource,
+        VersionFileSource,
+        SettingsSource,
+    ]
+}
+
+# the order if settings.DJANGO_REVISION_SOURCES is not set, by
+# precedence, not cost, so not checked by `check_for_sources`
+DEFAULT_SOURCES = [
+    SHARED,
+    FROZEN_FILE,
+    GIT,
+    METADATA,
+    TOML_FILE,
+    VERSION_FILE,
+    SETTINGS,
+]
+
+
+def get_source(name: str) -> type[RevisionSource]:
+    """Returns the source class of a name in SOURCES or a dotted path."""
+    if name in SOURCES:
+        return SOURCES[name]
+    return import_string(name)
+
+
+def get_sources(names: list[str] | None = None) -> list[type[RevisionSource]]:
+    """Returns the source classes of `names`, by default the sources in
+    the order they are tried.
+    """
+    names = names or get_source_names() or DEFAULT_SOURCES
+    return [get_source(name) for name in names]
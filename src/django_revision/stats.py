@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .constants import BULK, DISCOVERIES, PRE_SAVE, REFRESH_CHECKS, REFRESHES
+from .signals import revision_discovered
+from .utils import stats_enabled
+
+COUNTERS = [PRE_SAVE, BULK, DISCOVERIES, REFRESH_CHECKS, REFRESHES]
+
+
+class RevisionStats:
+    """In-process counters and the timings of the last discovery.
+
+    Disabled by default. Enable with settings.DJANGO_REVISION_STATS=True.
+    Callers check `enabled` before calling `incr` so that nothing is
+    allocated or locked on the hot path when disabled.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.revision = None
+        self.source = None
+        self.discovery_timings = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += count
+
+    def record_discovery(self, revision: str, source: str, timings: dict) -> None:
+        with self._lock:
+            self.counters[DISCOVERIES] += 1
+            self.revision = revision
+            self.source = source
+            self.discovery_timings = dict(timings)
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the current stats."""
+        with self._lock:
+            return dict(
+                enabled=self.enabled,
+                revision=self.revision,
+                source=self.source,
+                discovery_timings=dict(self.discovery_timings),
+                counters=dict(self.counters),
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters = dict.fromkeys(COUNTERS, 0)
+            self.revision = None
+            self.source = None
+            self.discovery_timings = {}
+
+    def as_prometheus(self) -> str:
+        """Returns the stats in the Prometheus text exposition format."""
+        stats = self.snapshot()
+        lines = [
+            "# HELP django_revision_info The revision and the source it came from.",
+            "# TYPE django_revision_info gauge",
+        ]
+        if stats["revision"]:
+            lines.append(
+                "django_revision_info{"
+                f'revision="{escape(stats["revision"])}",'
+                f'source="{escape(stats["source"])}"'
+                "} 1"
+            )
+        lines.extend(
+            [
+                "# HELP django_revision_discovery_seconds Time taken by each "
+                "step of the last discovery.",
+                "# TYPE django_revision_discovery_seconds gauge",
+            ]
+        )
+        for step, seconds in stats["discovery_timings"].items():
+            lines.append(
+                "django_revision_discovery_seconds"
+                f'{{step="{escape(step)}"}} {seconds!r}'
+            )
+        for name, value in stats["counters"].items():
+            lines.extend(
+                [
+                    f"# TYPE django_revision_{name}_total counter",
+                    f"django_revision_{name}_total {value}",
+                ]
+            )
+        return "\n".join(lines) + "\n"
+
+
+def escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+revision_stats = RevisionStats()
+
+
+@receiver(revision_discovered)
+def record_discovery(*, revision: str, source: str, timings: dict, **kwargs) -> None:
+    if revision_stats.enabled:
+        revision_stats.record_discovery(revision, source, timings)
+
+
+@receiver(setting_changed)
+def update_stats_enabled(*, setting: str, **kwargs) -> None:
+    if setting == "DJANGO_REVISION_STATS":
+        revision_stats.enabled = stats_enabled()
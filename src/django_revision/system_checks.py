@@ -1,7 +1,8 @@
-from django.core.checks import CheckMessage, Error
+from django.core.checks import CheckMessage, Error, Warning
 from django.core.management import color_style
 
-from django_revision import Revision
+from django_revision import site_revision
+from django_revision.composite import site_components
 from django_revision.exceptions import (
     RevisionError,
     RevisionGitDirDoesNotExist,
@@ -9,24 +10,31 @@ from django_revision.exceptions import (
     RevisionPackageNotFoundError,
     RevisionTomlError,
 )
+from django_revision.sources import RevisionSource, SettingsSource, get_source
+from django_revision.utils import get_source_names
 
 style = color_style()
 
-__all__ = ["check_for_revision"]
+__all__ = ["check_for_components", "check_for_revision", "check_for_sources"]
+
+REVISION_ERRORS = (
+    RevisionError,
+    RevisionGitError,
+    RevisionGitDirDoesNotExist,
+    RevisionPackageNotFoundError,
+    RevisionTomlError,
+)
 
 
 def check_for_revision(app_configs, **kwargs) -> list[CheckMessage]:
+    """Reports an error if the revision of `site_revision` cannot be
+    determined.
+    """
     errors = []
 
     try:
-        str(Revision(verbose=True))
-    except (
-        RevisionError,
-        RevisionGitError,
-        RevisionGitDirDoesNotExist,
-        RevisionPackageNotFoundError,
-        RevisionTomlError,
-    ):
+        site_revision.revision
+    except REVISION_ERRORS:
         errors.append(
             Error(
                 "Unable to determine the application revision. ",
@@ -34,3 +42,64 @@ def check_for_revision(app_configs, **kwargs) -> list[CheckMessage]:
             )
         )
     return errors
+
+
+def check_for_components(app_configs, **kwargs) -> list[CheckMessage]:
+    """Checks each component in settings.DJANGO_REVISION_COMPONENTS."""
+    errors = []
+    try:
+        # concurrently, errors are reported per component below
+        site_components.resolve()
+    except REVISION_ERRORS:
+        pass
+    for name, component in site_components.components.items():
+        try:
+            str(component)
+        except REVISION_ERRORS:
+            errors.append(
+                Error(
+                    f"Unable to determine the revision of component `{name}`. ",
+                    id="django_revision.E002",
+                )
+            )
+    return errors
+
+
+def check_for_sources(app_configs, **kwargs) -> list[CheckMessage]:
+    """Checks settings.DJANGO_REVISION_SOURCES.
+
+    Warns if a source is tried before a cheaper one, except for a
+    trailing `settings`, a fallback. DEFAULT_SOURCES is not checked,
+    it is ordered by precedence.
+    """
+    errors = []
+    sources = []
+    for name in get_source_names() or []:
+        try:
+            source = get_source(name)
+        except ImportError:
+            source = None
+        if not (isinstance(source, type) and issubclass(source, RevisionSource)):
+            errors.append(
+                Error(
+                    f"Invalid revision source `{name}`. Expected a name of a "
+                    "built-in source or a dotted path to a RevisionSource.",
+                    id="django_revision.E003",
+                )
+            )
+        else:
+            sources.append(source)
+    if sources and sources[-1] is SettingsSource:
+        sources.pop()
+    for i, source in enumerate(sources):
+        if cheaper := [other for other in sources[i + 1 :] if other.cost < source.cost]:
+            errors.append(
+                Warning(
+                    f"Revision source `{source.name}` (cost {source.cost}) is "
+                    f"tried before the cheaper `{cheaper[0].name}` "
+                    f"(cost {cheaper[0].cost}).",
+                    hint="Reorder settings.DJANGO_REVISION_SOURCES, cheap first.",
+                    id="django_revision.W001",
+                )
+            )
+    return errors
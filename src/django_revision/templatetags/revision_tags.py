@@ -1,5 +1,6 @@
 from django import template
 
+from ..composite import site_components
 from ..revision import site_revision
 
 register = template.Library()
@@ -27,3 +28,23 @@ def revision_branch():
 def revision_commit():
     """Returns the git site_revision."""
     return f"{site_revision.commit}"
+
+
+@register.simple_tag
+def revision_hash():
+    """Returns a short hash of the site_revision, for example, to vary
+    a cached template fragment by revision.
+    """
+    return site_revision.revision_hash
+
+
+@register.simple_tag
+def revision_component(name):
+    """Returns the revision of a component of the composite revision."""
+    return f"{site_components[name].revision}"
+
+
+@register.simple_tag
+def revision_components():
+    """Returns the combined stamp of the composite revision."""
+    return f"{site_components.stamp}"
@@ -0,0 +1,82 @@
+"""Pin the revision in tests, with no git or file I/O.
+
+As a decorator or context manager:
+
+    from django_revision.testing import override_revision
+
+    @override_revision("1.2.0")
+    class MyTests(TestCase):
+        def test_stamp(self):
+            self.assertEqual(MyModel.objects.create().revision, "1.2.0")
+
+        @override_revision("1.3.0-2-gabcdef0", branch="main", commit="abcdef0")
+        def test_other(self):
+            ...
+
+Or, for the whole test run, in the test settings:
+
+    DJANGO_REVISION_SOURCES = ["django_revision.testing.TestSource"]
+    DJANGO_REVISION_TEST_REVISION = "1.2.0"  # optional
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.test.utils import TestContextDecorator
+
+from .constants import TEST
+from .revision import Revision
+from .sources import NO_IO, RevisionSource
+
+__all__ = ["DEFAULT_TEST_REVISION", "TestSource", "override_revision"]
+
+DEFAULT_TEST_REVISION = "0.0.0"
+
+
+class TestSource(RevisionSource):
+    """Returns settings.DJANGO_REVISION_TEST_REVISION or
+    DEFAULT_TEST_REVISION.
+    """
+
+    name = TEST
+    cost = NO_IO
+
+    def get(self) -> tuple[str, str]:
+        revision = getattr(
+            settings, "DJANGO_REVISION_TEST_REVISION", DEFAULT_TEST_REVISION
+        )
+        return revision, self.name
+
+
+class override_revision(TestContextDecorator):
+    """Pins the values of `site_revision`, the components and every
+    other Revision instance while enabled.
+
+    Nothing is discovered, instances load the pinned values.
+    """
+
+    def __init__(
+        self,
+        revision: str = DEFAULT_TEST_REVISION,
+        *,
+        tag: str | None = None,
+        branch: str | None = None,
+        commit: str | None = None,
+        source: str = TEST,
+    ):
+        self.data = dict(
+            revision=revision,
+            tag=tag or revision,
+            branch=branch,
+            commit=commit,
+            source=source,
+        )
+        self.previous = None
+        super().__init__()
+
+    def enable(self) -> None:
+        self.previous = Revision._pinned
+        Revision.pin(self.data)
+
+    def disable(self) -> None:
+        Revision.pin(self.previous)
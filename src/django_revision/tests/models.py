@@ -1,8 +1,40 @@
 from django.db import models
 
-from django_revision.model_mixins import RevisionModelMixin
+from django_revision.managers import RevisionManager
+from django_revision.model_mixins import (
+    RevisionForeignKeyModelMixin,
+    RevisionModelMixin,
+)
+from django_revision.revision_field import (
+    RevisionField,
+    RevisionForeignKey,
+    RevisionOrdinalField,
+)
 
 
 class TestModel(RevisionModelMixin, models.Model):
 
-    pass
+    name = models.CharField(max_length=25, null=True)
+
+    objects = RevisionManager()
+
+
+class TestLookupModel(RevisionForeignKeyModelMixin, models.Model):
+
+    name = models.CharField(max_length=25, null=True)
+
+    objects = RevisionManager()
+
+
+class TestConvertModel(models.Model):
+
+    revision = RevisionField()
+
+    revision_lookup = RevisionForeignKey()
+
+
+class TestOrdinalModel(RevisionModelMixin, models.Model):
+
+    revision_ordinal = RevisionOrdinalField()
+
+    objects = RevisionManager()
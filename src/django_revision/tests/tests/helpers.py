@@ -0,0 +1,42 @@
+import os
+import tempfile
+
+import git
+
+# ignore the sources of this checkout, the revision comes from settings
+SETTINGS = dict(
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+
+
+def init_repo() -> git.Repo:
+    repo = git.Repo.init(tempfile.mkdtemp())
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+    return repo
+
+
+def commit_file(repo, filename: str, content: str = None, date: str = None):
+    with open(os.path.join(repo.working_dir, filename), "w") as f:
+        f.write(content or filename)
+    repo.index.add([filename])
+    return repo.index.commit(f"add {filename}", commit_date=date, author_date=date)
+
+
+def create_repo_with_history() -> git.Repo:
+    repo = init_repo()
+    for i in range(3):
+        commit_file(repo, f"file{i}.txt", date=f"2024-01-0{i + 1}T00:00:00")
+    repo.create_tag("0.1.0")
+    repo.create_tag("0.1.0-annotated", message="release 0.1.0")
+    for i in range(3, 6):
+        commit_file(repo, f"file{i}.txt", date=f"2024-01-0{i + 1}T00:00:00")
+    repo.create_tag("0.2.0", message="release 0.2.0")
+    for i in range(6, 9):
+        commit_file(repo, f"file{i}.txt", date=f"2024-01-0{i + 1}T00:00:00")
+    return repo
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+
+from .helpers import create_repo_with_history
+
+
+class TestAsyncRevision(TestCase):
+    def setUp(self):
+        self.repo = create_repo_with_history()
+
+    async def test_aresolve(self):
+        threads = []
+        discover = Revision.discover
+
+        def side_effect(revision):
+            threads.append(threading.get_ident())
+            return discover(revision)
+
+        with (
+            override_settings(REVISION=None, GIT_DIR=self.repo.working_dir),
+            patch.object(Revision, "discover", autospec=True, side_effect=side_effect),
+        ):
+            revision = Revision()
+            results = await asyncio.gather(*[revision.aresolve() for _ in range(10)])
+            self.assertEqual(len(set(results)), 1)
+            self.assertTrue(results[0].startswith("0.2.0-3-g"))
+            self.assertEqual(len(threads), 1)
+            self.assertNotEqual(threads[0], threading.get_ident())
+            self.assertEqual(await revision.atag(), revision.tag)
+            self.assertEqual(await revision.abranch(), self.repo.active_branch.name)
+            self.assertEqual(await revision.acommit(), self.repo.head.commit.hexsha)
+            data = await revision.aas_dict()
+            self.assertEqual(data["revision"], results[0])
+            self.assertEqual(data["distance"], 3)
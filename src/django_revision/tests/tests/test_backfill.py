@@ -0,0 +1,105 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision.utils import get_revision_ordinal
+
+from ..models import TestModel, TestOrdinalModel
+
+
+def backfill(*args, **options) -> str:
+    out = StringIO()
+    call_command(
+        "revision_backfill",
+        "django_revision.testmodel",
+        "django_revision.testordinalmodel",
+        *args,
+        databases=["default"],
+        stdout=out,
+        **options,
+    )
+    return out.getvalue()
+
+
+@override_settings(
+    REVISION="2.0.0",
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+class TestRevisionBackfill(TestCase):
+    def setUp(self):
+        self.checkpoint = Path(tempfile.mkdtemp()) / "checkpoint.json"
+        for value in [None, None, None, "1.4.0-2-gabc1234:main:abc", "old", "2.0.0"]:
+            for model in [TestModel, TestOrdinalModel]:
+                obj = model.objects.create()
+                model._base_manager.filter(pk=obj.pk).update(revision=value)
+
+    def test_backfill(self):
+        output = backfill(
+            null_value="1.0.0",
+            mappings=["old=1.1.0"],
+            batch_size=2,
+            checkpoint=str(self.checkpoint),
+        )
+        self.assertIn(
+            "Updated 4 rows of default:django_revision.testmodel.revision", output
+        )
+        for model in [TestModel, TestOrdinalModel]:
+            self.assertEqual(
+                sorted(model.objects.values_list("revision", flat=True)),
+                [
+                    "1.0.0",
+                    "1.0.0",
+                    "1.0.0",
+                    "1.1.0",
+                    "1.4.0-2-gabc1234:main:abc",
+                    "2.0.0",
+                ],
+            )
+        self.assertEqual(
+            TestOrdinalModel.objects.get(revision="1.1.0").revision_ordinal,
+            get_revision_ordinal("1.1.0"),
+        )
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_dry_run(self):
+        output = backfill(null_value="1.0.0", dry_run=True)
+        self.assertIn("Would update 3 rows", output)
+        self.assertEqual(TestModel.objects.filter(revision__isnull=True).count(), 3)
+
+    def test_resume(self):
+        with patch(
+            "django_revision.management.commands.revision_backfill.time.sleep",
+            side_effect=KeyboardInterrupt,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                backfill(
+                    null_value="1.0.0",
+                    batch_size=2,
+                    sleep=1,
+                    checkpoint=str(self.checkpoint),
+                )
+        checkpoint = json.loads(self.checkpoint.read_text())
+        self.assertEqual(
+            checkpoint["default:django_revision.testmodel.revision"]["done"], False
+        )
+        self.assertEqual(TestModel.objects.filter(revision__isnull=True).count(), 1)
+        output = backfill(null_value="1.0.0", checkpoint=str(self.checkpoint))
+        self.assertIn("Updated 1 rows of default:django_revision.testmodel.", output)
+        self.assertIn("Updated 3 rows of default:django_revision.testordinal", output)
+        self.assertEqual(TestModel.objects.filter(revision__isnull=True).count(), 0)
+
+    def test_nothing_to_do(self):
+        with self.assertRaises(CommandError):
+            backfill()
+        with self.assertRaises(CommandError):
+            backfill(mappings=["old"])
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.views.generic.base import ContextMixin
+
+from django_revision import Revision
+from django_revision.system_checks import check_for_revision
+from django_revision.views import RevisionMixin
+
+from .helpers import create_repo_with_history
+
+
+class TestRevisionCache(TestCase):
+    def setUp(self):
+        self.repo = create_repo_with_history()
+
+    def test_shared_by_configuration(self):
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            with patch.object(
+                Revision, "discover", autospec=True, side_effect=Revision.discover
+            ) as m:
+                first = Revision().revision
+                self.repo.create_tag("1.0.0")
+                self.assertEqual(Revision().revision, first)
+                self.assertEqual(Revision(verbose=True).tag, Revision().tag)
+                self.assertEqual(m.call_count, 1)
+                # a different configuration is not shared
+                self.assertTrue(Revision(max_length=10).revision.startswith("1.0.0"))
+                self.assertEqual(m.call_count, 2)
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            # changed settings clear the cache
+            self.assertTrue(Revision().revision.startswith("1.0.0:"))
+
+    def test_refresh_clears_cache(self):
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_REFRESH_INTERVAL=1e-9,
+        ):
+            revision = Revision()
+            self.assertTrue(revision.revision.startswith("0.2.0-3-g"))
+            self.repo.create_tag("1.0.0")
+            self.assertTrue(revision.revision.startswith("1.0.0:"))
+            self.assertTrue(Revision().revision.startswith("1.0.0:"))
+
+    def test_view_mixin_discovers_once(self):
+        class View(RevisionMixin, ContextMixin):
+            pass
+
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            with patch.object(
+                Revision, "discover", autospec=True, side_effect=Revision.discover
+            ) as m:
+                for _ in range(5):
+                    context = View().get_context_data()
+                self.assertTrue(context["revision"].startswith("0.2.0-3-g"))
+                self.assertEqual(m.call_count, 1)
+
+    def test_check(self):
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            self.assertEqual(check_for_revision(None), [])
+        with override_settings(REVISION=None, DJANGO_REVISION_SOURCES=["settings"]):
+            self.assertEqual(
+                [m.id for m in check_for_revision(None)], ["django_revision.E001"]
+            )
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.constants import GIT, SHARED_ENV_VAR
+
+from .helpers import create_repo_with_history
+
+
+class TestCacheFile(TestCase):
+    def setUp(self):
+        self.repo = create_repo_with_history()
+        self.path = Path(tempfile.mkdtemp()) / "revision_cache.json"
+
+    def discover_count(self) -> int:
+        """Returns the number of discoveries of a new Revision."""
+        Revision.clear_cache()
+        with patch.object(
+            Revision, "discover", autospec=True, side_effect=Revision.discover
+        ) as discover:
+            self.revision = Revision()
+            self.revision.revision  # noqa: B018
+        return discover.call_count
+
+    @patch.dict(os.environ)
+    def test_warm_start(self):
+        os.environ.pop(SHARED_ENV_VAR, None)
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_CACHE_FILE=self.path,
+        ):
+            self.assertEqual(self.discover_count(), 1)
+            expected = self.revision.as_dict()
+            self.assertEqual(len(json.loads(self.path.read_text())), 1)
+            self.assertEqual(self.discover_count(), 0)
+            self.assertEqual(self.revision.as_dict(), expected)
+            self.assertEqual(self.revision.source, GIT)
+            self.assertIsNone(self.revision._git_reader)
+            self.assertIsNone(self.revision._repo)
+
+            self.repo.create_tag("1.0.0")
+            self.assertEqual(self.discover_count(), 1)
+            self.assertTrue(self.revision.revision.startswith("1.0.0:"))
+            self.assertEqual(self.discover_count(), 0)
+
+        with override_settings(
+            REVISION="9.9.9",
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_CACHE_FILE=self.path,
+            DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+            DJANGO_REVISION_IGNORE_METADATA=True,
+            DJANGO_REVISION_IGNORE_TOML_FILE=True,
+            DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+        ):
+            # other settings, another entry
+            self.assertEqual(self.discover_count(), 1)
+            self.assertEqual(self.revision.revision, "9.9.9")
+            self.assertEqual(len(json.loads(self.path.read_text())), 2)
+
+    def test_not_used(self):
+        self.path.write_text("not json")
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_CACHE_FILE=self.path,
+        ):
+            with patch.dict(os.environ, {SHARED_ENV_VAR: ""}):
+                # a published revision is used instead
+                self.assertEqual(self.discover_count(), 1)
+                self.assertEqual(self.path.read_text(), "not json")
+            with patch.dict(os.environ):
+                os.environ.pop(SHARED_ENV_VAR, None)
+                self.assertEqual(self.discover_count(), 1)
+                self.assertEqual(self.discover_count(), 0)
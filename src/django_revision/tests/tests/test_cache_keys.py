@@ -0,0 +1,49 @@
+from django.core.cache import caches
+from django.template import Context, Template
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import site_revision
+from django_revision.cache import make_key, revision_fragment_key
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "KEY_FUNCTION": "django_revision.cache.make_key",
+    }
+}
+
+
+@override_settings(
+    CACHES=CACHES,
+    REVISION="1.0.0",
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+class TestCacheKeys(TestCase):
+    def test_make_key(self):
+        self.assertEqual(
+            make_key("key", "prefix", 1), f"prefix:1:{site_revision.revision_hash}:key"
+        )
+        self.assertEqual(len(site_revision.revision_hash), 12)
+
+    def test_new_keyspace_per_revision(self):
+        cache = caches["default"]
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        with override_settings(REVISION="1.0.1"):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key"), "value")
+
+    def test_fragment(self):
+        cache = caches["default"]
+        template = Template(
+            "{% load cache revision_tags %}{% revision_hash as rev %}"
+            "{% cache 500 sidebar name rev %}{{ name }}{% endcache %}"
+        )
+        self.assertEqual(template.render(Context({"name": "a"})), "a")
+        self.assertEqual(cache.get(revision_fragment_key("sidebar", ["a"])), "a")
+        self.assertTrue(cache.delete(revision_fragment_key("sidebar", ["a"])))
@@ -0,0 +1,91 @@
+import time
+import warnings
+from pathlib import Path
+from tempfile import gettempdir, mkdtemp
+from unittest.mock import patch
+
+from django.template import Context, Template
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.composite import CompositeRevision, site_components
+from django_revision.constants import COMPOSITE, GIT, METADATA, TOML_FILE
+from django_revision.revision_field import RevisionField
+from django_revision.system_checks import check_for_components
+
+from .helpers import commit_file, create_repo_with_history, init_repo
+
+
+class TestCompositeRevision(TestCase):
+    def setUp(self):
+        self.core = create_repo_with_history()
+        self.plugin = init_repo()
+        commit_file(self.plugin, "a.txt")
+        self.plugin.create_tag("0.4.1")
+        self.toml_path = Path(mkdtemp())
+        (self.toml_path / "pyproject.toml").write_text('[project]\nversion = "7.0.0"\n')
+        self.components = {
+            "core": {"git_dir": self.core.working_dir},
+            "plugin": {"git_dir": self.plugin.working_dir},
+            "django": {"app_name": "django"},
+            "legacy": {"toml_path": self.toml_path},
+        }
+
+    @override_settings(DJANGO_REVISION_IGNORE_WORKING_DIR=True)
+    def test_components(self):
+        composite = CompositeRevision(self.components)
+        revisions = composite.resolve()
+        self.assertTrue(revisions["core"].startswith("0.2.0-3-g"))
+        self.assertTrue(revisions["plugin"].startswith("0.4.1:"))
+        self.assertEqual(composite["django"].source, METADATA)
+        self.assertEqual(revisions["legacy"], "7.0.0")
+        self.assertEqual(composite["legacy"].source, TOML_FILE)
+        self.assertEqual(composite["core"].source, GIT)
+        self.assertEqual(
+            composite.stamp,
+            f"core={composite['core'].tag};plugin=0.4.1;"
+            f"django={revisions['django']};legacy=7.0.0",
+        )
+        self.assertEqual(composite.as_dict()["core"]["distance"], 3)
+
+    def test_concurrent(self):
+        discover = Revision.discover
+
+        def slow_discover(revision):
+            time.sleep(0.2)
+            return discover(revision)
+
+        with patch.object(
+            Revision, "discover", autospec=True, side_effect=slow_discover
+        ):
+            start = time.perf_counter()
+            CompositeRevision(self.components).resolve()
+            self.assertLess(time.perf_counter() - start, 0.6)
+
+    def test_field_and_template(self):
+        with override_settings(DJANGO_REVISION_COMPONENTS=self.components):
+            field = RevisionField(component="plugin")
+            self.assertTrue(field.get_revision_value(None).startswith("0.4.1:"))
+            field = RevisionField(component=COMPOSITE, max_length=255)
+            self.assertEqual(field.get_revision_value(None), site_components.stamp)
+            self.assertEqual(field.deconstruct()[3]["component"], COMPOSITE)
+            template = Template(
+                "{% load revision_tags %}{% revision_component 'legacy' %}|"
+                "{% revision_components %}"
+            )
+            self.assertEqual(
+                template.render(Context()), f"7.0.0|{site_components.stamp}"
+            )
+
+    def test_check(self):
+        components = {
+            **self.components,
+            "missing": {"git_dir": Path(gettempdir()) / "does-not-exist"},
+        }
+        with override_settings(DJANGO_REVISION_COMPONENTS=components):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                errors = check_for_components(None)
+        self.assertEqual([e.id for e in errors], ["django_revision.E002"])
+        self.assertIn("missing", errors[0].msg)
@@ -0,0 +1,84 @@
+from io import StringIO
+
+from django.apps import apps as django_apps
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_migrate
+from django.test import TransactionTestCase
+from django.test.utils import override_settings
+
+from django_revision.models import RevisionLookup
+from django_revision.utils import get_revision_ordinal
+
+from ..models import TestLookupModel, TestModel, TestOrdinalModel
+from .helpers import SETTINGS
+
+LABELS = [
+    "django_revision.testmodel",
+    "django_revision.testlookupmodel",
+    "django_revision.testordinalmodel",
+]
+
+
+def insert_raw(model) -> None:
+    """Inserts a row without the ORM, as a bulk loader would."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} "
+            f"(id) VALUES (%s)",
+            [model._base_manager.count() + 1],
+        )
+
+
+@override_settings(REVISION="1.4.0-2-gabcdef0:main:abcdef0", **SETTINGS)
+class TestDbDefault(TransactionTestCase):
+    databases = ["default"]
+
+    def setUp(self):
+        RevisionLookup.objects.clear_cache()
+
+    def tearDown(self):
+        call_command("revision_db_default", *LABELS, "--clear", stdout=StringIO())
+
+    def test_set_and_clear(self):
+        out = StringIO()
+        call_command("revision_db_default", *LABELS, stdout=out)
+        self.assertIn("Altered 4 columns", out.getvalue())
+        revision = "1.4.0-2-gabcdef0:main:abcdef0"
+        for model in [TestModel, TestLookupModel, TestOrdinalModel]:
+            insert_raw(model)
+        self.assertEqual(TestModel.objects.get().revision, revision)
+        self.assertEqual(TestLookupModel.objects.get().revision, revision)
+        obj = TestOrdinalModel.objects.get()
+        self.assertEqual(obj.revision, revision)
+        self.assertEqual(obj.revision_ordinal, get_revision_ordinal(revision))
+
+        # the ORM still stamps the current revision
+        with override_settings(REVISION="1.5.0"):
+            self.assertEqual(TestModel.objects.create().revision, "1.5.0")
+
+        call_command("revision_db_default", *LABELS, "--clear", stdout=out)
+        insert_raw(TestModel)
+        self.assertIsNone(TestModel.objects.order_by("id").last().revision)
+
+    def test_post_migrate(self):
+        app_config = django_apps.get_app_config("django_revision")
+        kwargs = dict(
+            app_config=app_config,
+            verbosity=0,
+            interactive=False,
+            using="default",
+            apps=django_apps,
+            plan=[],
+        )
+        post_migrate.send(sender=app_config, **kwargs)
+        insert_raw(TestModel)
+        self.assertIsNone(TestModel.objects.get().revision)
+
+        with override_settings(DJANGO_REVISION_DB_DEFAULT=True):
+            post_migrate.send(sender=app_config, **kwargs)
+        insert_raw(TestModel)
+        self.assertEqual(
+            TestModel.objects.order_by("id").last().revision,
+            "1.4.0-2-gabcdef0:main:abcdef0",
+        )
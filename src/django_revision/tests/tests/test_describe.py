@@ -0,0 +1,109 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import git
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.constants import GIT, GITPYTHON, NATIVE, NEXT_SOURCE, SETTINGS
+from django_revision.git_reader import GitReader
+
+from .helpers import create_repo_with_history
+
+execute = git.cmd.Git.execute
+read_commit = GitReader.read_commit
+
+
+def slow_describe(self, command, **kwargs):
+    if "describe" in command:
+        time.sleep(kwargs["kill_after_timeout"] * 2)
+        raise git.GitCommandError(command, -9, "Timeout")
+    return execute(self, command, **kwargs)
+
+
+def slow_read_commit(self, sha):
+    time.sleep(0.02)
+    return read_commit(self, sha)
+
+
+class TestDescribe(TestCase):
+    def setUp(self):
+        self.repo = create_repo_with_history()
+        self.path = Path(tempfile.mkdtemp()) / "describe.json"
+
+    def get_revision(self) -> Revision:
+        Revision.clear_cache()
+        revision = Revision(git_dir=self.repo.working_dir, sources=[GIT, SETTINGS])
+        revision.revision  # noqa: B018
+        return revision
+
+    def test_memo(self):
+        for backend in [GITPYTHON, NATIVE]:
+            self.repo = create_repo_with_history()
+            path = self.path.with_name(f"{backend}.json")
+            with (
+                self.subTest(backend=backend),
+                override_settings(
+                    DJANGO_REVISION_GIT_BACKEND=backend,
+                    DJANGO_REVISION_DESCRIBE_CACHE_FILE=path,
+                ),
+            ):
+                expected = self.get_revision().revision
+                self.assertTrue(expected.startswith("0.2.0-3-g"))
+                memo = json.loads(path.read_text())
+                self.assertEqual(len(memo), 1)
+                key = list(memo)[0]
+                self.assertTrue(key.startswith(f"{self.repo.head.commit.hexsha}:10:"))
+
+                with (
+                    patch.object(Revision, "describe_native") as describe_native,
+                    patch.object(Revision, "describe_gitpython") as describe_gitpython,
+                ):
+                    self.assertEqual(self.get_revision().revision, expected)
+                describe_native.assert_not_called()
+                describe_gitpython.assert_not_called()
+
+                # a new tag is a new entry
+                self.repo.create_tag("1.0.0")
+                self.assertTrue(self.get_revision().revision.startswith("1.0.0:"))
+                self.assertEqual(len(json.loads(path.read_text())), 2)
+
+    def test_timeout(self):
+        commit = self.repo.head.commit.hexsha
+        branch = self.repo.active_branch.name
+        for backend in [GITPYTHON, NATIVE]:
+            with (
+                self.subTest(backend=backend),
+                override_settings(
+                    REVISION="9.9.9",
+                    DJANGO_REVISION_GIT_BACKEND=backend,
+                    DJANGO_REVISION_DESCRIBE_TIMEOUT=0.01,
+                    DJANGO_REVISION_DESCRIBE_CACHE_FILE=self.path,
+                ),
+                patch.object(git.cmd.Git, "execute", slow_describe),
+                patch.object(GitReader, "read_commit", slow_read_commit),
+            ):
+                revision = self.get_revision()
+                self.assertEqual(revision.revision, f"{commit[:7]}:{branch}:{commit}")
+                self.assertEqual(revision.source, GIT)
+                # not memoized
+                self.assertFalse(self.path.exists())
+
+                with override_settings(DJANGO_REVISION_DESCRIBE_FALLBACK=NEXT_SOURCE):
+                    revision = self.get_revision()
+                self.assertEqual(revision.revision, "9.9.9")
+                self.assertEqual(revision.source, SETTINGS)
+
+    @override_settings(DJANGO_REVISION_DESCRIBE_CANDIDATES=0)
+    def test_candidates(self):
+        # as `git describe --candidates=0`, only an exact match
+        for backend in [GITPYTHON, NATIVE]:
+            with (
+                self.subTest(backend=backend),
+                override_settings(DJANGO_REVISION_GIT_BACKEND=backend),
+            ):
+                self.assertNotIn("0.2.0", self.get_revision().tag)
@@ -0,0 +1,102 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from tempfile import gettempdir
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.constants import GIT, TOML_FILE
+from django_revision.exceptions import RevisionError
+
+from .helpers import commit_file, create_repo_with_history
+
+
+class TestFrozenRevision(TestCase):
+    def setUp(self):
+        self.path = Path(tempfile.mkdtemp()) / "revision.json"
+
+    def test_freeze_and_load(self):
+        repo = create_repo_with_history()
+        with override_settings(REVISION=None, GIT_DIR=repo.working_dir):
+            call_command("freeze_revision", output=str(self.path), stdout=StringIO())
+            expected = Revision()
+            expected_revision = expected.revision
+        data = json.loads(self.path.read_text())
+        self.assertEqual(data["revision"], expected_revision)
+        self.assertEqual(data["distance"], 3)
+        self.assertEqual(data["source"], GIT)
+
+        # git dir no longer exists / changed, frozen file still wins
+        commit_file(repo, "another.txt")
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=Path(gettempdir()) / "does-not-exist",
+            DJANGO_REVISION_FROZEN_FILE=self.path,
+        ):
+            revision = Revision()
+            self.assertEqual(revision.revision, expected_revision)
+            self.assertEqual(revision.tag, expected.tag)
+            self.assertEqual(revision.branch, expected.branch)
+            self.assertEqual(revision.commit, expected.commit)
+            self.assertEqual(revision.source, GIT)
+
+    @override_settings(
+        REVISION=None,
+        BASE_DIR=gettempdir(),
+        DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+        DJANGO_REVISION_IGNORE_METADATA=True,
+    )
+    def test_freeze_from_toml(self):
+        with open(Path(gettempdir()) / "pyproject.toml", "w") as f:
+            f.write('[project]\nversion = "7.7.7"\n')
+        call_command("freeze_revision", output=str(self.path), stdout=StringIO())
+        data = json.loads(self.path.read_text())
+        self.assertEqual(data["revision"], "7.7.7")
+        self.assertEqual(data["source"], TOML_FILE)
+        self.assertIsNone(data["commit"])
+
+    def test_ignore_frozen_file(self):
+        self.path.write_text(json.dumps(dict(revision="1.2.3", source=GIT)))
+        repo = create_repo_with_history()
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=repo.working_dir,
+            DJANGO_REVISION_FROZEN_FILE=self.path,
+        ):
+            self.assertEqual(Revision().revision, "1.2.3")
+            with override_settings(DJANGO_REVISION_IGNORE_FROZEN_FILE=True):
+                self.assertTrue(Revision().revision.startswith("0.2.0-3-g"))
+
+    def test_corrupt_frozen_file(self):
+        for content in [
+            "{not json",
+            "[]",
+            '{"revision": "1.2.3"}',
+            '{"source": "git"}',
+        ]:
+            with self.subTest(content=content):
+                self.path.write_text(content)
+                with override_settings(
+                    REVISION=None,
+                    GIT_DIR=Path(gettempdir()) / "does-not-exist",
+                    DJANGO_REVISION_FROZEN_FILE=self.path,
+                ):
+                    with self.assertRaisesRegex(RevisionError, str(self.path)):
+                        Revision().revision
+
+    def test_default_path(self):
+        base_dir = self.path.parent
+        # an unrelated revision.json of the project is not read
+        self.path.write_text("{not json")
+        repo = create_repo_with_history()
+        with override_settings(
+            REVISION=None, BASE_DIR=base_dir, GIT_DIR=repo.working_dir
+        ):
+            self.assertTrue(Revision().revision.startswith("0.2.0-3-g"))
+            call_command("freeze_revision", stdout=StringIO())
+            data = json.loads((base_dir / ".django_revision.json").read_text())
+            self.assertEqual(Revision().revision, data["revision"])
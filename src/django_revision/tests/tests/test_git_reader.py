@@ -0,0 +1,118 @@
+import os
+import tempfile
+
+import git
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.exceptions import RevisionGitError
+from django_revision.git_reader import GitReader
+
+from .helpers import commit_file, create_repo_with_history, init_repo
+
+
+class TestGitReader(TestCase):
+    def assert_same_as_gitpython(self, working_dir):
+        with override_settings(REVISION=None, GIT_DIR=working_dir):
+            expected = Revision().revision
+        with override_settings(
+            REVISION=None, GIT_DIR=working_dir, DJANGO_REVISION_GIT_BACKEND="native"
+        ):
+            revision = Revision()
+            self.assertEqual(revision.revision, expected)
+            revision.git_reader.close()
+        return expected
+
+    def test_exact_tag(self):
+        repo = create_repo_with_history()
+        repo.create_tag("1.0.0")
+        self.assertTrue(
+            self.assert_same_as_gitpython(repo.working_dir).startswith("1.0.0:")
+        )
+
+    def test_commits_after_tag(self):
+        repo = create_repo_with_history()
+        revision = self.assert_same_as_gitpython(repo.working_dir)
+        self.assertTrue(revision.startswith("0.2.0-3-g"))
+
+    def test_without_tags(self):
+        repo = init_repo()
+        commit = commit_file(repo, "file.txt")
+        revision = self.assert_same_as_gitpython(repo.working_dir)
+        self.assertTrue(revision.startswith(f"{commit.hexsha}:"))
+
+    def test_annotated_preferred_over_lightweight(self):
+        repo = create_repo_with_history()
+        repo.create_tag("0.3.0")
+        repo.create_tag("0.2.9", message="annotated")
+        self.assertTrue(
+            self.assert_same_as_gitpython(repo.working_dir).startswith("0.2.9:")
+        )
+
+    def test_merge_history(self):
+        repo = create_repo_with_history()
+        main = repo.active_branch
+        feature = repo.create_head("feature", "0.1.0")
+        feature.checkout()
+        commit_file(repo, "feature1.txt", date="2024-02-01T00:00:00")
+        repo.create_tag("0.1.1")
+        commit_file(repo, "feature2.txt", date="2024-02-02T00:00:00")
+        main.checkout()
+        repo.git.merge("feature", "--no-edit")
+        commit_file(repo, "after_merge.txt", date="2024-02-03T00:00:00")
+        self.assert_same_as_gitpython(repo.working_dir)
+
+    def test_packed_refs_and_objects(self):
+        repo = create_repo_with_history()
+        for i in range(20):
+            commit_file(repo, "file0.txt", content="x" * 1000 + str(i))
+        repo.create_tag("0.3.0")
+        commit_file(repo, "last.txt")
+        repo.git.gc("--aggressive")
+        self.assertTrue(os.path.exists(os.path.join(repo.git_dir, "packed-refs")))
+        self.assertTrue(
+            self.assert_same_as_gitpython(repo.working_dir).startswith("0.3.0-1-g")
+        )
+
+    def test_loose_objects_after_packed(self):
+        """Assert objects written after a gc are read from the loose
+        object directories, the packs being searched first.
+        """
+        repo = create_repo_with_history()
+        repo.git.gc()
+        repo.create_tag("0.3.0")
+        for i in range(2):
+            commit_file(repo, f"loose{i}.txt")
+        with GitReader(repo.git_dir) as reader:
+            self.assertEqual(reader.commit, repo.head.commit.hexsha)
+            self.assertTrue(reader.describe().startswith("0.3.0-2-g"))
+        self.assertTrue(
+            self.assert_same_as_gitpython(repo.working_dir).startswith("0.3.0-2-g")
+        )
+
+    def test_detached_head(self):
+        repo = create_repo_with_history()
+        repo.git.checkout("HEAD~1")
+        revision = self.assert_same_as_gitpython(repo.working_dir)
+        self.assertIn(":detached:", revision)
+
+    def test_detached_head_without_tags(self):
+        repo = init_repo()
+        commit_file(repo, "file1.txt")
+        commit_file(repo, "file2.txt")
+        repo.git.checkout("HEAD~1")
+        self.assertTrue(
+            self.assert_same_as_gitpython(repo.working_dir).startswith("detached")
+        )
+
+    def test_worktree(self):
+        repo = create_repo_with_history()
+        path = os.path.join(tempfile.mkdtemp(), "worktree")
+        repo.git.worktree("add", "-b", "wt", path, "0.2.0")
+        commit_file(git.Repo(path), "wt.txt")
+        revision = self.assert_same_as_gitpython(path)
+        self.assertIn(":wt:", revision)
+
+    def test_not_a_git_dir(self):
+        self.assertRaises(RevisionGitError, GitReader, tempfile.mkdtemp())
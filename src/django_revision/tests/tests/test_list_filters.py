@@ -0,0 +1,124 @@
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from django_revision.list_filters import RevisionListFilter
+from django_revision.models import RevisionLookup
+from django_revision.testing import override_revision
+
+from ..models import TestLookupModel, TestModel
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return "client"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+
+def get_filter(model, **params) -> RevisionListFilter:
+    request = RequestFactory().get("/")
+    model_admin = admin.ModelAdmin(model, admin.site)
+    params = {k: [v] for k, v in params.items()}
+    return RevisionListFilter(request, params, model, model_admin)
+
+
+class TestRevisionListFilter(TestCase):
+    databases = ["default", "client"]
+
+    def setUp(self):
+        cache.clear()
+        RevisionLookup.objects.clear_cache()
+        for field in [
+            TestModel._meta.get_field("revision"),
+            TestLookupModel._meta.get_field("revision_lookup"),
+        ]:
+            field.seen.clear()
+            field.pending_seen.clear()
+        for revision, count in [("1.9.0", 1), ("1.10.0", 2)]:
+            with override_revision(revision):
+                for _ in range(count):
+                    TestModel.objects.create()
+                    TestLookupModel.objects.create()
+
+    def test_choices_are_cached(self):
+        for model in [TestModel, TestLookupModel]:
+            with self.subTest(model=model):
+                with self.assertNumQueries(1):
+                    choices = get_filter(model).lookup_choices
+                self.assertEqual(choices, [("1.10.0", "1.10.0"), ("1.9.0", "1.9.0")])
+                with self.assertNumQueries(0):
+                    get_filter(model)
+
+                # a new revision is added when first stamped
+                with (
+                    override_revision("2.0.0"),
+                    self.captureOnCommitCallbacks(execute=True),
+                ):
+                    model.objects.create()
+                with self.assertNumQueries(0):
+                    choices = get_filter(model).lookup_choices
+                self.assertEqual(choices[0], ("2.0.0", "2.0.0"))
+
+    def test_rolled_back_revision_is_not_added(self):
+        for model in [TestModel, TestLookupModel]:
+            with self.subTest(model=model):
+                get_filter(model)
+                with override_revision("3.0.0"):
+                    try:
+                        with transaction.atomic():
+                            model.objects.create()
+                            raise DatabaseError
+                    except DatabaseError:
+                        pass
+                    self.assertNotIn(
+                        ("3.0.0", "3.0.0"), get_filter(model).lookup_choices
+                    )
+                    with self.captureOnCommitCallbacks(execute=True):
+                        model.objects.create()
+                self.assertEqual(
+                    get_filter(model).lookup_choices[0], ("3.0.0", "3.0.0")
+                )
+
+    def test_one_callback_per_transaction(self):
+        for model in [TestModel, TestLookupModel]:
+            with self.subTest(model=model):
+                with (
+                    override_revision("4.0.0"),
+                    self.captureOnCommitCallbacks(execute=True) as callbacks,
+                ):
+                    for _ in range(10):
+                        model.objects.create()
+                    model.objects.bulk_create([model() for _ in range(10)])
+                self.assertEqual(
+                    len([c for c in callbacks if "add_seen" in c.__qualname__]), 1
+                )
+                self.assertEqual(
+                    get_filter(model).lookup_choices[0], ("4.0.0", "4.0.0")
+                )
+
+    @override_settings(DATABASE_ROUTERS=[f"{__name__}.ReplicaRouter"])
+    def test_read_from_replica(self):
+        self.assertEqual(get_filter(TestModel).lookup_choices, [])
+        with (
+            override_revision("5.0.0"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            TestModel.objects.create()
+        with self.assertNumQueries(0, using="client"):
+            choices = get_filter(TestModel).lookup_choices
+        self.assertEqual(choices, [("5.0.0", "5.0.0")])
+
+    def test_queryset(self):
+        for model in [TestModel, TestLookupModel]:
+            with self.subTest(model=model):
+                list_filter = get_filter(model, revision="1.10.0")
+                queryset = list_filter.queryset(None, model.objects.all())
+                self.assertEqual(queryset.count(), 2)
+                self.assertEqual({obj.revision for obj in queryset}, {"1.10.0"})
+                list_filter = get_filter(model)
+                queryset = list_filter.queryset(None, model.objects.all())
+                self.assertEqual(queryset.count(), 3)
@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from django_revision import site_revision
+from django_revision.model_mixins import (
+    RevisionForeignKeyModelMixin,
+    RevisionModelMixin,
+)
+from django_revision.models import RevisionLookup
+from django_revision.testing import override_revision
+
+from ..models import TestLookupModel, TestModel
+
+
+@override_revision("0.2.0-3-gabcdef0:main:abcdef0")
+class TestRevisionQuerySet(TestCase):
+    def setUp(self):
+        RevisionLookup.objects.clear_cache()
+        for i in range(3):
+            TestModel.objects.create(name=f"name{i}")
+        TestModel.objects.update(revision="stale")
+
+    def test_mixins_do_not_set_a_manager(self):
+        self.assertEqual(RevisionModelMixin._meta.local_managers, [])
+        self.assertEqual(RevisionForeignKeyModelMixin._meta.local_managers, [])
+
+    def test_explicit_value_is_kept(self):
+        self.assertEqual(TestModel.objects.filter(revision="stale").count(), 3)
+
+    def test_update(self):
+        with self.assertNumQueries(1):
+            TestModel.objects.filter(name="name0").update(name="updated")
+        self.assertEqual(
+            TestModel.objects.get(name="updated").revision, site_revision.revision
+        )
+        self.assertEqual(TestModel.objects.filter(revision="stale").count(), 2)
+
+    def test_bulk_update(self):
+        objs = list(TestModel.objects.all())
+        for obj in objs:
+            obj.name = obj.name.upper()
+        TestModel.objects.bulk_update(objs, ["name"])
+        self.assertEqual(
+            TestModel.objects.filter(revision=site_revision.revision).count(), 3
+        )
+        self.assertTrue(all(obj.revision == site_revision.revision for obj in objs))
+
+    def test_update_foreign_key(self):
+        obj = TestLookupModel.objects.create(name="name")
+        TestLookupModel.objects.update(revision_lookup=None)
+        TestLookupModel.objects.update(name="updated")
+        obj.refresh_from_db()
+        self.assertEqual(obj.revision, site_revision.revision)
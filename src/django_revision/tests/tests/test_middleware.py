@@ -0,0 +1,53 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import site_revision
+
+MIDDLEWARE = ["django_revision.middleware.RevisionMiddleware"]
+
+
+@override_settings(
+    MIDDLEWARE=MIDDLEWARE,
+    REVISION="1.0.0",
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+    DJANGO_REVISION_ETAG_URL_NAMES=["cacheable", "async_cacheable"],
+)
+class TestRevisionMiddleware(TestCase):
+    def test_header(self):
+        response = self.client.get("/other/")
+        self.assertEqual(response["X-App-Revision"], "1.0.0")
+        self.assertFalse(response.has_header("ETag"))
+
+    @override_settings(DJANGO_REVISION_HEADER=None)
+    def test_no_header(self):
+        self.assertFalse(self.client.get("/other/").has_header("X-App-Revision"))
+
+    def test_etag_and_not_modified(self):
+        response = self.client.get("/cacheable/")
+        etag = response["ETag"]
+        self.assertEqual(etag, f'W/"{site_revision.revision_hash}"')
+        response = self.client.get("/cacheable/", headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["X-App-Revision"], "1.0.0")
+        self.assertEqual(self.client.post("/cacheable/").status_code, 200)
+
+    def test_new_revision_new_etag(self):
+        etag = self.client.get("/cacheable/")["ETag"]
+        with override_settings(REVISION="1.0.1"):
+            response = self.client.get("/cacheable/", headers={"if-none-match": etag})
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+            self.assertEqual(response["X-App-Revision"], "1.0.1")
+
+    async def test_async(self):
+        response = await self.async_client.get("/async-cacheable/")
+        self.assertEqual(response["X-App-Revision"], "1.0.0")
+        response = await self.async_client.get(
+            "/async-cacheable/", headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,126 @@
+from django.core.exceptions import FieldError
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision.revision_field import RevisionOrdinalField
+from django_revision.utils import get_revision_ordinal
+
+from ..models import TestLookupModel, TestModel, TestOrdinalModel
+
+REVISIONS = ["1.3.0", "1.4.0", "1.4.0-2-gabc1234:main:abc1234", "1.5.0", "main"]
+
+
+@override_settings(
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+class TestRevisionOrdinal(TestCase):
+    def setUp(self):
+        for revision in REVISIONS:
+            with override_settings(REVISION=revision):
+                TestOrdinalModel.objects.create()
+
+    def filter(self, **kwargs) -> list[str]:
+        return list(
+            TestOrdinalModel.objects.filter(**kwargs)
+            .order_by("revision_ordinal")
+            .values_list("revision", flat=True)
+        )
+
+    def test_ordinal(self):
+        self.assertLess(get_revision_ordinal("1.4.0"), get_revision_ordinal("1.10.0"))
+        self.assertLess(
+            get_revision_ordinal("1.4.0"),
+            get_revision_ordinal("1.4.0-2-gabc1234:main:abc1234"),
+        )
+        self.assertLess(
+            get_revision_ordinal("1.4.0-65535-gabc1234"), get_revision_ordinal("1.4.1")
+        )
+        self.assertEqual(get_revision_ordinal("v1.4"), get_revision_ordinal("1.4.0"))
+        self.assertIsNone(get_revision_ordinal("main"))
+
+    def test_ordinal_of_release_order(self):
+        versions = [
+            "1.4.0.dev1",
+            "1.4.0a1",
+            "1.4.0b2",
+            "1.4.0-rc.1",
+            "1.4.0rc1-3-gabc1234",
+            "1.4.0rc2",
+            "1.4.0",
+            "1.4.0-1-gabc1234",
+            "1.4.0.post1",
+            "1.4.0.2",
+            "1.4.1",
+            "2024.10.1",
+            "20241018",
+            "2024.10.19",
+        ]
+        ordinals = [get_revision_ordinal(version) for version in versions]
+        self.assertEqual(ordinals, sorted(set(ordinals)))
+        self.assertEqual(
+            get_revision_ordinal("1.4.0.post1"), get_revision_ordinal("1.4.0.1")
+        )
+        self.assertEqual(
+            get_revision_ordinal("20241018"), get_revision_ordinal("2024.10.18")
+        )
+        self.assertLess(get_revision_ordinal("1.4.0-rc.1"), get_revision_ordinal("1.4"))
+
+    def test_ordinal_of_untagged_revision(self):
+        # the tag is the commit if there are no tags or describe timed out
+        self.assertIsNone(get_revision_ordinal("1a2b3c4:main:1a2b3c4d5e6f"))
+        self.assertIsNone(get_revision_ordinal("1234567:detached:1234567890ab"))
+        self.assertIsNone(get_revision_ordinal("1a2b3c4"))
+        self.assertIsNotNone(get_revision_ordinal("1234567"))
+        self.assertIsNone(get_revision_ordinal(":detached:1a2b3c4d5e6f"))
+        self.assertEqual(
+            get_revision_ordinal("1.4.0:detached:1a2b3c4d5e6f"),
+            get_revision_ordinal("1.4.0"),
+        )
+        obj = TestOrdinalModel.objects.get(revision="1.4.0")
+        self.assertEqual(obj.revision_ordinal, get_revision_ordinal("1.4.0"))
+        self.assertIsNone(
+            TestOrdinalModel.objects.get(revision="main").revision_ordinal
+        )
+
+    def test_lookups(self):
+        self.assertEqual(self.filter(revision__before="1.4.0"), ["1.3.0"])
+        self.assertEqual(self.filter(revision__after="1.4.0"), REVISIONS[2:4])
+        self.assertEqual(
+            self.filter(revision__between=("1.4.0", "1.5.0")), REVISIONS[1:4]
+        )
+        self.assertEqual(self.filter(revision__tag="1.4.0"), REVISIONS[1:3])
+        self.assertEqual(self.filter(revision__tag="1.4.0-2-gabc1234"), REVISIONS[1:3])
+        self.assertEqual(self.filter(revision_ordinal__before="1.4.0"), ["1.3.0"])
+
+    def test_range_scan_on_ordinal(self):
+        sql = str(TestOrdinalModel.objects.filter(revision__tag="1.4.0").query)
+        self.assertIn('"revision_ordinal" BETWEEN', sql)
+        self.assertNotIn('"revision" ', sql.split("WHERE")[1])
+
+    def test_check_revision_field(self):
+        self.assertEqual(TestOrdinalModel.check(), [])
+        field = RevisionOrdinalField(revision_field="revision_lookup")
+        field.model = TestLookupModel
+        self.assertEqual(
+            [error.id for error in field.check()], ["django_revision.E004"]
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            TestOrdinalModel.objects.filter(revision__before="main")
+        with self.assertRaises(FieldError):
+            TestModel.objects.filter(revision__before="1.4.0")
+
+    @override_settings(REVISION="2.0.0")
+    def test_update(self):
+        TestOrdinalModel.objects.filter(revision="1.3.0").update()
+        self.assertEqual(self.filter(revision__tag="2.0.0"), ["2.0.0"])
+        TestOrdinalModel.objects.filter(revision="2.0.0").update(revision="0.9.0")
+        self.assertEqual(self.filter(revision__before="1.0.0"), ["0.9.0"])
+        objs = list(TestOrdinalModel.objects.filter(revision="1.5.0"))
+        TestOrdinalModel.objects.bulk_update(objs, ["revision"])
+        self.assertEqual(self.filter(revision__after="1.5.0"), ["2.0.0"])
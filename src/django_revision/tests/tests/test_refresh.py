@@ -0,0 +1,58 @@
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+
+from .helpers import commit_file, create_repo_with_history
+
+
+class TestRefresh(TestCase):
+    def setUp(self):
+        self.repo = create_repo_with_history()
+
+    def test_no_refresh_by_default(self):
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            revision = Revision()
+            before = revision.revision
+            self.repo.create_tag("1.0.0")
+            self.assertEqual(revision.revision, before)
+
+    def test_refresh_on_new_tag(self):
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_REFRESH_INTERVAL=1e-9,
+        ):
+            revision = Revision()
+            self.assertTrue(revision.revision.startswith("0.2.0-3-g"))
+            self.repo.create_tag("1.0.0")
+            self.assertTrue(revision.revision.startswith("1.0.0:"))
+            self.assertEqual(revision.tag, "1.0.0")
+            commit = commit_file(self.repo, "new.txt")
+            self.assertTrue(revision.revision.startswith("1.0.0-1-g"))
+            self.assertEqual(revision.commit, commit.hexsha)
+
+    def test_refresh_on_new_tag_in_namespace(self):
+        self.repo.create_tag("release/0.3.0", ref="HEAD~1")
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_REFRESH_INTERVAL=1e-9,
+        ):
+            revision = Revision()
+            self.assertTrue(revision.revision.startswith("release/0.3.0-1-g"))
+            self.repo.create_tag("release/1.0.0")
+            self.assertTrue(revision.revision.startswith("release/1.0.0:"))
+
+    def test_not_refreshed_before_interval(self):
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=self.repo.working_dir,
+            DJANGO_REVISION_REFRESH_INTERVAL=3600,
+        ):
+            revision = Revision()
+            before = revision.revision
+            self.repo.create_tag("1.0.0")
+            self.assertEqual(revision.revision, before)
+            revision.refresh()
+            self.assertTrue(revision.revision.startswith("1.0.0:"))
@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.constants import GITPYTHON, NATIVE
+
+from .helpers import create_repo_with_history
+
+
+def git_children() -> set[int]:
+    """Returns the pids of git processes started by this process."""
+    pids = set()
+    for path in Path("/proc").iterdir():
+        try:
+            stat = (path / "stat").read_text()
+        except (NotADirectoryError, OSError):
+            continue
+        name, _, rest = stat.partition(" (")[2].rpartition(") ")
+        if name == "git" and int(rest.split()[1]) == os.getpid():
+            pids.add(int(path.name))
+    return pids
+
+
+@skipUnless(Path("/proc/self/stat").exists(), "requires /proc")
+class TestRelease(SimpleTestCase):
+    def setUp(self):
+        repo = create_repo_with_history()
+        self.git_dir = repo.working_dir
+        repo.close()
+
+    def test_no_git_children_after_resolution(self):
+        for backend in [GITPYTHON, NATIVE]:
+            with self.subTest(backend=backend):
+                Revision.clear_cache()
+                before = git_children()
+                revision = Revision(git_dir=self.git_dir, sources=["git"])
+                with override_settings(DJANGO_REVISION_GIT_BACKEND=backend):
+                    revision.revision  # noqa: B018
+                self.assertIsNone(revision._repo)
+                self.assertIsNone(revision._git_reader)
+                self.assertNotIn(revision, Revision._open)
+                # e.g. other tests may leave GitPython repos open
+                self.assertEqual(git_children(), before)
+                # resolved in one pass
+                self.assertTrue(revision.revision.startswith(revision.tag))
+                self.assertIsNotNone(revision.branch)
+                self.assertIsNotNone(revision.commit)
+                self.assertIsNone(revision._repo)
+
+    @skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_released_before_fork(self):
+        before = git_children()
+        revision = Revision(git_dir=self.git_dir)
+        revision.repo.head.commit  # noqa: B018
+        self.assertIn(revision, Revision._open)
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if revision._repo is None else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertIsNone(revision._repo)
+        self.assertEqual(git_children(), before)
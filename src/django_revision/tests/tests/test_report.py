@@ -0,0 +1,96 @@
+import csv
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import override_settings
+
+from django_revision.models import RevisionLookup
+
+from ..models import TestLookupModel, TestModel
+from .helpers import SETTINGS
+
+
+def create_rows():
+    RevisionLookup.objects.clear_cache()
+    for revision, count in [("1.0.0", 3), ("1.1.0", 2)]:
+        with override_settings(REVISION=revision):
+            for _ in range(count):
+                TestModel.objects.create()
+                TestLookupModel.objects.create()
+
+
+def report(*args, **options) -> str:
+    out = StringIO()
+    call_command("revision_report", *args, databases=["default"], stdout=out, **options)
+    return out.getvalue()
+
+
+@override_settings(**SETTINGS)
+class TestRevisionReport(TestCase):
+    def setUp(self):
+        create_rows()
+
+    def test_csv(self):
+        for options in [dict(), dict(chunk_size=2)]:
+            with self.subTest(**options):
+                output = report(
+                    "django_revision.testmodel",
+                    "django_revision.testlookupmodel",
+                    workers=1,
+                    **options,
+                )
+                rows = list(csv.DictReader(StringIO(output)))
+                counts = {(r["model"], r["revision"]): int(r["count"]) for r in rows}
+                self.assertEqual(
+                    counts,
+                    {
+                        ("django_revision.testmodel", "1.0.0"): 3,
+                        ("django_revision.testmodel", "1.1.0"): 2,
+                        ("django_revision.testlookupmodel", "1.0.0"): 3,
+                        ("django_revision.testlookupmodel", "1.1.0"): 2,
+                    },
+                )
+                self.assertEqual({r["database"] for r in rows}, {"default"})
+
+    def test_json(self):
+        output = report("django_revision", workers=1, format="json")
+        rows = json.loads(output)
+        self.assertIn(
+            dict(
+                database="default",
+                model="django_revision.testmodel",
+                field="revision",
+                revision="1.1.0",
+                count=2,
+            ),
+            rows,
+        )
+        self.assertEqual(
+            json.loads(
+                report("django_revision.testordinalmodel", workers=1, format="json")
+            ),
+            [],
+        )
+
+    def test_output_file(self):
+        path = Path(tempfile.mkdtemp()) / "report.json"
+        self.assertEqual(
+            report("django_revision.testmodel", workers=1, format="json", output=path),
+            "",
+        )
+        self.assertEqual(len(json.loads(path.read_text())), 2)
+
+
+@override_settings(**SETTINGS)
+class TestRevisionReportThreads(TransactionTestCase):
+    def test_workers(self):
+        create_rows()
+        output = report("django_revision", workers=4)
+        rows = list(csv.DictReader(StringIO(output)))
+        self.assertEqual(
+            sum(int(r["count"]) for r in rows if r["model"].endswith("testmodel")), 5
+        )
@@ -0,0 +1,95 @@
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+
+from django_revision import site_revision
+from django_revision.migration_helpers import (
+    copy_foreign_key_to_revision,
+    copy_revision_to_foreign_key,
+)
+from django_revision.models import RevisionLookup
+from django_revision.testing import override_revision
+
+from ..models import TestConvertModel, TestLookupModel
+
+
+@override_revision("0.2.0-3-gabcdef0:main:abcdef0")
+class TestRevisionLookup(TestCase):
+    def setUp(self):
+        RevisionLookup.objects.clear_cache()
+
+    def test_foreign_key(self):
+        obj = TestLookupModel.objects.create()
+        self.assertIsNotNone(obj.revision_lookup_id)
+        self.assertEqual(obj.revision, site_revision.revision)
+        TestLookupModel.objects.create()
+        self.assertEqual(RevisionLookup.objects.count(), 1)
+        self.assertEqual(
+            TestLookupModel.objects.filter(
+                revision_lookup__revision=site_revision.revision
+            ).count(),
+            2,
+        )
+
+    def test_lookup_is_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            TestLookupModel.objects.create()
+        with self.assertNumQueries(1):
+            obj = TestLookupModel.objects.create()
+        with self.assertNumQueries(0):
+            self.assertEqual(obj.revision, site_revision.revision)
+
+    def test_lookup_is_not_cached_on_rollback(self):
+        try:
+            with transaction.atomic():
+                TestLookupModel.objects.create()
+                raise DatabaseError
+        except DatabaseError:
+            pass
+        self.assertFalse(RevisionLookup.objects.exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            obj = TestLookupModel.objects.create()
+        self.assertTrue(
+            RevisionLookup.objects.filter(pk=obj.revision_lookup_id).exists()
+        )
+        self.assertEqual(
+            RevisionLookup.objects.get_id(site_revision.revision),
+            obj.revision_lookup_id,
+        )
+
+    def test_lookup_is_kept_for_the_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                TestLookupModel.objects.create()
+                with self.assertNumQueries(1):
+                    TestLookupModel.objects.create()
+        with self.assertNumQueries(1):
+            TestLookupModel.objects.create()
+
+    def test_convert(self):
+        for revision in ["1.0.0", "1.0.0", "1.1.0", None]:
+            obj = TestConvertModel.objects.create()
+            TestConvertModel.objects.filter(pk=obj.pk).update(
+                revision=revision, revision_lookup=None
+            )
+        copy_revision_to_foreign_key(
+            TestConvertModel, RevisionLookup, "revision", "revision_lookup", "default"
+        )
+        self.assertEqual(
+            [
+                (obj.revision, getattr(obj.revision_lookup, "revision", None))
+                for obj in TestConvertModel.objects.order_by("pk")
+            ],
+            [("1.0.0", "1.0.0"), ("1.0.0", "1.0.0"), ("1.1.0", "1.1.0"), (None, None)],
+        )
+        TestConvertModel.objects.update(revision=None)
+        copy_foreign_key_to_revision(
+            TestConvertModel, RevisionLookup, "revision", "revision_lookup", "default"
+        )
+        self.assertEqual(
+            list(
+                TestConvertModel.objects.order_by("pk").values_list(
+                    "revision", flat=True
+                )
+            ),
+            ["1.0.0", "1.0.0", "1.1.0", None],
+        )
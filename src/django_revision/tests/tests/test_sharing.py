@@ -0,0 +1,84 @@
+import json
+import os
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+from tempfile import gettempdir
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision, site_revision
+from django_revision.constants import GIT, SHARED_ENV_VAR
+from django_revision.exceptions import RevisionError
+from django_revision.sharing import adopt, on_reload, on_starting, publish
+
+from .helpers import create_repo_with_history
+
+
+@patch.dict(os.environ)
+class TestSharing(TestCase):
+    def setUp(self):
+        os.environ.pop(SHARED_ENV_VAR, None)
+        self.repo = create_repo_with_history()
+
+    def publish(self) -> dict:
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            return publish(Revision())
+
+    def test_publish_and_adopt(self):
+        data = self.publish()
+        self.assertIn(SHARED_ENV_VAR, os.environ)
+        with override_settings(
+            REVISION=None, GIT_DIR=Path(gettempdir()) / "does-not-exist"
+        ):
+            revision = Revision()
+            self.assertTrue(adopt(revision))
+            self.assertEqual(revision.revision, data["revision"])
+            self.assertEqual(Revision().revision, data["revision"])
+            self.assertEqual(Revision().commit, data["commit"])
+            self.assertEqual(revision.source, GIT)
+
+    def test_child_process_inherits(self):
+        data = self.publish()
+        code = (
+            "from django.conf import settings\n"
+            f"settings.configure(BASE_DIR={gettempdir()!r}, GIT_DIR={gettempdir()!r})\n"
+            "from django_revision import Revision\n"
+            "print(Revision().revision)\n"
+        )
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), data["revision"])
+
+    def test_ignore_shared(self):
+        os.environ[SHARED_ENV_VAR] = '{"revision": "1.2.3", "source": "git"}'
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            self.assertEqual(Revision().revision, "1.2.3")
+            self.assertTrue(
+                Revision(ignore_shared=True).revision.startswith("0.2.0-3-g")
+            )
+
+    def test_invalid_shared(self):
+        for value in ["1.2.3", "[]", '{"revision": 1, "source": "git"}']:
+            with self.subTest(value=value):
+                os.environ[SHARED_ENV_VAR] = value
+                with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+                    with self.assertRaisesMessage(RevisionError, SHARED_ENV_VAR):
+                        Revision().revision
+
+    def test_on_reload(self):
+        with override_settings(REVISION=None, GIT_DIR=self.repo.working_dir):
+            on_starting(None)
+            self.assertTrue(site_revision.revision.startswith("0.2.0-3-g"))
+            self.repo.create_tag("0.3.0")
+            # the published revision is used until reloaded
+            self.assertTrue(Revision().revision.startswith("0.2.0-3-g"))
+            on_reload(None)
+            self.assertTrue(site_revision.revision.startswith("0.3.0:"))
+            self.assertEqual(
+                json.loads(os.environ[SHARED_ENV_VAR])["revision"],
+                site_revision.revision,
+            )
@@ -0,0 +1,134 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision
+from django_revision.constants import ENVIRON, SETTINGS, VERSION_FILE
+from django_revision.sources import RevisionSource
+from django_revision.system_checks import check_for_sources
+
+
+class StaticSource(RevisionSource):
+    name = "static"
+    cost = 5
+
+    def get(self) -> tuple[str, str] | None:
+        return "3.3.3", self.name
+
+
+def get_revision() -> Revision:
+    Revision.clear_cache()
+    revision = Revision()
+    revision.revision  # noqa: B018
+    return revision
+
+
+class TestSources(TestCase):
+    @override_settings(REVISION="1.0.0", DJANGO_REVISION_SOURCES=[ENVIRON, SETTINGS])
+    def test_environ(self):
+        with patch.dict(os.environ, {"APP_REVISION": "2.0.0:main:abcdef0"}):
+            revision = get_revision()
+            self.assertEqual(revision.revision, "2.0.0:main:abcdef0")
+            self.assertEqual(revision.source, ENVIRON)
+            self.assertEqual(list(revision.discovery_timings), [ENVIRON])
+        with patch.dict(os.environ, {"MY_REVISION": "2.1.0"}):
+            with override_settings(DJANGO_REVISION_ENV_VAR="MY_REVISION"):
+                self.assertEqual(get_revision().revision, "2.1.0")
+            os.environ.pop("APP_REVISION", None)
+            revision = get_revision()
+        self.assertEqual(revision.revision, "1.0.0")
+        self.assertEqual(revision.source, SETTINGS)
+
+    @override_settings(
+        DJANGO_REVISION_SOURCES=[
+            "django_revision.tests.tests.test_sources.StaticSource",
+            SETTINGS,
+        ]
+    )
+    def test_dotted_path(self):
+        revision = get_revision()
+        self.assertEqual(revision.revision, "3.3.3")
+        self.assertEqual(revision.source, "static")
+
+    def test_listed_sources_are_not_ignored(self):
+        base_dir = tempfile.mkdtemp()
+        (Path(base_dir) / "VERSION").write_text("4.4.4")
+        with override_settings(
+            BASE_DIR=base_dir,
+            DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+            DJANGO_REVISION_SOURCES=[VERSION_FILE],
+        ):
+            revision = get_revision()
+        self.assertEqual(revision.revision, "4.4.4")
+        self.assertEqual(revision.source, VERSION_FILE)
+
+    @override_settings(REVISION="1.0.0", DJANGO_REVISION_SOURCES=[SETTINGS])
+    def test_sources_argument(self):
+        """Assert `sources` are looked up in the registry and tried in
+        the order given, whatever settings.DJANGO_REVISION_SOURCES.
+        """
+        with patch.dict(os.environ, {"APP_REVISION": "2.0.0"}):
+            revision = Revision(sources=[ENVIRON, SETTINGS])
+            self.assertEqual(revision.revision, "2.0.0")
+            self.assertEqual(revision.source, ENVIRON)
+            revision = Revision(sources=[SETTINGS, ENVIRON])
+            self.assertEqual(revision.revision, "1.0.0")
+            self.assertEqual(list(revision.discovery_timings), [SETTINGS])
+        revision = Revision(
+            sources=["django_revision.tests.tests.test_sources.StaticSource"]
+        )
+        self.assertEqual(revision.revision, "3.3.3")
+
+    def test_get_is_abstract(self):
+        class NoGetSource(RevisionSource):
+            name = "no_get"
+
+        with self.assertRaises(TypeError):
+            NoGetSource(Revision())
+
+    def test_check_for_sources(self):
+        with override_settings(DJANGO_REVISION_SOURCES=None):
+            self.assertEqual(check_for_sources(None), [])
+        with override_settings(
+            DJANGO_REVISION_SOURCES=[
+                ENVIRON,
+                "django_revision.tests.tests.test_sources.StaticSource",
+                VERSION_FILE,
+            ]
+        ):
+            self.assertEqual(check_for_sources(None), [])
+        with override_settings(DJANGO_REVISION_SOURCES=["git", "toml", "environ"]):
+            self.assertEqual(
+                [(e.id, e.msg) for e in check_for_sources(None)],
+                [
+                    (
+                        "django_revision.W001",
+                        "Revision source `git` (cost 100) is tried before the "
+                        "cheaper `toml` (cost 20).",
+                    ),
+                    (
+                        "django_revision.W001",
+                        "Revision source `toml` (cost 20) is tried before the "
+                        "cheaper `environ` (cost 0).",
+                    ),
+                ],
+            )
+        with override_settings(DJANGO_REVISION_SOURCES=["git", "settings"]):
+            # a fallback
+            self.assertEqual(check_for_sources(None), [])
+        with override_settings(DJANGO_REVISION_SOURCES=["git", "settings", "toml"]):
+            self.assertEqual(
+                [e.id for e in check_for_sources(None)],
+                ["django_revision.W001"],
+            )
+        with override_settings(
+            DJANGO_REVISION_SOURCES=["version", "django_revision.nope.Source"]
+        ):
+            self.assertEqual(
+                [e.id for e in check_for_sources(None)],
+                ["django_revision.E003", "django_revision.E003"],
+            )
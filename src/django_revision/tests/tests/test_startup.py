@@ -0,0 +1,50 @@
+import subprocess  # nosec B404
+import sys
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision, site_revision
+
+from .helpers import create_repo_with_history
+
+
+class TestStartup(SimpleTestCase):
+    def test_import_has_no_side_effects(self):
+        """Assert importing the package, field and template tags does
+        not import GitPython or read settings.
+        """
+        code = (
+            "import sys\n"
+            "import django_revision\n"
+            "import django_revision.revision_field\n"
+            "import django_revision.templatetags.revision_tags\n"
+            "from django.conf import settings\n"
+            "print('git' in sys.modules, settings.configured)\n"
+        )
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "False False")
+
+    def test_site_revision_is_lazy(self):
+        repo = create_repo_with_history()
+        with override_settings(REVISION=None, GIT_DIR=repo.working_dir):
+            self.assertIsInstance(site_revision, Revision)
+            self.assertEqual(str(site_revision), site_revision.revision)
+
+    def test_settings_read_on_first_access(self):
+        """Assert site_revision, a plain Revision, reads settings the
+        first time it is read, not when imported.
+        """
+        code = (
+            "from django_revision import Revision, site_revision\n"
+            "from django.conf import settings\n"
+            "settings.configure(REVISION='1.2.3', BASE_DIR='/does-not-exist',\n"
+            "    GIT_DIR='/does-not-exist', DJANGO_REVISION_SOURCES=['settings'])\n"
+            "print(type(site_revision) is Revision, site_revision.revision)\n"
+        )
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), "True 1.2.3")
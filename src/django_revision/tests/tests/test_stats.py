@@ -0,0 +1,85 @@
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision, site_revision
+from django_revision.constants import BULK, GIT, PRE_SAVE, SETTINGS
+from django_revision.signals import revision_discovered
+from django_revision.stats import revision_stats
+from django_revision.views import revision_metrics_view
+
+from ..models import TestModel
+from .helpers import create_repo_with_history
+
+
+@override_settings(
+    REVISION="1.0.0",
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+class TestStats(TestCase):
+    def setUp(self):
+        revision_stats.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(revision_stats.enabled)
+        TestModel.objects.create()
+        self.assertEqual(revision_stats.snapshot()["counters"][PRE_SAVE], 0)
+
+    @override_settings(DJANGO_REVISION_STATS=True)
+    def test_counters(self):
+        self.assertTrue(revision_stats.enabled)
+        field = TestModel._meta.get_field("revision")
+        for _ in range(3):
+            field.pre_save(TestModel(), True)
+        stats = revision_stats.snapshot()
+        self.assertEqual(stats["counters"][PRE_SAVE], 3)
+        self.assertEqual(stats["revision"], "1.0.0")
+        self.assertEqual(stats["source"], SETTINGS)
+        self.assertEqual(
+            list(stats["discovery_timings"]),
+            ["shared", "frozen_file", "git", "metadata", "toml", "version_file"]
+            + ["settings"],
+        )
+        objs = TestModel.objects.bulk_create([TestModel() for _ in range(3)])
+        revision_stats.reset()
+        TestModel.objects.bulk_update(objs, ["name"])
+        TestModel.objects.update(name="x")
+        self.assertEqual(revision_stats.snapshot()["counters"][BULK], 6)
+
+    def test_signal(self):
+        sent = []
+
+        def handler(**kwargs):
+            sent.append(kwargs)
+
+        revision_discovered.connect(handler)
+        self.addCleanup(revision_discovered.disconnect, handler)
+        repo = create_repo_with_history()
+        with override_settings(
+            REVISION=None,
+            GIT_DIR=repo.working_dir,
+            DJANGO_REVISION_IGNORE_WORKING_DIR=False,
+        ):
+            revision = Revision()
+            revision.revision  # noqa: B018
+        self.assertEqual(len(sent), 1)
+        self.assertIs(sent[0]["instance"], revision)
+        self.assertEqual(sent[0]["source"], GIT)
+        self.assertEqual(list(sent[0]["timings"]), ["shared", "frozen_file", "git"])
+        self.assertEqual(revision.discovery_timings, sent[0]["timings"])
+
+    @override_settings(DJANGO_REVISION_STATS=True, REVISION='1.0.0"x')
+    def test_prometheus_view(self):
+        TestModel._meta.get_field("revision").pre_save(TestModel(), True)
+        response = revision_metrics_view(RequestFactory().get("/"))
+        content = response.content.decode()
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            'django_revision_info{revision="1.0.0\\"x",source="settings"} 1', content
+        )
+        self.assertIn('django_revision_discovery_seconds{step="settings"}', content)
+        self.assertIn("django_revision_pre_save_total 1", content)
+        self.assertEqual(str(site_revision), '1.0.0"x')
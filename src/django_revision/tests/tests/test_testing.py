@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision import Revision, site_revision
+from django_revision.composite import site_components
+from django_revision.constants import GIT, SETTINGS, TEST
+from django_revision.models import RevisionLookup
+from django_revision.testing import DEFAULT_TEST_REVISION, override_revision
+
+from ..models import TestLookupModel, TestModel
+
+
+@override_revision("1.2.0")
+@patch.object(Revision, "discover", autospec=True)
+class TestOverrideRevision(TestCase):
+    def setUp(self):
+        RevisionLookup.objects.clear_cache()
+
+    def test_class(self, discover):
+        self.assertEqual(site_revision.revision, "1.2.0")
+        self.assertEqual(site_revision.source, TEST)
+        self.assertEqual(Revision(max_length=10).revision, "1.2.0")
+        self.assertEqual(TestModel.objects.create().revision, "1.2.0")
+        self.assertEqual(TestLookupModel.objects.create().revision, "1.2.0")
+        discover.assert_not_called()
+
+    @override_revision("1.3.0-2-gabcdef0", branch="main", commit="abcdef0", source=GIT)
+    def test_method(self, discover):
+        revision = Revision()
+        self.assertEqual(revision.revision, "1.3.0-2-gabcdef0")
+        self.assertEqual(
+            revision.as_dict(),
+            dict(
+                revision="1.3.0-2-gabcdef0",
+                tag="1.3.0-2-gabcdef0",
+                branch="main",
+                commit="abcdef0",
+                distance=2,
+                source=GIT,
+            ),
+        )
+        with override_revision("1.4.0"):
+            # resolved instances are reset
+            self.assertEqual(revision.revision, "1.4.0")
+            self.assertEqual(site_revision.revision, "1.4.0")
+        self.assertEqual(revision.revision, "1.3.0-2-gabcdef0")
+        discover.assert_not_called()
+
+    @override_settings(DJANGO_REVISION_COMPONENTS={"core": {"app_name": "core"}})
+    def test_components(self, discover):
+        self.assertEqual(site_components.resolve(), {"core": "1.2.0"})
+        discover.assert_not_called()
+
+
+@override_settings(
+    REVISION="9.9.9",
+    DJANGO_REVISION_IGNORE_WORKING_DIR=True,
+    DJANGO_REVISION_IGNORE_METADATA=True,
+    DJANGO_REVISION_IGNORE_TOML_FILE=True,
+    DJANGO_REVISION_IGNORE_VERSION_FILE=True,
+    DJANGO_REVISION_IGNORE_FROZEN_FILE=True,
+)
+class TestTestSource(TestCase):
+    def test_discovers_after_override(self):
+        revision = Revision()
+        with override_revision():
+            self.assertEqual(revision.revision, DEFAULT_TEST_REVISION)
+        self.assertEqual(revision.revision, "9.9.9")
+        self.assertEqual(revision.source, SETTINGS)
+
+    @override_settings(DJANGO_REVISION_SOURCES=["django_revision.testing.TestSource"])
+    def test_source(self):
+        self.assertEqual(site_revision.revision, DEFAULT_TEST_REVISION)
+        with override_settings(DJANGO_REVISION_TEST_REVISION="2.0.0"):
+            self.assertEqual(site_revision.revision, "2.0.0")
+            self.assertEqual(site_revision.source, TEST)
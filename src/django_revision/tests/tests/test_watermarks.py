@@ -0,0 +1,148 @@
+import time
+from unittest.mock import patch
+
+from django.core.signals import request_finished
+from django.db import DatabaseError
+from django.db.models.signals import pre_save
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from django_revision.models import RevisionLookup, RevisionWatermark
+from django_revision.testing import override_revision
+from django_revision.watermarks import revision_watermarks
+
+from ..models import TestLookupModel, TestModel
+
+
+def get_counts() -> dict[tuple[str, str], int]:
+    return {
+        (obj.revision, obj.model): obj.count for obj in RevisionWatermark.objects.all()
+    }
+
+
+@override_settings(DJANGO_REVISION_WATERMARKS=True)
+class TestWatermarks(TestCase):
+    def setUp(self):
+        RevisionLookup.objects.clear_cache()
+        revision_watermarks.clear()
+
+    def tearDown(self):
+        revision_watermarks.clear()
+
+    def test_saves_are_coalesced(self):
+        with override_revision("1.0.0"):
+            for _ in range(3):
+                # no extra query per save
+                with self.assertNumQueries(1):
+                    TestModel.objects.create()
+            TestLookupModel.objects.create()
+        self.assertEqual(RevisionWatermark.objects.count(), 0)
+        self.assertEqual(revision_watermarks.flush(), 2)
+        self.assertEqual(
+            get_counts(),
+            {
+                ("1.0.0", "django_revision.testmodel"): 3,
+                ("1.0.0", "django_revision.testlookupmodel"): 1,
+            },
+        )
+        first = RevisionWatermark.objects.get(model="django_revision.testmodel")
+        self.assertLessEqual(first.first_seen, first.last_seen)
+
+        with override_revision("1.0.0"):
+            TestModel.objects.create()
+        revision_watermarks.flush()
+        obj = RevisionWatermark.objects.get(model="django_revision.testmodel")
+        self.assertEqual(obj.count, 4)
+        self.assertEqual(obj.first_seen, first.first_seen)
+        self.assertGreaterEqual(obj.last_seen, first.last_seen)
+
+    def test_bulk(self):
+        with override_revision("1.0.0"):
+            TestModel.objects.bulk_create([TestModel() for _ in range(3)])
+        with override_revision("1.1.0"):
+            TestModel.objects.filter(pk__in=TestModel.objects.all()[:2]).update(
+                name="updated"
+            )
+            TestModel.objects.bulk_update(list(TestModel.objects.all()), ["name"])
+            # an explicit revision is not stamped
+            TestModel.objects.update(revision="other")
+        revision_watermarks.flush()
+        self.assertEqual(
+            get_counts(),
+            {
+                ("1.0.0", "django_revision.testmodel"): 3,
+                ("1.1.0", "django_revision.testmodel"): 5,
+            },
+        )
+
+    def test_each_save_is_counted(self):
+        with override_revision("1.0.0"):
+            obj = TestModel.objects.create()
+            obj.save()
+            obj.save()
+            lookup = TestLookupModel.objects.create()
+            lookup.save()
+        revision_watermarks.flush()
+        self.assertEqual(
+            get_counts(),
+            {
+                ("1.0.0", "django_revision.testmodel"): 3,
+                ("1.0.0", "django_revision.testlookupmodel"): 2,
+            },
+        )
+
+    def test_flushed_after_request(self):
+        with override_revision("1.0.0"):
+            TestModel.objects.create()
+            TestModel.objects.create()
+        # not due yet
+        self.assertEqual(get_counts(), {})
+        with (
+            patch(
+                "django_revision.watermarks.time.monotonic",
+                return_value=time.monotonic() + 86400,
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            request_finished.send(sender=self.__class__)
+        self.assertEqual(get_counts(), {("1.0.0", "django_revision.testmodel"): 2})
+
+    @override_settings(DJANGO_REVISION_WATERMARK_INTERVAL=0)
+    def test_flushed_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with override_revision("1.0.0"):
+                for _ in range(3):
+                    TestModel.objects.create()
+            self.assertEqual(get_counts(), {})
+        # once per transaction, not once per save
+        self.assertEqual(callbacks.count(revision_watermarks.flush), 1)
+        self.assertEqual(get_counts(), {("1.0.0", "django_revision.testmodel"): 3})
+
+    def test_clear_recorded_connected(self):
+        self.assertTrue(pre_save.has_listeners(TestModel))
+        self.assertFalse(pre_save.has_listeners(RevisionWatermark))
+        with override_settings(DJANGO_REVISION_WATERMARKS=False):
+            self.assertFalse(pre_save.has_listeners(TestModel))
+
+    def test_kept_if_write_fails(self):
+        with override_revision("1.0.0"):
+            TestModel.objects.create()
+        with (
+            patch(
+                "django_revision.watermarks.transaction.atomic",
+                side_effect=DatabaseError("locked"),
+            ),
+            self.assertWarns(UserWarning),
+        ):
+            self.assertEqual(revision_watermarks.flush(), 0)
+        with override_revision("1.0.0"):
+            TestModel.objects.create()
+        self.assertEqual(revision_watermarks.flush(), 1)
+        self.assertEqual(get_counts(), {("1.0.0", "django_revision.testmodel"): 2})
+
+    @override_settings(DJANGO_REVISION_WATERMARKS=False)
+    def test_disabled(self):
+        with override_revision("1.0.0"):
+            TestModel.objects.create()
+        self.assertEqual(revision_watermarks.flush(), 0)
+        self.assertEqual(RevisionWatermark.objects.count(), 0)
@@ -1,4 +1,23 @@
 from django.contrib import admin
+from django.http import HttpResponse
 from django.urls.conf import path
 
-urlpatterns = [path(r"admin/", admin.site.urls)]
+
+def cacheable_view(request):
+    return HttpResponse("cacheable")
+
+
+async def async_cacheable_view(request):
+    return HttpResponse("cacheable")
+
+
+def other_view(request):
+    return HttpResponse("other")
+
+
+urlpatterns = [
+    path(r"admin/", admin.site.urls),
+    path("cacheable/", cacheable_view, name="cacheable"),
+    path("async-cacheable/", async_cacheable_view, name="async_cacheable"),
+    path("other/", other_view, name="other"),
+]
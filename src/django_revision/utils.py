@@ -1,10 +1,44 @@
+import json
+import os
+import re
+import tempfile
 import tomllib
 import warnings
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 from django.conf import settings
 from django.core.management import color_style
+from django.db import router
+
+from .constants import COMMIT_ONLY, GITPYTHON, SHARED_ENV_VAR
+from .exceptions import RevisionError
+
+VERSION_RE = re.compile(
+    r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:\.(\d+)|[.-]?post(\d+))?"
+    r"(?:[.-]?(dev|alpha|a|beta|b|rc|c|preview|pre)\.?(\d*))?(?=$|[-+.a-z])"
+)
+# a commit sha has a letter, 20241018 is a version
+SHA_RE = re.compile(r"^(?=\d*[a-f])[0-9a-f]{7,40}$")
+DISTANCE_RE = re.compile(r"-(\d+)-g[0-9a-f]+$")
+
+# ordered before the final release
+PRE_RELEASES = {
+    "dev": 0,
+    "alpha": 1,
+    "a": 1,
+    "beta": 2,
+    "b": 2,
+    "rc": 3,
+    "c": 3,
+    "preview": 3,
+    "pre": 3,
+}
+FINAL_RELEASE = 4
+
+# the bits of the ordinal for the distance from the tag
+DISTANCE_MASK = 0x7FF
 
 style = color_style()
 
@@ -25,19 +59,221 @@ def ignore_version_file() -> bool:
     return getattr(settings, "DJANGO_REVISION_IGNORE_VERSION_FILE", False)
 
 
+def ignore_frozen() -> bool:
+    return getattr(settings, "DJANGO_REVISION_IGNORE_FROZEN_FILE", False)
+
+
+def get_git_backend() -> str:
+    return getattr(settings, "DJANGO_REVISION_GIT_BACKEND", GITPYTHON)
+
+
 def get_git_dir() -> Path | None:
     if path := getattr(settings, "GIT_DIR", settings.BASE_DIR):
         return Path(path)
     return None
 
 
+def get_components() -> dict[str, dict]:
+    """Returns {name: Revision kwargs} of the components of the
+    composite revision, see composite.py.
+    """
+    return getattr(settings, "DJANGO_REVISION_COMPONENTS", {})
+
+
+def get_frozen_file() -> Path:
+    if path := getattr(settings, "DJANGO_REVISION_FROZEN_FILE", None):
+        return Path(path)
+    return Path(settings.BASE_DIR) / ".django_revision.json"
+
+
+def get_cache_file() -> Path | None:
+    """Returns the path of the on-disk discovery cache, None if not
+    enabled.
+    """
+    if path := getattr(settings, "DJANGO_REVISION_CACHE_FILE", None):
+        return Path(path)
+    return None
+
+
+def get_source_names() -> list[str] | None:
+    """Returns the names or dotted paths of the sources in the order
+    tried, None for the default order, see sources.py.
+    """
+    return getattr(settings, "DJANGO_REVISION_SOURCES", None)
+
+
+def get_revision_env_var() -> str:
+    """Returns the environment variable read by the "environ" source."""
+    return getattr(settings, "DJANGO_REVISION_ENV_VAR", "APP_REVISION")
+
+
+def get_describe_timeout() -> float | None:
+    """Returns the seconds `git describe` may take, None for no limit."""
+    return getattr(settings, "DJANGO_REVISION_DESCRIBE_TIMEOUT", None)
+
+
+def get_describe_candidates() -> int:
+    """Returns the `--candidates` of `git describe`."""
+    return getattr(settings, "DJANGO_REVISION_DESCRIBE_CANDIDATES", 10)
+
+
+def get_describe_fallback() -> str:
+    """Returns COMMIT_ONLY to use the commit as the tag or NEXT_SOURCE
+    to try the next source if `git describe` times out.
+    """
+    return getattr(settings, "DJANGO_REVISION_DESCRIBE_FALLBACK", COMMIT_ONLY)
+
+
+def get_describe_cache_file() -> Path | None:
+    """Returns the path of the `git describe` results by HEAD commit,
+    None if not enabled.
+    """
+    if path := getattr(settings, "DJANGO_REVISION_DESCRIBE_CACHE_FILE", None):
+        return Path(path)
+    return None
+
+
+def get_settings_key() -> str:
+    """Returns a string of the settings that affect discovery."""
+    names = ["BASE_DIR", "GIT_DIR", "APP_NAME", "REVISION"] + [
+        name for name in dir(settings) if name.startswith("DJANGO_REVISION_")
+    ]
+    return repr(sorted((name, repr(getattr(settings, name, None))) for name in names))
+
+
+def read_cache_file(path: Path) -> dict:
+    """Returns the on-disk discovery cache, {} if missing or invalid."""
+    try:
+        with path.open("rb") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_refresh_interval() -> float:
+    """Returns seconds between checks for a changed revision, 0 to
+    never check.
+    """
+    return getattr(settings, "DJANGO_REVISION_REFRESH_INTERVAL", 0)
+
+
+def get_revision_header() -> str | None:
+    """Returns the response header set by RevisionMiddleware, None to
+    not set a header.
+    """
+    return getattr(settings, "DJANGO_REVISION_HEADER", "X-App-Revision")
+
+
+def get_etag_url_names() -> list[str]:
+    """Returns url names of views given a revision-based ETag by
+    RevisionMiddleware.
+    """
+    return getattr(settings, "DJANGO_REVISION_ETAG_URL_NAMES", [])
+
+
+def get_seen_revisions_cache() -> str:
+    """Returns the cache alias of the revisions seen per model, see
+    seen_revisions.py.
+    """
+    return getattr(settings, "DJANGO_REVISION_SEEN_CACHE", "default")
+
+
+def get_seen_revisions_timeout() -> int:
+    """Returns the seconds before the revisions seen per model are
+    counted again.
+    """
+    return getattr(settings, "DJANGO_REVISION_SEEN_TIMEOUT", 3600)
+
+
+def watermarks_enabled() -> bool:
+    return getattr(settings, "DJANGO_REVISION_WATERMARKS", False)
+
+
+def get_watermark_interval() -> float:
+    """Returns the seconds between writes of the revision watermarks."""
+    return getattr(settings, "DJANGO_REVISION_WATERMARK_INTERVAL", 60)
+
+
+def stats_enabled() -> bool:
+    return getattr(settings, "DJANGO_REVISION_STATS", False)
+
+
+def db_default_enabled() -> bool:
+    """Returns True if `migrate` sets the column default of revision
+    fields to the current revision, see db_default.py.
+    """
+    return getattr(settings, "DJANGO_REVISION_DB_DEFAULT", False)
+
+
+def get_fingerprint(paths: list[Path]) -> tuple:
+    """Returns (mtime, size, inode) for each path, None if missing."""
+    fingerprint = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            fingerprint.append(None)
+        else:
+            fingerprint.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    return tuple(fingerprint)
+
+
 def get_app_name() -> str | None:
     return getattr(settings, "APP_NAME", None)
 
 
-def get_revision_from_metadata(app_name: str = None) -> str:
+def get_revision_from_frozen_file(path: Path) -> dict | None:
+    """Returns the revision written by `manage.py freeze_revision`.
+
+    A single read, no stat; a missing file returns None. Raises
+    RevisionError if the file is not a revision written by the command.
+    """
+    try:
+        with path.open("rb") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise RevisionError(f"Invalid frozen revision file. Got {path}. {e}") from e
+    if not is_revision_data(data):
+        raise RevisionError(f"Invalid frozen revision file. Got {path}.")
+    return data
+
+
+def is_revision_data(data) -> bool:
+    """Returns True if `data` is a dict as returned by
+    `Revision.as_dict`.
+    """
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("revision"), str)
+        and bool(data["revision"])
+        and isinstance(data.get("source"), str)
+    )
+
+
+def get_revision_from_environ() -> dict | None:
+    """Returns the revision published by a parent process, see
+    `django_revision.sharing`.
+
+    Raises RevisionError if the value is not a revision published by
+    `sharing.publish`.
+    """
+    if not (value := os.environ.get(SHARED_ENV_VAR)):
+        return None
+    try:
+        data = json.loads(value)
+    except ValueError as e:
+        raise RevisionError(f"Invalid revision in environ {SHARED_ENV_VAR}. {e}") from e
+    if not is_revision_data(data):
+        raise RevisionError(f"Invalid revision in environ {SHARED_ENV_VAR}.")
+    return data
+
+
+def get_revision_from_metadata(app_name: str = None, ignore: bool = None) -> str:
     revision = None
-    if not ignore_metadata():
+    if not (ignore_metadata() if ignore is None else ignore):
         app_name = app_name or get_app_name()
         try:
             revision = version(app_name)
@@ -50,9 +286,9 @@ def get_revision_from_metadata(app_name: str = None) -> str:
     return revision
 
 
-def get_revision_from_toml_file(path: Path) -> str | None:
+def get_revision_from_toml_file(path: Path, ignore: bool = None) -> str | None:
     revision = None
-    if not ignore_toml_file():
+    if not (ignore_toml_file() if ignore is None else ignore):
         path = path / "pyproject.toml"
         if path.exists():
             with path.open("rb") as f:
@@ -64,9 +300,9 @@ def get_revision_from_toml_file(path: Path) -> str | None:
     return revision
 
 
-def get_revision_from_version_file(path: Path) -> str | None:
+def get_revision_from_version_file(path: Path, ignore: bool = None) -> str | None:
     revision = None
-    if not ignore_version_file():
+    if not (ignore_version_file() if ignore is None else ignore):
         path = path / "VERSION"
         if path.exists():
             with path.open("rb") as f:
@@ -78,3 +314,64 @@ def get_revision_from_settings() -> str:
     return getattr(settings, "REVISION", None) or getattr(
         settings, "DJANGO_REVISION_REVISION", None
     )
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Writes to a temp file in the same folder then renames it so
+    that concurrent readers never see a partial file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def allow_migrate(model, using: str) -> bool:
+    """Returns True if the router allows the table of `model` to be
+    migrated on database `using`, i.e. the table exists there.
+    """
+    return router.allow_migrate_model(using, model)
+
+
+@lru_cache(maxsize=64)
+def get_revision_ordinal(revision: str | None) -> int | None:
+    """Returns a sortable integer for a revision or tag, None if the
+    tag of the revision is not a version number, for example, a commit
+    sha used as the tag or a branch name.
+
+    Packs, from the high bits, major (15 bits), minor and patch (12 bits
+    each), a fourth component or `.postN` (6 bits), the pre-release
+    (7 bits) and the distance from the tag (11 bits), as in
+    `1.4.0-3-g1a2b3c4:main:1a2b3c4...`. A pre-release, for example,
+    `1.4.0rc1`, sorts before its final release. A version of eight
+    digits, for example, `20241018`, is read as the date 2024.10.18.
+    """
+    tag, _, rest = (revision or "").partition(":")
+    commit = rest.rpartition(":")[2]
+    if (
+        SHA_RE.match(tag)
+        # a sha without a letter, the tag of an untagged commit
+        or (len(tag) >= 7 and commit.startswith(tag))
+        or not (match := VERSION_RE.match(tag))
+    ):
+        return None
+    major, minor, patch, fourth, post, pre, number = match.groups()
+    if minor is None and len(major) == 8:
+        major, minor, patch = major[:4], major[4:6], major[6:]
+    if pre:
+        release = PRE_RELEASES[pre] << 4 | min(int(number or 0), 0xF)
+    else:
+        release = FINAL_RELEASE << 4
+    distance = int(match.group(1)) if (match := DISTANCE_RE.search(tag)) else 0
+    return (
+        (min(int(major), 0x7FFF) << 48)
+        | (min(int(minor or 0), 0xFFF) << 36)
+        | (min(int(patch or 0), 0xFFF) << 24)
+        | (min(int(fourth or post or 0), 0x3F) << 18)
+        | (release << 11)
+        | min(distance, DISTANCE_MASK)
+    )
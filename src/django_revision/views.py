@@ -1,11 +1,30 @@
 from typing import Any
 
-from .revision import Revision
+from django.http import HttpResponse
+
+from .revision import site_revision
+from .stats import revision_stats
 
 
 class RevisionMixin:
 
     def get_context_data(self, **kwargs) -> dict[str, Any]:
-        revision = Revision()
-        kwargs.update({"revision": revision.tag or revision.revision})
+        kwargs.update({"revision": site_revision.tag or site_revision.revision})
         return super().get_context_data(**kwargs)
+
+
+def revision_metrics_view(request) -> HttpResponse:
+    """Renders the revision stats in the Prometheus text format.
+
+    Add to your urls, for example:
+
+        path("metrics/revision/", revision_metrics_view)
+
+    Counters stay at zero unless settings.DJANGO_REVISION_STATS=True.
+    """
+    if revision_stats.enabled:
+        site_revision.revision  # noqa: B018
+    return HttpResponse(
+        revision_stats.as_prometheus(),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
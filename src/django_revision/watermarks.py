@@ -0,0 +1,203 @@
+"""Records, per revision and model, when rows were first and last
+written and roughly how many, in the RevisionWatermark table.
+
+Disabled by default. Enable with settings.DJANGO_REVISION_WATERMARKS=True.
+Saves and bulk updates are counted in memory and written at most every
+settings.DJANGO_REVISION_WATERMARK_INTERVAL seconds, by the first save
+or request to finish after the interval, and when the process exits.
+A save in a transaction leaves the write to the commit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+import warnings
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import request_finished, setting_changed
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest, Least
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .utils import get_watermark_interval, watermarks_enabled
+
+__all__ = ["RevisionWatermarks", "revision_watermarks"]
+
+# set on an instance once its save is counted, cleared by `pre_save`
+RECORDED = "_revision_watermark_recorded"
+
+
+class RevisionWatermarks:
+    """Pending watermarks, {(revision, model label): [first, last, count]}.
+
+    Callers check `enabled` before calling `record`.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._pending: dict[tuple[str, str], list] = {}
+        self._next_flush = None
+        self._flush_on_commit = None
+        self._lock = threading.Lock()
+
+    def record(self, label: str, revision: str, count: int = 1) -> None:
+        now = time.time()
+        key = (revision, label)
+        with self._lock:
+            if entry := self._pending.get(key):
+                entry[1] = now
+                entry[2] += count
+            else:
+                self._pending[key] = [now, now, count]
+        self.flush_if_due()
+
+    def record_instance(self, instance, revision: str) -> None:
+        """Records a save of `instance`.
+
+        The `pre_save` of each revision field may be called more than
+        once per save, so only the first call is counted. The mark is
+        cleared by the `pre_save` signal, sent once per `save()`.
+        """
+        if not instance.__dict__.get(RECORDED):
+            instance.__dict__[RECORDED] = True
+            self.record(instance._meta.label_lower, revision)
+
+    def flush_if_due(self) -> None:
+        """Flushes if the interval has passed, on commit if in a
+        transaction so the watermarks are not rolled back with it.
+        """
+        from .models import RevisionWatermark
+
+        if self._next_flush is None:
+            self._next_flush = time.monotonic() + get_watermark_interval()
+        elif time.monotonic() >= self._next_flush:
+            connection = connections[router.db_for_write(RevisionWatermark)]
+            if not connection.in_atomic_block:
+                self.flush()
+            elif self._flush_on_commit is not connection.run_on_commit:
+                # once per transaction, Django replaces the list of
+                # on_commit callbacks on commit and rollback
+                self._flush_on_commit = connection.run_on_commit
+                transaction.on_commit(self.flush, using=connection.alias)
+
+    def flush(self) -> int:
+        """Writes the pending watermarks in one transaction. Returns
+        the number of (revision, model) written.
+        """
+        from .models import RevisionWatermark
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._next_flush = time.monotonic() + get_watermark_interval()
+        if not pending:
+            return 0
+        using = router.db_for_write(RevisionWatermark)
+        manager = RevisionWatermark.objects.using(using)
+        try:
+            with transaction.atomic(using=using):
+                manager.bulk_create(
+                    [
+                        RevisionWatermark(
+                            revision=revision,
+                            model=label,
+                            first_seen=to_datetime(first),
+                            last_seen=to_datetime(last),
+                        )
+                        for (revision, label), (first, last, _) in pending.items()
+                    ],
+                    ignore_conflicts=True,
+                )
+                for (revision, label), (first, last, count) in pending.items():
+                    manager.filter(revision=revision, model=label).update(
+                        first_seen=Least(F("first_seen"), to_datetime(first)),
+                        last_seen=Greatest(F("last_seen"), to_datetime(last)),
+                        count=F("count") + count,
+                    )
+        except DatabaseError as e:
+            warnings.warn(f"Unable to write revision watermarks. Got {e}")
+            self.restore(pending)
+            return 0
+        return len(pending)
+
+    def restore(self, pending: dict[tuple[str, str], list]) -> None:
+        """Puts back watermarks that could not be written, merged with
+        those recorded since.
+        """
+        with self._lock:
+            for key, (first, last, count) in pending.items():
+                if entry := self._pending.get(key):
+                    entry[0] = min(entry[0], first)
+                    entry[1] = max(entry[1], last)
+                    entry[2] += count
+                else:
+                    self._pending[key] = [first, last, count]
+
+    def clear(self) -> None:
+        """Drops the pending watermarks, for example, in a forked child."""
+        with self._lock:
+            self._pending = {}
+            self._next_flush = None
+            self._flush_on_commit = None
+
+
+def to_datetime(timestamp: float) -> datetime:
+    value = datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+    return value if settings.USE_TZ else timezone.make_naive(value)
+
+
+revision_watermarks = RevisionWatermarks()
+
+
+def flush_at_exit() -> None:
+    if revision_watermarks.enabled:
+        revision_watermarks.flush()
+
+
+atexit.register(flush_at_exit)
+
+if hasattr(os, "register_at_fork"):
+    # the parent writes what it counted
+    os.register_at_fork(after_in_child=revision_watermarks.clear)
+
+
+def clear_recorded(*, instance, **kwargs) -> None:
+    instance.__dict__.pop(RECORDED, None)
+
+
+def configure_watermarks() -> None:
+    """Enables the watermarks per settings and, if enabled, connects
+    `clear_recorded` to `pre_save` of the models with a revision field.
+    """
+    from .revision_field import SeenRevisionsMixin
+
+    revision_watermarks.enabled = watermarks_enabled()
+    for model in apps.get_models():
+        if any(
+            isinstance(field, SeenRevisionsMixin)
+            for field in model._meta.concrete_fields
+        ):
+            if revision_watermarks.enabled:
+                pre_save.connect(clear_recorded, sender=model)
+            else:
+                pre_save.disconnect(clear_recorded, sender=model)
+
+
+@receiver(request_finished)
+def flush_after_request(**kwargs) -> None:
+    if revision_watermarks.enabled:
+        revision_watermarks.flush_if_due()
+
+
+@receiver(setting_changed)
+def update_watermarks_enabled(*, setting: str, **kwargs) -> None:
+    if setting == "DJANGO_REVISION_WATERMARKS":
+        configure_watermarks()